@@ -0,0 +1 @@
+"""Benchmark scripts (run as modules, e.g. python -m benchmarks.bench_profile_candidates)."""
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-query latency of Google CSE calls with and without connection reuse.
+
+- per_call: requests.get per query (new TCP + TLS handshake every time, the old behaviour)
+- session: GoogleCSE.search on the pooled keep-alive requests.Session
+- async: GoogleCSE.asearch on the pooled httpx.AsyncClient
+
+Queries run sequentially so the numbers isolate connection setup, not concurrency.
+
+Usage:
+    GOOGLE_CSE_API_KEY=... GOOGLE_CSE_CX_WEATHER=... python -m benchmarks.bench_cse_session --queries 10
+    python -m benchmarks.bench_cse_session --no-quota   # handshake cost only, no CSE quota spent
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+import requests
+
+from tools.google_cse import GoogleCSE
+
+QUERIES = [
+    "Tokyo March weather",
+    "Lisbon April climate",
+    "Kyoto autumn rainfall",
+    "Taipei typhoon season",
+    "Da Nang rainy season",
+    "Porto weather May",
+    "Seville heat summer",
+    "Fukuoka rainy season June",
+    "Chiang Mai burning season",
+    "Tallinn winter temperature",
+]
+
+# Public googleapis.com endpoint that needs no key (same host, same TLS setup)
+NO_QUOTA_URL = "https://www.googleapis.com/discovery/v1/apis"
+
+
+def summarize(mode: str, latencies: list) -> dict:
+    """First-call and steady-state latency of one mode."""
+    return {
+        "mode": mode,
+        "first_ms": latencies[0] * 1000,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "rest_p50_ms": statistics.median(latencies[1:] or latencies) * 1000,
+    }
+
+
+def bench_per_call(url: str, params_list: list) -> list:
+    latencies = []
+    for params in params_list:
+        start = time.perf_counter()
+        requests.get(url, params=params, timeout=10)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def bench_session(client: GoogleCSE, url: str, params_list: list, use_cse: bool) -> list:
+    latencies = []
+    for params in params_list:
+        start = time.perf_counter()
+        if use_cse:
+            client.search(params["q"], cx=params["cx"], num_results=params["num"])
+        else:
+            client._session.get(url, params=params, timeout=client.timeout)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def bench_async(client: GoogleCSE, url: str, params_list: list, use_cse: bool) -> list:
+    latencies = []
+    for params in params_list:
+        start = time.perf_counter()
+        if use_cse:
+            await client.asearch(params["q"], cx=params["cx"], num_results=params["num"])
+        else:
+            await client._get_async_client().get(url, params=params)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--queries", type=int, default=10)
+    arg_parser.add_argument("--no-quota", action="store_true", help="Hit a keyless googleapis.com endpoint instead of CSE")
+    args = arg_parser.parse_args()
+
+    # Keep the shared rate limiter out of the measurement
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+    use_cse = not args.no_quota
+    if use_cse:
+        client = GoogleCSE()
+        cx = client.cx_weather or client.cx_safety
+        if not cx:
+            arg_parser.error("GOOGLE_CSE_CX_WEATHER or GOOGLE_CSE_CX_SAFETY is required (or use --no-quota)")
+        url = client.base_url
+        params_list = [
+            client._build_params(QUERIES[i % len(QUERIES)], cx, 5, "active")
+            for i in range(args.queries)
+        ]
+    else:
+        client = GoogleCSE(api_key="unused")
+        url = NO_QUOTA_URL
+        params_list = [{"name": f"q{i}"} for i in range(args.queries)]
+
+    rows = [
+        summarize("per_call", bench_per_call(url, params_list)),
+        summarize("session", bench_session(client, url, params_list, use_cse)),
+        summarize("async", asyncio.run(bench_async(client, url, params_list, use_cse))),
+    ]
+
+    print(f"=== CSE connection reuse benchmark (queries={args.queries}, {'CSE' if use_cse else 'no quota'}) ===")
+    print(f"{'mode':<10}{'first (ms)':>12}{'p50 (ms)':>10}{'p50 2..n':>10}")
+    for row in rows:
+        print(f"{row['mode']:<10}{row['first_ms']:>12.1f}{row['p50_ms']:>10.1f}{row['rest_p50_ms']:>10.1f}")
+    saved = rows[0]["p50_ms"] - rows[1]["p50_ms"]
+    print(f"\nsaved per query (per_call p50 - session p50): {saved:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential profile → candidates (2 calls) vs fused single call.
+
+Usage:
+    OPENAI_API_KEY=... python -m benchmarks.bench_profile_candidates --runs 5
+"""
+import argparse
+import statistics
+import time
+
+from langchain_openai import ChatOpenAI
+from langchain_core.output_parsers import JsonOutputParser
+
+from benchmarks.usage import UsageCounter
+from chains.candidates_only import build_candidates_only_chain, run_candidates_only_chain
+
+DEFAULT_INPUT = "3월에 혼자 4일, 예산 150만원, 걷기/카페/조용한 휴식 선호, 해외"
+
+
+def bench_mode(llm: ChatOpenAI, fused: bool, user_input: str, runs: int) -> dict:
+    """Run candidates-only chain `runs` times and collect latency/token stats."""
+    parser = JsonOutputParser()
+    chain = build_candidates_only_chain(llm, parser, fuse_profile_candidates=fused)
+    
+    latencies = []
+    counter = UsageCounter()
+    for _ in range(runs):
+        start = time.perf_counter()
+        run_candidates_only_chain(chain.with_config(callbacks=[counter]), user_input)
+        latencies.append(time.perf_counter() - start)
+    
+    usage = counter.snapshot()
+    return {
+        "mode": "fused" if fused else "sequential",
+        "p50_s": statistics.median(latencies),
+        "mean_s": statistics.mean(latencies),
+        "calls_per_run": usage["calls"] / runs,
+        "prompt_tokens_per_run": usage["prompt_tokens"] / runs,
+        "completion_tokens_per_run": usage["completion_tokens"] / runs,
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--runs", type=int, default=3)
+    arg_parser.add_argument("--model", default="gpt-4o-mini")
+    arg_parser.add_argument("--temperature", type=float, default=0.4)
+    arg_parser.add_argument("--input", default=DEFAULT_INPUT)
+    args = arg_parser.parse_args()
+    
+    llm = ChatOpenAI(model=args.model, temperature=args.temperature)
+    rows = [bench_mode(llm, fused, args.input, args.runs) for fused in (False, True)]
+    
+    print(f"=== profile+candidates benchmark ({args.model}, runs={args.runs}) ===")
+    print(f"{'mode':<12}{'p50 (s)':>10}{'mean (s)':>10}{'calls':>8}{'prompt tok':>12}{'compl tok':>12}")
+    for row in rows:
+        print(
+            f"{row['mode']:<12}{row['p50_s']:>10.2f}{row['mean_s']:>10.2f}{row['calls_per_run']:>8.1f}"
+            f"{row['prompt_tokens_per_run']:>12.0f}{row['completion_tokens_per_run']:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
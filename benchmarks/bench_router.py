@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: rule router throughput (decisions per second).
+
+Routes a fixed mix of realistic inputs (full / clarify / candidates / itinerary,
+Korean and English) through route_user_input and extract_keywords in a tight
+loop on one thread. No LLM or network calls are involved. Also reports how
+many inputs the rule router leaves to the LLM router (confidence < 0.7) and
+the destinations it found in the gazetteer.
+
+Usage:
+    python -m benchmarks.bench_router
+    python -m benchmarks.bench_router --seconds 5
+"""
+import argparse
+import collections
+import time
+
+from router.gazetteer import find_destination
+from router.rules import extract_keywords, route_user_input
+
+# streamlit_app.route_input calls the LLM router below this confidence
+LLM_FALLBACK_THRESHOLD = 0.7
+
+INPUTS = [
+    "3월에 혼자 4일, 예산 150만원, 걷기/카페/조용한 휴식 선호, 해외",
+    "가족이랑 5박6일 여름휴가, 예산 300만원, 맛집이랑 관광 위주로",
+    "친구랑 2박3일 국내 여행 후보만 알려줘, 예산 50만원, 힐링",
+    "도쿄 3박4일 일정 짜줘, 혼자 가고 예산 100만원, 쇼핑이랑 카페",
+    "여행 가고 싶어",
+    "추천해줘",
+    "Solo trip for 5 days in May, budget 2000 USD, food and walking",
+    "Family trip to Osaka, 4 nights, budget 1500, itinerary please with shopping",
+    "options for a relaxing beach holiday with friends, 7 days",
+    "부산 1박2일 코스 추천, 연인이랑, 예산 30만원, 바다 보면서 휴식",
+]
+
+
+def bench(func, seconds: float) -> float:
+    """Calls per second of func over INPUTS for about `seconds`."""
+    calls = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for text in INPUTS:
+            func(text)
+        calls += len(INPUTS)
+    return calls / (time.perf_counter() - start)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--seconds", type=float, default=2.0, help="Measurement time per function")
+    args = arg_parser.parse_args()
+
+    # Warm-up (and the route mix of the inputs)
+    decisions = [route_user_input(text) for text in INPUTS]
+    routes = collections.Counter(decision.route for decision in decisions)
+    fallbacks = sum(decision.confidence < LLM_FALLBACK_THRESHOLD for decision in decisions)
+    destinations = sorted({decision.destination for decision in decisions if decision.destination})
+
+    rows = [
+        ("find_destination", bench(find_destination, args.seconds)),
+        ("extract_keywords", bench(extract_keywords, args.seconds)),
+        ("route_user_input", bench(route_user_input, args.seconds)),
+    ]
+
+    print(f"=== Rule router throughput ({len(INPUTS)} inputs, routes: {dict(routes)}) ===")
+    print(f"{'function':<20}{'decisions/s':>14}{'µs/call':>10}")
+    for name, rate in rows:
+        print(f"{name:<20}{rate:>14,.0f}{1e6 / rate:>10.1f}")
+    print(f"\nLLM router fallbacks: {fallbacks}/{len(INPUTS)} | destinations: {' / '.join(destinations)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: evidence search latency of the local BM25 index vs. the Google CSE provider.
+
+Both providers run the validators' real query sets (3 weather + 3 safety
+queries per destination through search_many). The local index is the one at
+LOCAL_INDEX_PATH, or a synthetic corpus built into a temporary directory.
+The CSE provider is measured only when GOOGLE_CSE_API_KEY / GOOGLE_CSE_CX_WEATHER
+are set (it spends 6 queries per destination; the search cache is disabled).
+
+Usage:
+    python -m benchmarks.bench_search_provider --synthetic 20000
+    LOCAL_INDEX_PATH=.cache/local_index python -m benchmarks.bench_search_provider
+    GOOGLE_CSE_API_KEY=... GOOGLE_CSE_CX_WEATHER=... python -m benchmarks.bench_search_provider --synthetic 20000 --destinations 3
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from chains.validators.safety_risk_web import build_search_queries as build_safety_queries
+from chains.validators.seasonality_weather_web import build_search_queries as build_weather_queries
+from tools.local_index import LocalSearchIndex, build_index
+
+DESTINATIONS = [
+    "Tokyo", "Osaka", "Kyoto", "Fukuoka", "Sapporo", "Taipei", "Da Nang", "Bangkok",
+    "Chiang Mai", "Bali", "Lisbon", "Porto", "Seville", "Barcelona", "Tallinn", "Prague",
+]
+SEASONS = ["March", "spring", "summer", "autumn", "winter", "rainy season"]
+FILLER = (
+    "temperature rainfall humidity typhoon monsoon crowd festival museum market "
+    "district hostel ferry railway airport beach temple crime scam pickpocket "
+    "advisory emergency hospital police night street neighbourhood visa currency"
+).split()
+
+
+def write_synthetic_corpus(path: str, passages: int, seed: int = 0) -> None:
+    """Write a weather + safety corpus of roughly `passages` 80-word passages."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(passages):
+            destination = DESTINATIONS[i % len(DESTINATIONS)]
+            collection = "weather" if i % 2 == 0 else "safety"
+            section = rng.choice(SEASONS) if collection == "weather" else "Stay safe"
+            words = [rng.choice(FILLER) for _ in range(75)] + [destination, section, collection]
+            f.write(json.dumps({
+                "title": destination,
+                "section": section,
+                "url": f"https://example.org/{destination.replace(' ', '_')}/{i}",
+                "text": " ".join(words),
+                "collection": collection,
+            }) + "\n")
+
+
+def destination_queries(destination: str) -> tuple:
+    """(weather queries, safety queries) the web validators send for one destination."""
+    profile = {"constraints": {"season": "March"}}
+    candidate = {"name": destination}
+    return build_weather_queries(profile, candidate, "March"), build_safety_queries(profile, candidate)
+
+
+def bench_provider(provider, destinations: list, repeat: int) -> list:
+    """Per-destination latency of the weather + safety search_many calls."""
+    latencies = []
+    for _ in range(repeat):
+        for destination in destinations:
+            weather_queries, safety_queries = destination_queries(destination)
+            start = time.perf_counter()
+            provider.search_many(weather_queries, cx=provider.cx_weather, num_results=3, max_results=5)
+            provider.search_many(
+                safety_queries, cx=provider.cx_safety or provider.cx_weather, num_results=3, max_results=5
+            )
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def summarize(name: str, latencies: list) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "provider": name,
+        "p50_us": statistics.median(ordered) * 1e6,
+        "p99_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e6,
+        "mean_us": statistics.fmean(ordered) * 1e6,
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--synthetic", type=int, default=0, help="Build a synthetic index with N passages")
+    arg_parser.add_argument("--destinations", type=int, default=len(DESTINATIONS))
+    arg_parser.add_argument("--repeat", type=int, default=50, help="Local index passes over the destinations")
+    args = arg_parser.parse_args()
+
+    destinations = DESTINATIONS[:args.destinations]
+    rows = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.synthetic:
+            corpus_path = os.path.join(tmp_dir, "corpus.jsonl")
+            write_synthetic_corpus(corpus_path, args.synthetic)
+            index_path = os.path.join(tmp_dir, "index")
+            start = time.perf_counter()
+            meta = build_index([corpus_path], index_path)
+            print(f"built synthetic index: {meta['documents']} passages, {meta['postings']} postings "
+                  f"in {time.perf_counter() - start:.1f}s")
+        else:
+            index_path = os.getenv("LOCAL_INDEX_PATH", ".cache/local_index")
+
+        local = LocalSearchIndex(index_path)
+        bench_provider(local, destinations, 1)  # warm the page cache
+        rows.append(summarize("local_index", bench_provider(local, destinations, args.repeat)))
+
+    if os.getenv("GOOGLE_CSE_API_KEY") and os.getenv("GOOGLE_CSE_CX_WEATHER"):
+        # Measure the network path, not the shared cache / rate limiter
+        os.environ["RATE_LIMIT_ENABLED"] = "false"
+        from tools.google_cse import GoogleCSE
+        rows.append(summarize("google_cse", bench_provider(GoogleCSE(), destinations, 1)))
+    else:
+        print("GOOGLE_CSE_API_KEY / GOOGLE_CSE_CX_WEATHER not set - skipping the HTTP provider")
+
+    print(f"\n=== Search provider benchmark (6 queries per destination, {len(destinations)} destinations) ===")
+    print(f"{'provider':<14}{'p50 (µs)':>12}{'p99 (µs)':>12}{'mean (µs)':>12}")
+    for row in rows:
+        print(f"{row['provider']:<14}{row['p50_us']:>12.0f}{row['p99_us']:>12.0f}{row['mean_us']:>12.0f}")
+    if len(rows) == 2:
+        print(f"\nspeed-up (p50): {rows[1]['p50_us'] / rows[0]['p50_us']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: validator batching modes across candidate counts.
+
+- none: one call per (candidate, validator) pair
+- multi_axis: one call per candidate for all non-web axes
+- per_axis: one call per axis covering all candidates
+
+Usage:
+    OPENAI_API_KEY=... python -m benchmarks.bench_validator_batching --counts 3 5 10
+"""
+import argparse
+import statistics
+import time
+
+from langchain_openai import ChatOpenAI
+from langchain_core.output_parsers import JsonOutputParser
+
+from benchmarks.usage import UsageCounter
+from chains.parallel_validators import BATCH_MODES, run_parallel_validators
+
+PROFILE = {
+    "traveler_type": "혼자 여행",
+    "duration_days": 4,
+    "budget": "150만원",
+    "constraints": {"season": "3월", "region": "해외"},
+    "preferences": ["걷기", "카페", "조용한 휴식"],
+}
+
+CANDIDATES = [
+    {"name": "Lisbon, Portugal", "why": "걷기 좋은 골목과 카페"},
+    {"name": "Kyoto, Japan", "why": "조용한 사찰과 산책로"},
+    {"name": "Taipei, Taiwan", "why": "카페 문화와 저렴한 물가"},
+    {"name": "Porto, Portugal", "why": "강변 산책과 여유로운 분위기"},
+    {"name": "Da Nang, Vietnam", "why": "해변 휴식과 합리적인 예산"},
+    {"name": "Ljubljana, Slovenia", "why": "작고 조용한 보행자 도시"},
+    {"name": "Chiang Mai, Thailand", "why": "카페와 느린 여행"},
+    {"name": "Seville, Spain", "why": "3월의 온화한 날씨"},
+    {"name": "Fukuoka, Japan", "why": "짧은 비행과 쉬운 교통"},
+    {"name": "Tallinn, Estonia", "why": "구시가지 산책"},
+]
+
+
+def bench_mode(
+    model: str,
+    temperature: float,
+    batch_mode: str,
+    num_candidates: int,
+    runs: int,
+    use_web_grounded: bool
+) -> dict:
+    """Run validators for `num_candidates` candidates `runs` times and collect stats."""
+    counter = UsageCounter()
+    llm = ChatOpenAI(model=model, temperature=temperature, callbacks=[counter])
+    parser = JsonOutputParser()
+    candidates = CANDIDATES[:num_candidates]
+    
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run_parallel_validators(
+            llm, parser, PROFILE, candidates,
+            use_web_grounded=use_web_grounded,
+            batch_mode=batch_mode
+        )
+        latencies.append(time.perf_counter() - start)
+    
+    usage = counter.snapshot()
+    return {
+        "candidates": num_candidates,
+        "mode": batch_mode,
+        "p50_s": statistics.median(latencies),
+        "calls_per_run": usage["calls"] / runs,
+        "prompt_tokens_per_run": usage["prompt_tokens"] / runs,
+        "completion_tokens_per_run": usage["completion_tokens"] / runs,
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--runs", type=int, default=1)
+    arg_parser.add_argument("--model", default="gpt-4o-mini")
+    arg_parser.add_argument("--temperature", type=float, default=0.4)
+    arg_parser.add_argument("--counts", type=int, nargs="+", default=[3, 5, 7, 10])
+    arg_parser.add_argument("--modes", nargs="+", choices=BATCH_MODES, default=list(BATCH_MODES))
+    arg_parser.add_argument("--web", action="store_true", help="Use web-grounded validators (spends CSE quota)")
+    args = arg_parser.parse_args()
+    
+    for num_candidates in args.counts:
+        if not 1 <= num_candidates <= len(CANDIDATES):
+            arg_parser.error(f"--counts must be between 1 and {len(CANDIDATES)}")
+    
+    print(f"=== validator batching benchmark ({args.model}, runs={args.runs}, web={args.web}) ===")
+    print(f"{'cands':<7}{'mode':<12}{'p50 (s)':>10}{'calls':>8}{'prompt tok':>12}{'compl tok':>12}")
+    for num_candidates in args.counts:
+        for batch_mode in args.modes:
+            row = bench_mode(args.model, args.temperature, batch_mode, num_candidates, args.runs, args.web)
+            print(
+                f"{row['candidates']:<7}{row['mode']:<12}{row['p50_s']:>10.2f}{row['calls_per_run']:>8.1f}"
+                f"{row['prompt_tokens_per_run']:>12.0f}{row['completion_tokens_per_run']:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,15 @@
 """Aggregator for validator results."""
 import json
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
+
+import numpy as np
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
+from chains.validators.axes import is_failed_run
+
 try:
     from langsmith import traceable
 except ImportError:
@@ -19,6 +24,263 @@ def safe_json(obj) -> str:
     return json.dumps(obj, ensure_ascii=False, indent=2)
 
 
+DISCLAIMER = "실시간 데이터가 아님을 명시"
+
+# Axis order of the score matrix columns (same order as get_validators)
+AXES = ["budget_fit", "vibe_fit", "transit_complexity", "safety_risk", "seasonality_weather"]
+
+
+@dataclass
+class AggregatorConfig:
+    """
+    Scoring configuration for the local aggregator.
+    
+    - axis_weights: relative weight per axis (missing axes weigh 1.0)
+    - verdict_penalties: subtracted from an axis score before weighting
+      (unknown verdicts are not penalized; missing axes and failed validator
+      runs are left out of the average)
+    """
+    axis_weights: Dict[str, float] = field(default_factory=lambda: {axis: 1.0 for axis in AXES})
+    verdict_penalties: Dict[str, float] = field(default_factory=lambda: {
+        "pass": 0.0,
+        "warn": 0.05,
+        "fail": 0.15,
+        "unknown": 0.0,
+        # Pruned axes (cascade) stay in the average with score 0.0
+        "pruned": 0.0,
+    })
+    max_items: int = 3
+
+
+def build_score_matrix(
+    candidate_ids: List[str],
+    validators_results: List[Dict],
+    config: AggregatorConfig
+):
+    """
+    Build candidates × axes score and penalty matrices.
+    
+    Returns:
+        (axes, scores, penalties, present) - scores/penalties are float arrays,
+        present is a bool mask of cells that have an evaluation (errored runs
+        and axes missing from a batched response carry no score and are not present)
+    """
+    axes = list(AXES)
+    for result in validators_results:
+        axis = result.get("validator")
+        if axis and axis not in axes:
+            axes.append(axis)
+    
+    row = {candidate_id: i for i, candidate_id in enumerate(candidate_ids)}
+    column = {axis: j for j, axis in enumerate(axes)}
+    scores = np.zeros((len(candidate_ids), len(axes)))
+    penalties = np.zeros_like(scores)
+    present = np.zeros(scores.shape, dtype=bool)
+    
+    for result in validators_results:
+        i = row.get(result.get("candidate_id"))
+        j = column.get(result.get("validator"))
+        if i is None or j is None or is_failed_run(result):
+            continue
+        try:
+            score = float(result.get("score", 0.0))
+        except (TypeError, ValueError):
+            score = 0.0
+        scores[i, j] = min(max(score, 0.0), 1.0)
+        penalties[i, j] = config.verdict_penalties.get(result.get("verdict", "fail"), 0.0)
+        present[i, j] = True
+    
+    return axes, scores, penalties, present
+
+
+def rank_candidates(
+    axes: List[str],
+    scores: np.ndarray,
+    penalties: np.ndarray,
+    present: np.ndarray,
+    config: AggregatorConfig
+):
+    """
+    Compute total scores and the ranking order.
+    
+    total_score = weighted mean over present axes of (score - verdict penalty),
+    clipped to 0.0-1.0 and rounded to 4 decimals. Ties keep candidate order
+    (stable sort), so the ranking is reproducible.
+    
+    Returns:
+        (total_scores, order) - order lists row indices from best to worst
+    """
+    weights = np.array([config.axis_weights.get(axis, 1.0) for axis in axes])
+    cell_weights = present * weights
+    weight_sums = cell_weights.sum(axis=1)
+    weighted = ((scores - penalties) * cell_weights).sum(axis=1)
+    total_scores = np.divide(weighted, weight_sums, out=np.zeros_like(weighted), where=weight_sums > 0)
+    total_scores = np.round(np.clip(total_scores, 0.0, 1.0), 4)
+    order = np.argsort(-total_scores, kind="stable")
+    return total_scores, order
+
+
+def build_evidence_summary(validators_results: List[Dict], max_sources: int = 5) -> List[Dict]:
+    """Group unique citation URLs by axis."""
+    sources_by_axis: Dict[str, List[str]] = {}
+    for validator_result in validators_results:
+        for cite in validator_result.get("citations") or []:
+            url = cite.get("url") if isinstance(cite, dict) else None
+            if not url:
+                continue
+            sources = sources_by_axis.setdefault(validator_result.get("validator", ""), [])
+            if url not in sources and len(sources) < max_sources:
+                sources.append(url)
+    return [{"axis": axis, "sources": sources} for axis, sources in sources_by_axis.items()]
+
+
+def _unique(items: List[str], limit: int) -> List[str]:
+    """Deduplicate while keeping order."""
+    seen = []
+    for item in items:
+        if item and item not in seen:
+            seen.append(item)
+        if len(seen) >= limit:
+            break
+    return seen
+
+
+def run_local_aggregator(
+    profile: Dict,
+    candidates: List[Dict],
+    validators_results: List[Dict],
+    config: Optional[AggregatorConfig] = None,
+    prose_chain=None
+) -> Dict:
+    """
+    Aggregate validator results locally (no LLM call for scoring/ranking).
+    
+    Produces the same output shape as run_aggregator. summary / why are filled
+    from validator reasons; if prose_chain is given, one LLM call rewrites them
+    (ranking and scores are never changed by the LLM).
+    
+    Returns aggregated result with graceful error handling.
+    """
+    config = config or AggregatorConfig()
+    candidate_ids = [f"C{i+1}" for i in range(len(candidates))]
+    
+    axes, scores, penalties, present = build_score_matrix(candidate_ids, validators_results, config)
+    total_scores, order = rank_candidates(axes, scores, penalties, present, config)
+    
+    results_by_candidate: Dict[str, List[Dict]] = {candidate_id: [] for candidate_id in candidate_ids}
+    for result in validators_results:
+        if result.get("candidate_id") in results_by_candidate:
+            results_by_candidate[result["candidate_id"]].append(result)
+    
+    ranked_candidates = []
+    for rank, i in enumerate(order, 1):
+        candidate_id = candidate_ids[i]
+        results = [r for r in results_by_candidate[candidate_id] if not is_failed_run(r)]
+        strengths = _unique(
+            [f"{r.get('validator', '')}: {(r.get('reasons') or [''])[0]}" for r in results if r.get("verdict") == "pass"],
+            config.max_items
+        )
+        risks = _unique(
+            [f"{r.get('validator', '')}: {(r.get('reasons') or [''])[0]}" for r in results if r.get("verdict") in ("warn", "fail")],
+            config.max_items
+        )
+        watchouts = _unique(
+            [question for r in results for question in r.get("questions_to_user") or []],
+            config.max_items
+        )
+        best_axes = [axes[j] for j in np.argsort(-scores[i], kind="stable") if present[i, j]][:2]
+        ranked_candidates.append({
+            "candidate_id": candidate_id,
+            "name": candidates[i].get("name", f"Candidate {i+1}"),
+            "total_score": float(total_scores[i]),
+            "summary": f"{rank}위 (종합 점수 {total_scores[i]:.2f}) - 강점 축: {', '.join(best_axes) or '없음'}",
+            "strengths": strengths,
+            "risks": risks,
+            "watchouts": watchouts,
+        })
+    
+    final_choice = {}
+    if ranked_candidates:
+        top = ranked_candidates[0]
+        final_choice = {
+            "candidate_id": top["candidate_id"],
+            "name": top["name"],
+            "why": top["strengths"] or [top["summary"]],
+            "what_to_confirm": top["watchouts"],
+        }
+    
+    aggregation = {
+        "ranked_candidates": ranked_candidates,
+        "final_choice": final_choice,
+        "evidence_summary": build_evidence_summary(validators_results),
+        "disclaimer": DISCLAIMER,
+        "_aggregation_method": "local",
+    }
+    
+    if prose_chain is not None and ranked_candidates:
+        aggregation = run_aggregator_prose(prose_chain, profile, aggregation)
+    
+    return aggregation
+
+
+def build_aggregator_prose_chain(llm: ChatOpenAI, parser: JsonOutputParser):
+    """Build chain that writes summary / why text for an already computed ranking."""
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", "You are a travel recommendation writer. The ranking is already decided; write short explanations only. Return ONLY valid JSON. No markdown."),
+        ("user", """
+Traveler profile:
+{profile}
+
+Ranked candidates (scores and order are final, do NOT change them):
+{ranked_candidates}
+
+Task:
+- For each candidate, write summary: why it ranks at this position (1-2 sentences, Korean)
+- For the top candidate, write why: top 2-3 reasons it is the best choice (Korean)
+
+Return JSON schema exactly:
+{{
+  "summaries": [
+    {{
+      "candidate_id": "",
+      "summary": ""
+    }}
+  ],
+  "why": ["..."]
+}}
+""")
+    ])
+    
+    return prompt | llm | parser
+
+
+def run_aggregator_prose(chain, profile: Dict, aggregation: Dict) -> Dict:
+    """
+    Fill summary / why of a local aggregation with LLM prose.
+    
+    Keeps the local text when the call fails or omits a candidate.
+    """
+    try:
+        result = chain.invoke({
+            "profile": safe_json(profile),
+            "ranked_candidates": safe_json(aggregation["ranked_candidates"])
+        })
+        summaries = {
+            item.get("candidate_id"): item.get("summary")
+            for item in result.get("summaries", [])
+            if isinstance(item, dict)
+        }
+        for candidate in aggregation["ranked_candidates"]:
+            if summaries.get(candidate["candidate_id"]):
+                candidate["summary"] = summaries[candidate["candidate_id"]]
+        if result.get("why") and aggregation.get("final_choice"):
+            aggregation["final_choice"]["why"] = result["why"]
+    except Exception:
+        # Graceful degradation - keep the locally generated text
+        pass
+    return aggregation
+
+
 def build_aggregator_chain(llm: ChatOpenAI, parser: JsonOutputParser):
     """Build aggregator chain."""
     prompt = ChatPromptTemplate.from_messages([
@@ -127,7 +389,7 @@ def run_aggregator(
                         })
             result["evidence_summary"] = evidence_summary
         if "disclaimer" not in result:
-            result["disclaimer"] = "실시간 데이터가 아님을 명시"
+            result["disclaimer"] = DISCLAIMER
             
         return result
     except Exception as e:
@@ -153,5 +415,5 @@ def run_aggregator(
                 "why": ["집계 실패로 인한 기본 선택"],
                 "what_to_confirm": []
             },
-            "disclaimer": "실시간 데이터가 아님을 명시"
+            "disclaimer": DISCLAIMER
         }
\ No newline at end of file
@@ -1,42 +1,33 @@
 """Candidates-only chain that runs only profile and candidates steps."""
 import json
+from typing import Dict, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.runnables import RunnableLambda
 
+from chains.profile import build_profile_chain, chain_inputs
+from chains.profile_candidates import build_profile_candidates_chain, run_profile_candidates_chain
+
 
 def safe_json(obj) -> str:
     """Convert object to JSON string."""
     return json.dumps(obj, ensure_ascii=False, indent=2)
 
 
-def build_candidates_only_chain(llm: ChatOpenAI, parser: JsonOutputParser):
-    """Build candidates-only chain (profile + candidates only)."""
-    profile_prompt = ChatPromptTemplate.from_messages([
-        ("system", "You are a travel analyst. Return ONLY valid JSON. No markdown."),
-        ("user", """
-User travel request:
-{user_input}
-
-Return JSON schema exactly:
-{{
-  "tags": ["..."],
-  "top_priorities": ["..."],
-  "constraints": {{
-    "season": "",
-    "budget": "",
-    "companions": "",
-    "pace": "slow|medium|fast",
-    "duration_days": 0,
-    "domestic_or_international": "domestic|international|either"
-  }},
-  "avoid": ["..."],
-  "notes_for_recommender": ""
-}}
-""")
-    ])
-
+def build_candidates_only_chain(
+    llm: ChatOpenAI,
+    parser: JsonOutputParser,
+    fuse_profile_candidates: bool = False
+):
+    """
+    Build candidates-only chain (profile + candidates only).
+    
+    Args:
+        llm: LLM instance
+        parser: JSON parser
+        fuse_profile_candidates: If True, profile and candidates come from a single LLM call
+    """
     candidates_prompt = ChatPromptTemplate.from_messages([
         ("system", "You are a travel curator. Return ONLY valid JSON. No markdown."),
         ("user", """
@@ -59,14 +50,17 @@ Return JSON schema:
 """)
     ])
 
-    profile_chain = profile_prompt | llm | parser
+    profile_chain = build_profile_chain(llm, parser)
     candidates_chain = candidates_prompt | llm | parser
 
     def step1_profile(inputs):
-        """STEP 1: 여행자 프로필 분석"""
+        """STEP 1: 여행자 프로필 분석 (라우팅 중 미리 추출한 profile이 있으면 재사용)"""
+        profile = inputs.get("profile")
+        if profile is None:
+            profile = profile_chain.invoke({"user_input": inputs["user_input"]})
         return {
             "user_input": inputs["user_input"],
-            "profile": profile_chain.invoke({"user_input": inputs["user_input"]})
+            "profile": profile
         }
     
     def step2_candidates(inputs):
@@ -78,17 +72,35 @@ Return JSON schema:
             })
         }
     
+    def step1_2_fused(inputs):
+        """STEP 1+2: 여행자 프로필 분석 + 후보 도시 생성 (단일 호출)"""
+        if inputs.get("profile") is not None:
+            # Profile already extracted: only STEP 2 is left
+            return step2_candidates(step1_profile(inputs))
+        fused = run_profile_candidates_chain(profile_candidates_chain, inputs["user_input"])
+        return {
+            "user_input": inputs["user_input"],
+            "profile": fused["profile"],
+            # Same shape as STEP 2 output: {"candidates": [...]}
+            "candidates": {"candidates": fused["candidates"]}
+        }
+    
+    if fuse_profile_candidates:
+        profile_candidates_chain = build_profile_candidates_chain(llm, parser)
+        return RunnableLambda(step1_2_fused)
+    
     return (
         RunnableLambda(step1_profile)
         | RunnableLambda(step2_candidates)
     )
 
 
-def run_candidates_only_chain(chain, user_input: str):
+def run_candidates_only_chain(chain, user_input: str, profile: Optional[Dict] = None):
     """
     Execute candidates-only chain and return profile and candidates.
+    A profile extracted in advance replaces STEP 1.
     """
-    result = chain.invoke({"user_input": user_input})
+    result = chain.invoke(chain_inputs(user_input, profile))
     
     return {
         "profile": result["profile"],
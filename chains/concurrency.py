@@ -0,0 +1,298 @@
+"""Adaptive concurrency limiter for the validator fan-out."""
+import asyncio
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Substrings of error messages that indicate rate limiting (OpenAI 429, CSE quota)
+RATE_LIMIT_MARKERS = ("429", "rate limit", "rate_limit", "ratelimit", "too many requests", "quota")
+
+# "Please try again in 1.5s" / "try again in 200ms" / "Retry-After: 3"
+RETRY_AFTER_PATTERN = re.compile(
+    r"(?:try again in|retry[- ]after:?)\s*([\d.]+)\s*(ms|s|sec|seconds)?",
+    re.IGNORECASE
+)
+
+
+def parse_retry_after(message: str) -> Optional[float]:
+    """Extract a retry delay in seconds from an error message (None if absent)."""
+    match = RETRY_AFTER_PATTERN.search(message)
+    if not match:
+        return None
+    try:
+        delay = float(match.group(1))
+    except ValueError:
+        return None
+    return delay / 1000 if (match.group(2) or "").lower() == "ms" else delay
+
+
+def classify_result(result: Union[Dict, List[Dict], BaseException]) -> Tuple[str, Optional[float]]:
+    """
+    Classify a validator result (or an exception) as a congestion signal.
+
+    Validators swallow exceptions into fail results, so the error text in
+    reasons is the only place where 429 / Retry-After information survives.
+
+    Returns:
+        (outcome, retry_after) - outcome is "ok", "error" or "rate_limited"
+    """
+    if isinstance(result, BaseException):
+        messages = [str(result)]
+    else:
+        results = result if isinstance(result, list) else [result]
+        messages = []
+        for item in results:
+            reasons = item.get("reasons") or [""]
+            if item.get("_error") or str(reasons[0]).startswith(("검증 실패:", "예외 발생:")):
+                messages.append(str(reasons[0]))
+        if not messages:
+            return "ok", None
+
+    for message in messages:
+        lowered = message.lower()
+        if any(marker in lowered for marker in RATE_LIMIT_MARKERS):
+            return "rate_limited", parse_retry_after(message)
+    return "error", None
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter (drop-in replacement for asyncio.Semaphore).
+
+    - Additive increase: +increase per `limit` successful calls (about +1 per round trip)
+    - Multiplicative decrease on 429s, on error rates above error_rate_threshold,
+      and (gently) when short-term latency exceeds latency_tolerance × the long-term
+      latency (gradient signal; comparing averages keeps mixed workloads such as
+      web-grounded vs. LLM-only validators from looking like congestion)
+    - Retry-After hints pause new acquisitions until the given delay has passed
+
+    State is shared across event loops (the sync wrappers may run a new loop per
+    call), so learned limits carry over between runs.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        increase: float = 1.0,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_backoff: float = 0.9,
+        error_rate_threshold: float = 0.2,
+        window: int = 20,
+        decrease_cooldown_s: float = 1.0
+    ):
+        """
+        Initialize limiter.
+
+        Args:
+            initial_limit: Starting concurrency limit
+            min_limit / max_limit: Bounds of the limit
+            increase: Additive increase per round trip
+            backoff: Multiplier applied on rate limiting / high error rate
+            latency_tolerance: Short-term / long-term latency ratio treated as congestion
+            latency_backoff: Multiplier applied on latency congestion
+            error_rate_threshold: Error rate over the window that triggers a decrease
+            window: Number of recent outcomes used for the error rate
+            decrease_cooldown_s: Minimum time between two decreases (one burst = one decrease)
+        """
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit, min_limit)
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.latency_backoff = latency_backoff
+        self.error_rate_threshold = error_rate_threshold
+        self.decrease_cooldown_s = decrease_cooldown_s
+
+        self._lock = threading.Lock()
+        self._limit = float(min(max(initial_limit, min_limit), self.max_limit))
+        self._in_flight = 0
+        self._waiters: deque = deque()
+        self._resume_at = 0.0
+        self._last_decrease = 0.0
+        self._latency_short: Optional[float] = None
+        self._latency_long: Optional[float] = None
+        self._latency_samples = 0
+        self._outcomes: deque = deque(maxlen=window)
+        self._counters = {"ok": 0, "error": 0, "rate_limited": 0}
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    # Acquire / release
+
+    async def acquire(self) -> None:
+        """Wait for a slot (FIFO), then honour any Retry-After pause."""
+        with self._lock:
+            if not self._waiters and self._in_flight < int(self._limit):
+                self._in_flight += 1
+                waiter = None
+            else:
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+
+        if waiter is not None:
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    granted = waiter.done() and not waiter.cancelled()
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                if granted:
+                    self.release()
+                raise
+
+        pause = self._resume_at - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+    def release(self) -> None:
+        """Free a slot and hand it to the next waiter."""
+        with self._lock:
+            self._in_flight -= 1
+            self._wake()
+
+    def _wake(self) -> None:
+        """Grant slots to waiters while under the limit (caller holds the lock)."""
+        while self._waiters and self._in_flight < int(self._limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.get_loop().call_soon_threadsafe(self._grant, waiter)
+
+    def _grant(self, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            # Cancelled after the slot was handed over - give it back
+            self.release()
+        else:
+            waiter.set_result(None)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def slot(self) -> "LimiterSlot":
+        """Async context manager that measures latency and feeds the outcome back."""
+        return LimiterSlot(self)
+
+    # Feedback
+
+    def record(self, latency_s: float, outcome: str = "ok", retry_after: Optional[float] = None) -> None:
+        """
+        Feed one call outcome back into the limit.
+
+        Args:
+            latency_s: Call latency in seconds
+            outcome: "ok", "error" or "rate_limited"
+            retry_after: Server-provided retry delay in seconds, if any
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._counters[outcome] = self._counters.get(outcome, 0) + 1
+            self._outcomes.append(outcome != "ok")
+
+            if outcome == "rate_limited":
+                self._decrease(self.backoff, now)
+                if retry_after:
+                    self._resume_at = max(self._resume_at, now + retry_after)
+            elif outcome == "error":
+                error_rate = sum(self._outcomes) / len(self._outcomes)
+                if len(self._outcomes) >= 5 and error_rate > self.error_rate_threshold:
+                    self._decrease(self.backoff, now)
+            else:
+                self._latency_samples += 1
+                if self._latency_short is None:
+                    self._latency_short = self._latency_long = latency_s
+                else:
+                    self._latency_short = 0.7 * self._latency_short + 0.3 * latency_s
+                    self._latency_long = 0.95 * self._latency_long + 0.05 * latency_s
+                if self._latency_samples >= 10 and self._latency_short > self.latency_tolerance * self._latency_long:
+                    self._decrease(self.latency_backoff, now)
+                else:
+                    self._limit = min(self.max_limit, self._limit + self.increase / max(self._limit, 1.0))
+
+            self._wake()
+
+    def _decrease(self, factor: float, now: float) -> None:
+        """Multiplicative decrease, at most once per cooldown (caller holds the lock)."""
+        if now - self._last_decrease < self.decrease_cooldown_s:
+            return
+        self._limit = max(float(self.min_limit), self._limit * factor)
+        self._last_decrease = now
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return current limit, in-flight count, queue depth and outcome counters."""
+        with self._lock:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "queue_depth": len(self._waiters),
+                "paused_s": max(0.0, self._resume_at - time.monotonic()),
+                "latency_short_s": self._latency_short,
+                "latency_long_s": self._latency_long,
+                **self._counters,
+            }
+
+
+class LimiterSlot:
+    """One acquired slot; call observe(result) before leaving the block."""
+
+    def __init__(self, limiter: AdaptiveLimiter):
+        self.limiter = limiter
+        self._started = 0.0
+        self._observed = False
+
+    async def __aenter__(self) -> "LimiterSlot":
+        await self.limiter.acquire()
+        self._started = time.monotonic()
+        return self
+
+    def observe(self, result: Union[Dict, List[Dict], BaseException]) -> None:
+        """Classify the result and feed latency / outcome back into the limiter."""
+        outcome, retry_after = classify_result(result)
+        self.limiter.record(time.monotonic() - self._started, outcome, retry_after)
+        self._observed = True
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if not self._observed and exc is not None and not isinstance(exc, asyncio.CancelledError):
+                self.observe(exc)
+        finally:
+            self.limiter.release()
+        return False
+
+
+_validator_limiter: Optional[AdaptiveLimiter] = None
+_validator_limiter_lock = threading.Lock()
+
+
+def get_validator_limiter() -> AdaptiveLimiter:
+    """
+    Get the process-wide adaptive limiter for validator calls.
+
+    - VALIDATOR_CONCURRENCY_INITIAL: starting limit (default: 5)
+    - VALIDATOR_CONCURRENCY_MIN / VALIDATOR_CONCURRENCY_MAX: bounds (default: 1 / 16)
+    """
+    global _validator_limiter
+
+    with _validator_limiter_lock:
+        if _validator_limiter is None:
+            _validator_limiter = AdaptiveLimiter(
+                initial_limit=int(os.getenv("VALIDATOR_CONCURRENCY_INITIAL", 5)),
+                min_limit=int(os.getenv("VALIDATOR_CONCURRENCY_MIN", 1)),
+                max_limit=int(os.getenv("VALIDATOR_CONCURRENCY_MAX", 16)),
+            )
+        return _validator_limiter
@@ -1,13 +1,24 @@
 """Full chain implementation (v1: 4-step, v2: 5-step with validators)."""
+import contextvars
 import json
-from typing import Dict, Any
+import queue
+import threading
+from typing import Dict, Any, AsyncIterator, Iterator, Optional, Tuple
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.runnables import RunnableLambda
 
-from chains.parallel_validators import run_parallel_validators
-from chains.aggregator import build_aggregator_chain, run_aggregator
+from chains.parallel_validators import run_parallel_validators, run_pipelined_validators
+from chains.aggregator import (
+    AggregatorConfig,
+    build_aggregator_chain,
+    build_aggregator_prose_chain,
+    run_aggregator,
+    run_local_aggregator,
+)
+from chains.profile_candidates import build_profile_candidates_chain, run_profile_candidates_chain
+from chains.profile import build_profile_chain, chain_inputs
 
 try:
     from langsmith import traceable
@@ -23,6 +34,44 @@ def safe_json(obj) -> str:
     return json.dumps(obj, ensure_ascii=False, indent=2)
 
 
+def emit_step_event(config: Optional[Dict], event: str, payload: Any) -> None:
+    """
+    Forward a step result to the streaming listener, if one is attached.
+
+    The listener is passed through RunnableConfig["configurable"]["on_event"]
+    by stream_full_chain_v2; plain invoke() runs have no listener.
+    """
+    on_event = (config or {}).get("configurable", {}).get("on_event")
+    if on_event is not None:
+        on_event(event, payload)
+
+
+async def astream_closed_candidates(candidates_chain, profile: Dict) -> AsyncIterator[Dict]:
+    """
+    Stream the candidates step and yield each candidate once its JSON object is closed.
+    
+    JsonOutputParser emits the partially parsed document on every chunk, so the
+    last element of "candidates" may still be incomplete. A candidate is treated
+    as closed when the next one has started, or when the stream has finished.
+    """
+    emitted = 0
+    candidates = []
+    async for partial in candidates_chain.astream({"profile": safe_json(profile)}):
+        if not isinstance(partial, dict):
+            continue
+        candidates = partial.get("candidates") or []
+        if not isinstance(candidates, list):
+            continue
+        while emitted < len(candidates) - 1:
+            yield candidates[emitted]
+            emitted += 1
+    
+    # Final parse: every remaining candidate is complete now
+    while emitted < len(candidates):
+        yield candidates[emitted]
+        emitted += 1
+
+
 def build_full_chain(llm: ChatOpenAI, parser: JsonOutputParser):
     """
     Build the full 4-step unified chain.
@@ -207,36 +256,40 @@ def run_full_chain(chain, user_input: str):
     }
 
 
-def build_full_chain_v2(llm: ChatOpenAI, parser: JsonOutputParser):
+def build_full_chain_v2(
+    llm: ChatOpenAI,
+    parser: JsonOutputParser,
+    pipeline_candidates: bool = False,
+    fuse_profile_candidates: bool = False,
+    validator_options: Optional[Dict[str, Any]] = None,
+    aggregator_mode: str = "local",
+    aggregator_prose: bool = False,
+    aggregator_config: Optional[AggregatorConfig] = None
+):
     """
     Build the full 5-step v2 chain with validators and aggregator.
     Returns a unified RunnableSequence that will appear as a single sequence in LangSmith.
+    
+    Args:
+        llm: LLM instance
+        parser: JSON parser
+        pipeline_candidates: If True, STEP 2 and STEP 3 run as one pipelined step:
+            the candidates JSON is parsed incrementally while streaming and the
+            validators for each candidate start as soon as its object closes.
+        fuse_profile_candidates: If True, STEP 1 and STEP 2 run as one LLM call
+            returning both profile and candidates (pipeline_candidates is ignored).
+        validator_options: Extra keyword arguments for the STEP 3 validator run
+            (e.g. {"batch_mode": "multi_axis"}). Concurrency is adaptive by default;
+            pass {"max_concurrent": n} for a fixed limit.
+        aggregator_mode: "local" computes scores and ranking locally (no LLM call),
+            "llm" asks the LLM aggregator for everything.
+        aggregator_prose: In "local" mode, use one LLM call to write summary / why text.
+        aggregator_config: Axis weights and verdict penalties for "local" mode.
     """
-    # Prompts (STEP 1, 2, 5 are same as v1)
-    profile_prompt = ChatPromptTemplate.from_messages([
-        ("system", "You are a travel analyst. Return ONLY valid JSON. No markdown."),
-        ("user", """
-User travel request:
-{user_input}
-
-Return JSON schema exactly:
-{{
-  "tags": ["..."],
-  "top_priorities": ["..."],
-  "constraints": {{
-    "season": "",
-    "budget": "",
-    "companions": "",
-    "pace": "slow|medium|fast",
-    "duration_days": 0,
-    "domestic_or_international": "domestic|international|either"
-  }},
-  "avoid": ["..."],
-  "notes_for_recommender": ""
-}}
-""")
-    ])
-
+    if aggregator_mode not in ("local", "llm"):
+        raise ValueError(f"Unknown aggregator_mode: {aggregator_mode} (expected 'local' or 'llm')")
+    validator_options = validator_options or {}
+    # Prompts (STEP 2, 5 are same as v1; STEP 1 is chains.profile)
     candidates_prompt = ChatPromptTemplate.from_messages([
         ("system", "You are a travel curator. Return ONLY valid JSON. No markdown."),
         ("user", """
@@ -296,76 +349,152 @@ Return JSON schema:
     ])
 
     # Individual chains
-    profile_chain = profile_prompt | llm | parser
+    profile_chain = build_profile_chain(llm, parser)
     candidates_chain = candidates_prompt | llm | parser
+    profile_candidates_chain = build_profile_candidates_chain(llm, parser)
     aggregator_chain = build_aggregator_chain(llm, parser)
+    aggregator_prose_chain = build_aggregator_prose_chain(llm, parser) if aggregator_prose else None
     final_chain = final_prompt | llm | parser
 
     # Step functions - wrapped with RunnableLambda for unified tracing
-    def step1_profile(inputs):
-        """STEP 1: 여행자 프로필 분석"""
+    def step1_profile(inputs, config):
+        """STEP 1: 여행자 프로필 분석 (라우팅 중 미리 추출한 profile이 있으면 재사용)"""
+        profile = inputs.get("profile")
+        if profile is None:
+            profile = profile_chain.invoke({"user_input": inputs["user_input"]})
+        emit_step_event(config, "profile", profile)
         return {
             "user_input": inputs["user_input"],
-            "profile": profile_chain.invoke({"user_input": inputs["user_input"]})
+            "profile": profile
         }
     
-    def step2_candidates(inputs):
+    def step2_candidates(inputs, config):
         """STEP 2: 후보 도시 생성"""
         candidates_result = candidates_chain.invoke({
             "profile": safe_json(inputs["profile"])
         })
+        candidates = candidates_result.get("candidates", [])
+        emit_step_event(config, "candidates", candidates)
         return {
             **inputs,
-            "candidates": candidates_result.get("candidates", [])
+            "candidates": candidates
         }
     
-    def step3_parallel_validators(inputs):
+    def step3_parallel_validators(inputs, config):
         """STEP 3: 병렬 검증"""
         validators_results = run_parallel_validators(
             llm,
             parser,
             inputs["profile"],
             inputs["candidates"],
-            max_concurrent=5
+            on_result=lambda result: emit_step_event(config, "validator_result", result),
+            **validator_options
         )
+        emit_step_event(config, "validators_results", validators_results)
         return {
             **inputs,
             "validators_results": validators_results
         }
     
-    def step4_aggregator(inputs):
-        """STEP 4: 검증 결과 종합"""
-        aggregation = run_aggregator(
-            aggregator_chain,
+    def step1_2_fused(inputs, config):
+        """STEP 1+2: 여행자 프로필 분석 + 후보 도시 생성 (단일 호출)"""
+        if inputs.get("profile") is not None:
+            # Profile already extracted: only STEP 2 is left
+            return step2_candidates(step1_profile(inputs, config), config)
+        fused = run_profile_candidates_chain(profile_candidates_chain, inputs["user_input"])
+        emit_step_event(config, "profile", fused["profile"])
+        emit_step_event(config, "candidates", fused["candidates"])
+        return {
+            "user_input": inputs["user_input"],
+            "profile": fused["profile"],
+            "candidates": fused["candidates"]
+        }
+    
+    def step2_3_pipelined(inputs, config):
+        """STEP 2+3: 후보 생성 스트림에 맞춰 병렬 검증 시작"""
+        candidates = []
+        
+        async def closed_candidates():
+            async for candidate in astream_closed_candidates(candidates_chain, inputs["profile"]):
+                candidates.append(candidate)
+                yield candidate
+            emit_step_event(config, "candidates", candidates)
+        
+        validators_results = run_pipelined_validators(
+            llm,
+            parser,
             inputs["profile"],
-            inputs["candidates"],
-            inputs["validators_results"]
+            closed_candidates(),
+            on_result=lambda result: emit_step_event(config, "validator_result", result),
+            **validator_options
         )
+        emit_step_event(config, "validators_results", validators_results)
+        return {
+            **inputs,
+            "candidates": candidates,
+            "validators_results": validators_results
+        }
+    
+    def step4_aggregator(inputs, config):
+        """STEP 4: 검증 결과 종합"""
+        if aggregator_mode == "local":
+            aggregation = run_local_aggregator(
+                inputs["profile"],
+                inputs["candidates"],
+                inputs["validators_results"],
+                config=aggregator_config,
+                prose_chain=aggregator_prose_chain
+            )
+        else:
+            aggregation = run_aggregator(
+                aggregator_chain,
+                inputs["profile"],
+                inputs["candidates"],
+                inputs["validators_results"]
+            )
+        emit_step_event(config, "aggregation", aggregation)
         return {
             **inputs,
             "aggregation": aggregation
         }
     
-    def step5_final(inputs):
+    def step5_final(inputs, config):
         """STEP 5: 최종 추천 및 일정"""
+        final = final_chain.invoke({
+            "profile": safe_json(inputs["profile"]),
+            "aggregation": safe_json(inputs["aggregation"])
+        })
+        emit_step_event(config, "final", final)
         return {
             **inputs,
-            "final": final_chain.invoke({
-                "profile": safe_json(inputs["profile"]),
-                "aggregation": safe_json(inputs["aggregation"])
-            })
+            "final": final
         }
     
     # Unified chain as a single RunnableSequence
     # LangSmith will trace this as one continuous sequence when invoked
     # Each step is a RunnableLambda that will appear as part of the sequence
-    unified_chain = (
-        RunnableLambda(step1_profile)
-        | RunnableLambda(step2_candidates)
-        | RunnableLambda(step3_parallel_validators)
-        | RunnableLambda(step4_aggregator)
-        | RunnableLambda(step5_final)
-    )
+    if fuse_profile_candidates:
+        unified_chain = (
+            RunnableLambda(step1_2_fused)
+            | RunnableLambda(step3_parallel_validators)
+            | RunnableLambda(step4_aggregator)
+            | RunnableLambda(step5_final)
+        )
+    elif pipeline_candidates:
+        unified_chain = (
+            RunnableLambda(step1_profile)
+            | RunnableLambda(step2_3_pipelined)
+            | RunnableLambda(step4_aggregator)
+            | RunnableLambda(step5_final)
+        )
+    else:
+        unified_chain = (
+            RunnableLambda(step1_profile)
+            | RunnableLambda(step2_candidates)
+            | RunnableLambda(step3_parallel_validators)
+            | RunnableLambda(step4_aggregator)
+            | RunnableLambda(step5_final)
+        )
     
     return unified_chain
 
@@ -374,10 +503,13 @@ Return JSON schema:
     name="full_chain_v2",
     run_type="chain"
 )
-def run_full_chain_v2(chain, user_input: str):
+def run_full_chain_v2(chain, user_input: str, profile: Optional[Dict] = None):
     """
     Execute the full chain v2 and return results.
     
+    A profile extracted in advance (e.g. speculatively during LLM routing)
+    replaces STEP 1.
+    
     This function is wrapped with @traceable to ensure the entire chain
     appears as a single RunnableSequence in LangSmith.
     The chain itself is a RunnableSequence, and this wrapper ensures
@@ -385,7 +517,7 @@ def run_full_chain_v2(chain, user_input: str):
     """
     # Chain invoke will be automatically traced by LangSmith
     # The @traceable decorator ensures this appears as one sequence
-    result = chain.invoke({"user_input": user_input})
+    result = chain.invoke(chain_inputs(user_input, profile))
     
     return {
         "profile": result["profile"],
@@ -394,3 +526,67 @@ def run_full_chain_v2(chain, user_input: str):
         "aggregation": result["aggregation"],
         "final": result["final"]
     }
+
+
+
+@traceable(
+    name="full_chain_v2_stream",
+    run_type="chain"
+)
+def stream_full_chain_v2(chain, user_input: str, profile: Optional[Dict] = None) -> Iterator[Tuple[str, Any]]:
+    """
+    Execute the full chain v2 and yield each step result as soon as it is ready.
+    
+    Yields (event, payload) tuples in this order:
+    - ("profile", dict)
+    - ("candidates", list)
+    - ("validator_result", dict) once per finished validator run
+    - ("validators_results", list)
+    - ("aggregation", dict)
+    - ("final", dict)
+    - ("done", dict) with the same shape as run_full_chain_v2's return value
+    
+    The chain runs in a worker thread; exceptions are re-raised to the caller.
+    A profile extracted in advance replaces STEP 1 (it is still yielded first).
+    """
+    events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+    done = object()
+    outcome: Dict[str, Any] = {}
+    
+    def on_event(event: str, payload: Any) -> None:
+        events.put((event, payload))
+    
+    def worker():
+        try:
+            outcome["result"] = chain.invoke(
+                chain_inputs(user_input, profile),
+                config={"configurable": {"on_event": on_event}}
+            )
+        except Exception as e:
+            outcome["error"] = e
+        finally:
+            events.put((done, None))
+    
+    # Copy context so the worker's runs nest under this trace in LangSmith
+    context = contextvars.copy_context()
+    thread = threading.Thread(target=context.run, args=(worker,), daemon=True)
+    thread.start()
+    
+    while True:
+        event, payload = events.get()
+        if event is done:
+            break
+        yield event, payload
+    thread.join()
+    
+    if "error" in outcome:
+        raise outcome["error"]
+    
+    result = outcome["result"]
+    yield "done", {
+        "profile": result["profile"],
+        "candidates": result["candidates"],
+        "validators_results": result["validators_results"],
+        "aggregation": result["aggregation"],
+        "final": result["final"]
+    }
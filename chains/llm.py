@@ -0,0 +1,209 @@
+"""Shared ChatOpenAI setup for all chains."""
+import hashlib
+from typing import Any, AsyncIterator, Iterator, List, Optional, Tuple
+
+from langchain_core.caches import BaseCache
+from langchain_core.globals import get_llm_cache
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessageChunk, BaseMessage, message_chunk_to_message
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_openai import ChatOpenAI
+
+from tools.rate_limiter import estimate_tokens, get_rate_limiter
+from tools.single_flight import get_single_flight
+
+
+class TravelChatOpenAI(ChatOpenAI):
+    """
+    ChatOpenAI used by the travel-guide chains.
+
+    invoke() already goes through the LangChain LLM cache. Streaming calls
+    (e.g. the pipelined candidates step) bypass it in LangChain, so _stream /
+    _astream replay a cached response as a single chunk on a hit and store
+    the merged response on a miss.
+
+    Every call that reaches OpenAI (cache misses only) first reserves capacity
+    on the process-wide per-model RPM/TPM buckets, so concurrent sessions are
+    smoothed out instead of running into 429s.
+
+    Identical non-streaming calls that are in flight at the same time (same
+    rendered prompt and model settings, e.g. two sessions validating the same
+    destination) are coalesced into one OpenAI call; the LLM cache then serves
+    later repeats.
+    """
+
+    def _resolve_cache(self) -> Optional[BaseCache]:
+        if self.cache is False:
+            return None
+        if isinstance(self.cache, BaseCache):
+            return self.cache
+        return get_llm_cache()
+
+    def _cache_key(self, messages: List[BaseMessage], stop: Optional[List[str]], **kwargs: Any) -> Tuple[str, str]:
+        """Build (prompt, llm_string) the same way as BaseChatModel's invoke path."""
+        normalized_messages = [
+            msg.model_copy(update={"id": None}) if getattr(msg, "id", None) is not None else msg
+            for msg in messages
+        ]
+        return dumps(normalized_messages), self._get_llm_string(stop=stop, **kwargs)
+
+    @staticmethod
+    def _replay(cached) -> ChatGenerationChunk:
+        text = "".join(getattr(generation, "text", "") for generation in cached)
+        return ChatGenerationChunk(message=AIMessageChunk(content=text))
+
+    @staticmethod
+    def _merge(chunks: List[ChatGenerationChunk]) -> List[ChatGeneration]:
+        merged = chunks[0]
+        for chunk in chunks[1:]:
+            merged += chunk
+        return [ChatGeneration(message=message_chunk_to_message(merged.message))]
+
+    def _rate_limit_reservation(self, messages: List[BaseMessage]) -> Optional[Tuple[Any, list]]:
+        """Build (limiter, reservations) for one call (None if rate limiting is disabled)."""
+        limiter = get_rate_limiter()
+        if limiter is None:
+            return None
+        requests_bucket, tokens_bucket = limiter.model_buckets(self.model_name)
+        return limiter, [(requests_bucket, 1), (tokens_bucket, estimate_tokens(messages, self.max_tokens))]
+
+    @staticmethod
+    def _settle_tokens(reservation: Optional[Tuple[Any, list]], result: ChatResult) -> None:
+        """Correct the token bucket with the actual usage reported by OpenAI."""
+        if reservation is None:
+            return
+        actual = sum(
+            (getattr(generation.message, "usage_metadata", None) or {}).get("total_tokens", 0)
+            for generation in result.generations
+        )
+        if actual:
+            tokens_bucket, estimate = reservation[1][1]
+            tokens_bucket.adjust(actual - estimate)
+
+    def _flight_key(self, messages: List[BaseMessage], stop: Optional[List[str]], **kwargs: Any) -> str:
+        """Hash of the rendered prompt and model settings (same inputs as the cache key)."""
+        prompt, llm_string = self._cache_key(messages, stop, **kwargs)
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any
+    ) -> ChatResult:
+        flights = get_single_flight("llm")
+        if flights is None:
+            return self._limited_generate(messages, stop, run_manager, **kwargs)
+        key = self._flight_key(messages, stop, **kwargs)
+        return flights.do(key, self._limited_generate, messages, stop, run_manager, **kwargs)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any
+    ) -> ChatResult:
+        flights = get_single_flight("llm")
+        if flights is None:
+            return await self._alimited_generate(messages, stop, run_manager, **kwargs)
+        key = self._flight_key(messages, stop, **kwargs)
+        return await flights.ado(key, self._alimited_generate, messages, stop, run_manager, **kwargs)
+
+    def _limited_generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any
+    ) -> ChatResult:
+        reservation = self._rate_limit_reservation(messages)
+        if reservation is not None:
+            reservation[0].acquire(reservation[1])
+        result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self._settle_tokens(reservation, result)
+        return result
+
+    async def _alimited_generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any
+    ) -> ChatResult:
+        reservation = self._rate_limit_reservation(messages)
+        if reservation is not None:
+            await reservation[0].aacquire(reservation[1])
+        result = await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self._settle_tokens(reservation, result)
+        return result
+
+    def _limited_stream(self, messages: List[BaseMessage], **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        reservation = self._rate_limit_reservation(messages)
+        if reservation is not None:
+            reservation[0].acquire(reservation[1])
+        yield from super()._stream(messages, **kwargs)
+
+    async def _alimited_stream(self, messages: List[BaseMessage], **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        reservation = self._rate_limit_reservation(messages)
+        if reservation is not None:
+            await reservation[0].aacquire(reservation[1])
+        async for chunk in super()._astream(messages, **kwargs):
+            yield chunk
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any
+    ) -> Iterator[ChatGenerationChunk]:
+        llm_cache = self._resolve_cache()
+        if llm_cache is None:
+            yield from self._limited_stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+            return
+
+        prompt, llm_string = self._cache_key(messages, stop, **kwargs)
+        cached = llm_cache.lookup(prompt, llm_string)
+        if cached:
+            yield self._replay(cached)
+            return
+
+        chunks = []
+        for chunk in self._limited_stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        if chunks:
+            llm_cache.update(prompt, llm_string, self._merge(chunks))
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        llm_cache = self._resolve_cache()
+        if llm_cache is None:
+            async for chunk in self._alimited_stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                yield chunk
+            return
+
+        prompt, llm_string = self._cache_key(messages, stop, **kwargs)
+        cached = await llm_cache.alookup(prompt, llm_string)
+        if cached:
+            yield self._replay(cached)
+            return
+
+        chunks = []
+        async for chunk in self._alimited_stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        if chunks:
+            await llm_cache.aupdate(prompt, llm_string, self._merge(chunks))
+
+
+def build_llm(model_name: str, temperature: float) -> TravelChatOpenAI:
+    """Build the chat model shared by all chains."""
+    return TravelChatOpenAI(model=model_name, temperature=temperature)
@@ -0,0 +1,240 @@
+"""Persistent LLM response cache (in-process LRU in front of a local SQLite store)."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
+
+# Bump to invalidate every cached response (e.g. after changing output parsing)
+CACHE_NAMESPACE = "travel-guide-llm-v1"
+
+
+def make_cache_key(prompt: str, llm_string: str) -> str:
+    """
+    Build a cache key from the rendered prompt and the LLM configuration.
+
+    - llm_string: serialized model parameters (model name, temperature, stop, ...)
+    - prompt: serialized rendered messages; it embeds the prompt template text,
+      so editing a template produces a new key (prompt-versioned).
+    """
+    digest = hashlib.sha256()
+    for part in (CACHE_NAMESPACE, llm_string, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def serialize_generations(generations: Sequence[Generation]) -> str:
+    """Serialize generations to JSON (text content only; usage metadata is not kept)."""
+    return json.dumps(
+        [
+            {"chat": isinstance(generation, ChatGeneration), "text": generation.text}
+            for generation in generations
+        ],
+        ensure_ascii=False
+    )
+
+
+def deserialize_generations(value: str) -> list:
+    """Inverse of serialize_generations."""
+    return [
+        ChatGeneration(message=AIMessage(content=item["text"])) if item.get("chat") else Generation(text=item["text"])
+        for item in json.loads(value)
+    ]
+
+
+class TieredLLMCache(BaseCache):
+    """
+    LangChain LLM cache with an in-process LRU in front of a SQLite store.
+
+    - Entries expire after ttl_seconds (checked on lookup, purged on eviction)
+    - The LRU keeps at most max_memory_entries; SQLite keeps at most max_disk_entries
+      (least recently used rows are evicted first)
+    - Thread-safe: validators call the LLM from several threads at once
+    """
+
+    def __init__(
+        self,
+        database_path: str = ".cache/llm_cache.sqlite",
+        ttl_seconds: Optional[float] = 24 * 60 * 60,
+        max_memory_entries: int = 512,
+        max_disk_entries: int = 10_000
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            database_path: SQLite file path (":memory:" for a non-persistent store)
+            ttl_seconds: Time-to-live per entry (None = never expire)
+            max_memory_entries: LRU capacity
+            max_disk_entries: SQLite row limit
+        """
+        self.database_path = database_path
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "updates": 0, "evictions": 0}
+
+        directory = os.path.dirname(database_path)
+        if database_path != ":memory:" and directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(database_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_accessed ON llm_cache (accessed_at)")
+        self._conn.commit()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, generations: Sequence[Any], created_at: float) -> None:
+        """Put entry into the LRU (caller holds the lock)."""
+        self._memory[key] = (generations, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Look up cached generations (LRU first, then SQLite)."""
+        key = make_cache_key(prompt, llm_string)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                generations, created_at = entry
+                if not self._is_expired(created_at, now):
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return list(generations)
+                del self._memory[key]
+
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+
+            value, created_at = row
+            if self._is_expired(created_at, now):
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self._stats["misses"] += 1
+                return None
+
+            try:
+                generations = deserialize_generations(value)
+            except (ValueError, KeyError, TypeError):
+                # Unreadable entry - treat as miss
+                self._stats["misses"] += 1
+                return None
+
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._remember(key, generations, created_at)
+            self._stats["disk_hits"] += 1
+            return list(generations)
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store generations in both tiers and evict beyond the size limits."""
+        key = make_cache_key(prompt, llm_string)
+        now = time.time()
+        value = serialize_generations(return_val)
+
+        with self._lock:
+            self._remember(key, list(return_val), now)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now)
+            )
+            self._stats["updates"] += 1
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows and the least recently used rows beyond max_disk_entries."""
+        evicted = 0
+        if self.ttl_seconds is not None:
+            evicted += self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        overflow = count - self.max_disk_entries
+        if overflow > 0:
+            evicted += self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                " SELECT key FROM llm_cache ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            ).rowcount
+        self._stats["evictions"] += evicted
+
+    def clear(self, **kwargs: Any) -> None:
+        """Clear both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current sizes."""
+        with self._lock:
+            (disk_entries,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            lookups = hits + self._stats["misses"]
+            return {
+                **self._stats,
+                "hits": hits,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": disk_entries,
+            }
+
+
+_llm_cache: Optional[TieredLLMCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[TieredLLMCache]:
+    """
+    Get the process-wide LLM cache configured from environment variables.
+
+    - LLM_CACHE_ENABLED: "false" disables the cache (default: enabled)
+    - LLM_CACHE_PATH: SQLite path (default: .cache/llm_cache.sqlite)
+    - LLM_CACHE_TTL_SECONDS: entry TTL (default: 86400, 0 = never expire)
+    - LLM_CACHE_MAX_MEMORY_ENTRIES / LLM_CACHE_MAX_DISK_ENTRIES: size limits
+
+    Returns:
+        Shared TieredLLMCache, or None if disabled
+    """
+    global _llm_cache
+
+    if os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            ttl_seconds = float(os.getenv("LLM_CACHE_TTL_SECONDS", 24 * 60 * 60))
+            _llm_cache = TieredLLMCache(
+                database_path=os.getenv("LLM_CACHE_PATH", ".cache/llm_cache.sqlite"),
+                ttl_seconds=ttl_seconds or None,
+                max_memory_entries=int(os.getenv("LLM_CACHE_MAX_MEMORY_ENTRIES", 512)),
+                max_disk_entries=int(os.getenv("LLM_CACHE_MAX_DISK_ENTRIES", 10_000)),
+            )
+        return _llm_cache
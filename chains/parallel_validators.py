@@ -1,34 +1,61 @@
-"""Parallel validators execution."""
+"""Parallel validators execution (native async validators on the shared runtime loop)."""
 import asyncio
-import os
-from typing import List, Dict, Any, Optional
+import contextlib
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator
 from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import JsonOutputParser
 
 from chains.validators import (
     build_budget_fit_validator,
     run_budget_fit_validator,
+    arun_budget_fit_validator,
     build_vibe_fit_validator,
     run_vibe_fit_validator,
+    arun_vibe_fit_validator,
     build_transit_complexity_validator,
     run_transit_complexity_validator,
+    arun_transit_complexity_validator,
     build_safety_risk_validator,
     run_safety_risk_validator,
+    arun_safety_risk_validator,
     build_safety_risk_web_validator,
     run_safety_risk_web_validator,
+    arun_safety_risk_web_validator,
     build_seasonality_weather_validator,
     run_seasonality_weather_validator,
+    arun_seasonality_weather_validator,
     build_seasonality_weather_web_validator,
     run_seasonality_weather_web_validator,
+    arun_seasonality_weather_web_validator,
+    build_multi_axis_validator,
+    arun_multi_axis_validator,
+    build_cross_candidate_validator,
+    arun_cross_candidate_validator,
+    asearch_axis_evidence,
+    axis_search_cost,
 )
+from chains.validators.axes import failed_validator_result, is_failed_run
+from chains.concurrency import AdaptiveLimiter, get_validator_limiter
+from chains.registry import get_chain
+from chains.runtime import get_runtime, run_blocking
 
-# Try to import Google CSE (optional)
+# Try to import the search providers (optional)
 try:
-    from tools.google_cse import GoogleCSE
-    HAS_GOOGLE_CSE = True
+    from tools.search_provider import get_search_provider
+    from tools.circuit_breaker import CLOSED, OPEN, CircuitOpenError
+    from tools.cse_quota import use_reservation
+    HAS_SEARCH_PROVIDER = True
 except ImportError:
-    HAS_GOOGLE_CSE = False
-    GoogleCSE = None
+    HAS_SEARCH_PROVIDER = False
+    get_search_provider = None
+    CLOSED, OPEN = "closed", "open"
+
+    class CircuitOpenError(Exception):
+        pass
+
+    def use_reservation(reservation):
+        return contextlib.nullcontext()
 
 try:
     from langsmith import traceable
@@ -38,9 +65,81 @@ except ImportError:
             return func
         return decorator
 
+try:
+    from langsmith import tracing_context
+except ImportError:
+    tracing_context = None
+
+
+# Runners that take a search provider (Google CSE client or local index) as second argument
+WEB_GROUNDED_RUNNERS = (run_safety_risk_web_validator, run_seasonality_weather_web_validator)
+
+# Native async counterparts of the sync runners returned by get_validators
+ASYNC_RUNNERS = {
+    run_budget_fit_validator: arun_budget_fit_validator,
+    run_vibe_fit_validator: arun_vibe_fit_validator,
+    run_transit_complexity_validator: arun_transit_complexity_validator,
+    run_safety_risk_validator: arun_safety_risk_validator,
+    run_seasonality_weather_validator: arun_seasonality_weather_validator,
+    run_safety_risk_web_validator: arun_safety_risk_web_validator,
+    run_seasonality_weather_web_validator: arun_seasonality_weather_web_validator,
+}
+
+# LLM-only fallback (build_func, run_func) of each web-grounded runner
+WEB_FALLBACKS = {
+    run_safety_risk_web_validator: (build_safety_risk_validator, run_safety_risk_validator),
+    run_seasonality_weather_web_validator: (build_seasonality_weather_validator, run_seasonality_weather_validator),
+}
+
+# CSE quota priority of each web-grounded axis (safety evidence is kept the longest)
+WEB_AXIS_PRIORITY = {"safety_risk": "high", "seasonality_weather": "normal"}
+
+# Assumption added to results evaluated without web search, by fallback reason
+WEB_FALLBACK_NOTES = {
+    "cse_unavailable": "웹 검색 사용 불가 - 일반 지식으로 평가",
+    "quota": "CSE 검색 할당량 부족 - 웹 검색 없이 일반 지식으로 평가",
+    "circuit_open": "검색 서비스 장애로 차단됨 (circuit open) - 웹 검색 없이 일반 지식으로 평가",
+}
+
+# Validator batching modes
+# - "none": one LLM call per (candidate, validator) pair
+# - "multi_axis": one LLM call per candidate for all non-web axes
+# - "per_axis": one LLM call per axis covering all candidates (web axes get every
+#   candidate's search results in the same call)
+BATCH_MODES = ("none", "multi_axis", "per_axis")
+
+
+@dataclass
+class CascadeConfig:
+    """
+    Cheap-first validator cascade.
+    
+    first_stage_axes run on every candidate. A candidate is pruned (its
+    remaining axes, including the web-grounded ones, are not run) when any
+    first-stage score is below min_score or their mean is below min_mean_score.
+    First-stage runs that errored are ignored in the decision.
+    """
+    first_stage_axes: tuple = ("budget_fit", "vibe_fit")
+    min_score: float = 0.3
+    min_mean_score: float = 0.45
+
+
+@dataclass
+class ValidatorSet:
+    """Validators resolved for one run, with their built chains."""
+    validators: List[tuple]
+    chains: Dict[str, Any]
+    runners: Dict[str, Callable]
+    cse_client: Optional[Any] = None
+    batch_mode: str = "none"
+    multi_axis_chain: Optional[Any] = None
+    batched_axes: List[str] = field(default_factory=list)
+    cross_candidate_chain: Optional[Any] = None
+    fallbacks: Dict[str, tuple] = field(default_factory=dict)
+
 
 # Validator configurations
-# Use web-grounded validator if Google CSE is available, otherwise fallback to LLM-only
+# Use web-grounded validator if a search provider is available, otherwise fallback to LLM-only
 def get_validators(use_web_grounded: bool = True):
     """
     Get validator configurations.
@@ -58,20 +157,20 @@ def get_validators(use_web_grounded: bool = True):
     ]
     
     # Use web-grounded validators if available
-    if use_web_grounded and HAS_GOOGLE_CSE:
-        # Check if Google CSE credentials are available
-        has_cse_api_key = os.getenv("GOOGLE_CSE_API_KEY")
-        has_weather_cx = os.getenv("GOOGLE_CSE_CX_WEATHER")
-        has_safety_cx = os.getenv("GOOGLE_CSE_CX_SAFETY")
+    search_provider = get_search_provider() if use_web_grounded and HAS_SEARCH_PROVIDER else None
+    if search_provider is not None:
+        # Search scopes of the configured provider (CSE PSEs or local index collections)
+        has_weather_cx = search_provider.cx_weather
+        has_safety_cx = search_provider.cx_safety
         
         # Use web-grounded safety_risk if Safety PSE is available, otherwise use LLM-only
-        if has_cse_api_key and (has_safety_cx or has_weather_cx):
+        if has_safety_cx or has_weather_cx:
             validators.append(("safety_risk", build_safety_risk_web_validator, run_safety_risk_web_validator))
         else:
             validators.append(("safety_risk", build_safety_risk_validator, run_safety_risk_validator))
         
         # Use web-grounded seasonality_weather if Weather PSE is available
-        if has_cse_api_key and has_weather_cx:
+        if has_weather_cx:
             validators.append(("seasonality_weather", build_seasonality_weather_web_validator, run_seasonality_weather_web_validator))
         else:
             validators.append(("seasonality_weather", build_seasonality_weather_validator, run_seasonality_weather_validator))
@@ -83,6 +182,114 @@ def get_validators(use_web_grounded: bool = True):
     return validators
 
 
+def web_fallback_reason(
+    cse_client: Optional[Any],
+    validator_name: str,
+    profile: Dict,
+    candidate: Dict
+) -> Optional[str]:
+    """
+    Decide whether a web-grounded axis must fall back to LLM-only for one candidate.
+    
+    Only checks the quota; reserve_web_search also books the queries.
+    
+    Returns:
+        Fallback reason ("cse_unavailable", "circuit_open", "quota"), or None to run the web search
+    """
+    if cse_client is None:
+        return "cse_unavailable"
+    if cse_client.breaker_state == OPEN:
+        # Search backend is failing - skip it instead of waiting for timeouts
+        # (half-open searches go ahead: the probe gets through, and calls the
+        # breaker rejects raise CircuitOpenError, which also falls back)
+        return "circuit_open"
+    cx, queries = axis_search_cost(cse_client, validator_name, profile, candidate)
+    if not cx:
+        return "cse_unavailable"
+    if not cse_client.can_afford(cx, queries, WEB_AXIS_PRIORITY.get(validator_name, "normal")):
+        return "quota"
+    return None
+
+
+def reserve_web_search(
+    cse_client: Optional[Any],
+    validator_name: str,
+    profile: Dict,
+    candidate: Dict,
+    reservation: Optional[Any] = None
+) -> tuple:
+    """
+    Decide whether a web-grounded axis runs its web search for one candidate and,
+    if so, book all of its queries on the quota in the same step.
+    
+    Concurrent candidates (and sessions) therefore cannot all pass the check
+    and then run out of quota halfway through their searches. The reservation
+    must be activated with use_reservation around the searches, which also
+    refunds the queries that were not sent.
+    
+    Args:
+        reservation: Reservation of earlier candidates to add the queries to (batched axes)
+    
+    Returns:
+        (fallback reason or None, reservation holding the queries booked so far)
+    """
+    reason = web_fallback_reason(cse_client, validator_name, profile, candidate)
+    if reason is not None:
+        return reason, reservation
+    cx, queries = axis_search_cost(cse_client, validator_name, profile, candidate)
+    booked = cse_client.reserve(cx, queries, WEB_AXIS_PRIORITY.get(validator_name, "normal"), reservation)
+    if booked is None:
+        return "quota", reservation
+    return None, booked
+
+
+def search_breaker_state(cse_client: Optional[Any]) -> str:
+    """State of the search circuit breaker ("closed" without a CSE client or breaker)."""
+    return cse_client.breaker_state if cse_client is not None else CLOSED
+
+
+def search_trace_context(breaker_state: str):
+    """Tag traced runs inside the block with the search circuit breaker state."""
+    if tracing_context is None:
+        return contextlib.nullcontext()
+    return tracing_context(
+        tags=[f"search_breaker:{breaker_state}"],
+        metadata={"search_breaker": breaker_state}
+    )
+
+
+def mark_web_fallback(result: Dict, reason: str) -> None:
+    """Record on a result that its axis was evaluated without web search."""
+    result["_web_fallback"] = reason
+    note = WEB_FALLBACK_NOTES.get(reason, reason)
+    assumptions = result.setdefault("assumptions", [])
+    if note not in assumptions:
+        assumptions.append(note)
+
+
+async def _invoke_validator(
+    run_validator_func: callable,
+    validator_chain: Any,
+    cse_client: Optional[Any],
+    profile: Dict,
+    candidate: Dict,
+    candidate_id: str
+) -> Dict:
+    """Call a validator runner (its native async version if there is one)."""
+    # Web-grounded validators need CSE client
+    if run_validator_func in WEB_GROUNDED_RUNNERS and cse_client is not None:
+        args = (validator_chain, cse_client, profile, candidate, candidate_id)
+    else:
+        args = (validator_chain, profile, candidate, candidate_id)
+    
+    async_runner = ASYNC_RUNNERS.get(run_validator_func)
+    if async_runner is not None:
+        # Native async validator: runs on the loop, no worker thread
+        return await async_runner(*args)
+    # Unknown (sync-only) validator: run in the runtime thread pool
+    return await run_blocking(run_validator_func, *args)
+
+
 async def run_validator_async(
     validator_name: str,
     validator_chain: Any,
@@ -90,11 +297,18 @@ async def run_validator_async(
     profile: Dict,
     candidate: Dict,
     candidate_id: str,
-    semaphore: asyncio.Semaphore,
-    cse_client: Optional[Any] = None
+    limiter: AdaptiveLimiter,
+    cse_client: Optional[Any] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    fallback: Optional[tuple] = None
 ) -> Dict:
     """
-    Run a single validator asynchronously with semaphore control.
+    Run a single validator asynchronously with adaptive concurrency control.
+    
+    Web-grounded validators switch to their LLM-only fallback for this
+    candidate when CSE is unavailable or the search quota is running low
+    (checked when the slot is acquired, right before searching), or when
+    the circuit breaker rejects one of its searches (e.g. while half-open).
     
     Args:
         validator_name: Name of the validator
@@ -103,43 +317,50 @@ async def run_validator_async(
         profile: Traveler profile
         candidate: Candidate destination
         candidate_id: Candidate ID
-        semaphore: Semaphore for concurrency control
-        cse_client: Optional Google CSE client for web-grounded validators
+        limiter: Adaptive limiter for concurrency control
+        cse_client: Optional search provider for web-grounded validators
+        on_result: Optional callback invoked with the result as soon as it is ready
+        fallback: (chain, run_func) of the LLM-only validator for web-grounded validators
     """
-    async with semaphore:
+    async with limiter.slot() as slot:
+        web_fallback = None
+        breaker_state = None
+        reservation = None
         try:
-            # Run validator in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
+            trace_context = contextlib.nullcontext()
+            if run_validator_func in WEB_GROUNDED_RUNNERS:
+                breaker_state = search_breaker_state(cse_client)
+                trace_context = search_trace_context(breaker_state)
+                if fallback is not None:
+                    web_fallback, reservation = reserve_web_search(cse_client, validator_name, profile, candidate)
+                    if web_fallback is not None:
+                        validator_chain, run_validator_func = fallback
             
-            # Web-grounded validators need CSE client
-            if validator_name in ("seasonality_weather", "safety_risk") and cse_client is not None:
-                result = await loop.run_in_executor(
-                    None,
-                    run_validator_func,
-                    validator_chain,
-                    cse_client,
-                    profile,
-                    candidate,
-                    candidate_id
-                )
-            else:
-                result = await loop.run_in_executor(
-                    None,
-                    run_validator_func,
-                    validator_chain,
-                    profile,
-                    candidate,
-                    candidate_id
-                )
+            with trace_context, use_reservation(reservation):
+                try:
+                    result = await _invoke_validator(
+                        run_validator_func, validator_chain, cse_client, profile, candidate, candidate_id
+                    )
+                except CircuitOpenError:
+                    # Breaker rejected a search (half-open with the probe out, or opened meanwhile)
+                    if fallback is None:
+                        raise
+                    web_fallback = "circuit_open"
+                    validator_chain, run_validator_func = fallback
+                    result = await _invoke_validator(
+                        run_validator_func, validator_chain, cse_client, profile, candidate, candidate_id
+                    )
             
             # Add metadata for LangSmith
             result["_validator_name"] = validator_name
             result["_candidate_id"] = candidate_id
-            
-            return result
+            if breaker_state is not None:
+                result["_search_breaker"] = breaker_state
+            if web_fallback is not None:
+                mark_web_fallback(result, web_fallback)
         except Exception as e:
             # Graceful error handling
-            return {
+            result = {
                 "validator": validator_name,
                 "candidate_id": candidate_id,
                 "score": 0.0,
@@ -150,78 +371,522 @@ async def run_validator_async(
                 "citations": [],
                 "_validator_name": validator_name,
                 "_candidate_id": candidate_id,
+                "_error": True,
             }
+        slot.observe(result)
+    
+    if on_result is not None:
+        on_result(result)
+    
+    return result
 
 
-async def run_parallel_validators_async(
-    llm: ChatOpenAI,
-    parser: JsonOutputParser,
+async def run_multi_axis_async(
+    validator_chain: Any,
     profile: Dict,
-    candidates: List[Dict],
-    max_concurrent: int = 5,
-    use_web_grounded: bool = True
+    candidate: Dict,
+    candidate_id: str,
+    axes: List[str],
+    limiter: AdaptiveLimiter,
+    on_result: Optional[Callable[[Dict], None]] = None
 ) -> List[Dict]:
     """
-    Run all validators for all candidates in parallel with concurrency control.
+    Run the multi-axis validator for one candidate with adaptive concurrency control.
     
-    Args:
-        llm: LLM instance
-        parser: JSON parser
-        profile: Traveler profile
-        candidates: List of candidate destinations
-        max_concurrent: Maximum concurrent validator runs (default: 5)
-        use_web_grounded: If True, use web-grounded validators when available
+    Returns one result per axis; on_result is invoked for each of them.
+    """
+    async with limiter.slot() as slot:
+        try:
+            results = await arun_multi_axis_validator(
+                validator_chain,
+                profile,
+                candidate,
+                candidate_id,
+                axes
+            )
+        except Exception as e:
+            results = [failed_validator_result(axis, candidate_id, e) for axis in axes]
+        slot.observe(results)
     
-    Returns:
-        List of all validator results
+    for result in results:
+        # Add metadata for LangSmith
+        result.setdefault("citations", [])
+        result["_validator_name"] = result["validator"]
+        result["_candidate_id"] = candidate_id
+        result["_batched"] = True
+        if on_result is not None:
+            on_result(result)
+    
+    return results
+
+
+async def run_cross_candidate_async(
+    validator_chain: Any,
+    validator_name: str,
+    web_grounded: bool,
+    profile: Dict,
+    candidate_pairs: List[tuple],
+    limiter: AdaptiveLimiter,
+    cse_client: Optional[Any] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    web_fallback: Optional[str] = None,
+    reservation: Optional[Any] = None
+) -> List[Dict]:
     """
-    # Initialize Google CSE client if available
-    cse_client = None
-    if use_web_grounded and HAS_GOOGLE_CSE:
+    Run the cross-candidate validator for one axis with adaptive concurrency control.
+    
+    For web-grounded axes the searches of all candidates run first (in parallel),
+    then a single LLM call scores every candidate. Returns one result per
+    candidate; on_result is invoked for each of them. web_fallback marks a
+    web-grounded axis that is evaluated LLM-only for these candidates; the
+    whole batch also goes LLM-only when the circuit breaker rejects a search.
+    reservation holds the quota booked for the searches (released here).
+    """
+    breaker_state = None
+    trace_context = contextlib.nullcontext()
+    if web_grounded or web_fallback is not None:
+        breaker_state = search_breaker_state(cse_client)
+        trace_context = search_trace_context(breaker_state)
+    
+    async with limiter.slot() as slot:
+        search_hits = None
+        search_queries = {}
         try:
-            cse_client = GoogleCSE()
-        except (ValueError, Exception):
-            # CSE not configured, fallback to LLM-only
-            cse_client = None
+            with trace_context, use_reservation(reservation):
+                if web_grounded and cse_client is not None:
+                    searches = await asyncio.gather(*(
+                        asearch_axis_evidence(cse_client, validator_name, profile, candidate)
+                        for _, candidate in candidate_pairs
+                    ), return_exceptions=True)
+                    errors = [search for search in searches if isinstance(search, BaseException)]
+                    if any(isinstance(error, CircuitOpenError) for error in errors):
+                        # Breaker rejected a search: score the batch LLM-only
+                        web_fallback = "circuit_open"
+                    elif errors:
+                        raise errors[0]
+                    else:
+                        search_hits = {}
+                        for (candidate_id, _), (queries, hits) in zip(candidate_pairs, searches):
+                            search_queries[candidate_id] = queries
+                            search_hits[candidate_id] = hits
+                
+                results = await arun_cross_candidate_validator(
+                    validator_chain,
+                    profile,
+                    candidate_pairs,
+                    validator_name,
+                    search_hits
+                )
+        except Exception as e:
+            results = [failed_validator_result(validator_name, candidate_id, e) for candidate_id, _ in candidate_pairs]
+        slot.observe(results)
+    
+    for result in results:
+        # Add metadata for LangSmith
+        result.setdefault("citations", [])
+        if result["candidate_id"] in search_queries:
+            result["_search_queries"] = search_queries[result["candidate_id"]]
+        result["_validator_name"] = validator_name
+        result["_candidate_id"] = result["candidate_id"]
+        result["_batched"] = True
+        if breaker_state is not None:
+            result["_search_breaker"] = breaker_state
+        if web_fallback is not None:
+            mark_web_fallback(result, web_fallback)
+        if on_result is not None:
+            on_result(result)
+    
+    return results
+
+
+def _prepare_validators(
+    llm: ChatOpenAI,
+    parser: JsonOutputParser,
+    use_web_grounded: bool,
+    batch_mode: str = "none",
+    axes: Optional[List[str]] = None
+) -> ValidatorSet:
+    """
+    Resolve validator configurations, build their chains and the search provider.
+    
+    Chains come from the shared chain registry when llm is a registry model,
+    so they are built once per (model, temperature) instead of per request.
+    
+    If axes is given, only those validators are included (used by the cascade stages).
+    
+    In "multi_axis" mode every validator that does not need web search is
+    evaluated by the multi-axis chain instead of its own chain. In "per_axis"
+    mode every validator is evaluated by the cross-candidate chain.
+    """
+    if batch_mode not in BATCH_MODES:
+        raise ValueError(f"Unknown batch_mode: {batch_mode} (expected one of {BATCH_MODES})")
     
     # Get validator configurations
     validators = get_validators(use_web_grounded=use_web_grounded)
+    if axes is not None:
+        validators = [validator for validator in validators if validator[0] in axes]
     
-    # Build all validator chains
-    validator_chains = {}
-    validator_runners = {}
+    # Initialize the search provider if available (and needed)
+    cse_client = None
+    needs_search = any(run_func in WEB_GROUNDED_RUNNERS for _, _, run_func in validators)
+    if needs_search and HAS_SEARCH_PROVIDER:
+        # Shared provider: pooled CSE client or local index (None if not configured -> LLM-only fallback)
+        cse_client = get_search_provider()
     
-    for validator_name, build_func, run_func in validators:
-        validator_chains[validator_name] = build_func(llm, parser)
-        validator_runners[validator_name] = run_func
+    validator_set = ValidatorSet(
+        validators=validators,
+        chains={},
+        runners={},
+        cse_client=cse_client,
+        batch_mode=batch_mode
+    )
     
-    # Create semaphore for concurrency control
-    semaphore = asyncio.Semaphore(max_concurrent)
+    if batch_mode == "multi_axis":
+        validator_set.batched_axes = [
+            validator_name for validator_name, build_func, run_func in validators
+            if run_func not in WEB_GROUNDED_RUNNERS
+        ]
+        validator_set.multi_axis_chain = get_chain(llm, parser, build_multi_axis_validator)
+    elif batch_mode == "per_axis":
+        validator_set.batched_axes = [validator_name for validator_name, _, _ in validators]
+        validator_set.cross_candidate_chain = get_chain(llm, parser, build_cross_candidate_validator)
     
-    # Generate candidate IDs
-    candidate_ids = [f"C{i+1}" for i in range(len(candidates))]
+    # Build remaining (per-pair) validator chains
+    for validator_name, build_func, run_func in validators:
+        if validator_name in validator_set.batched_axes:
+            continue
+        validator_set.chains[validator_name] = get_chain(llm, parser, build_func)
+        validator_set.runners[validator_name] = run_func
+        if run_func in WEB_FALLBACKS:
+            fallback_build, fallback_run = WEB_FALLBACKS[run_func]
+            validator_set.fallbacks[validator_name] = (get_chain(llm, parser, fallback_build), fallback_run)
     
-    # Create all tasks: candidates × validators
+    return validator_set
+
+
+def _candidate_tasks(
+    validator_set: ValidatorSet,
+    profile: Dict,
+    candidate: Dict,
+    candidate_id: str,
+    limiter: AdaptiveLimiter,
+    on_result: Optional[Callable[[Dict], None]] = None
+) -> List[Any]:
+    """Create validator coroutines for one candidate ("none" / "multi_axis" modes)."""
     tasks = []
-    for candidate_idx, candidate in enumerate(candidates):
-        candidate_id = candidate_ids[candidate_idx]
-        for validator_name, build_func, run_func in validators:
-            task = run_validator_async(
-                validator_name,
-                validator_chains[validator_name],
-                validator_runners[validator_name],
-                profile,
-                candidate,
-                candidate_id,
-                semaphore,
-                cse_client
-            )
-            tasks.append(task)
+    if validator_set.batched_axes:
+        tasks.append(run_multi_axis_async(
+            validator_set.multi_axis_chain,
+            profile,
+            candidate,
+            candidate_id,
+            validator_set.batched_axes,
+            limiter,
+            on_result
+        ))
     
-    # Execute all tasks in parallel
+    for validator_name, build_func, run_func in validator_set.validators:
+        if validator_name in validator_set.batched_axes:
+            continue
+        tasks.append(run_validator_async(
+            validator_name,
+            validator_set.chains[validator_name],
+            validator_set.runners[validator_name],
+            profile,
+            candidate,
+            candidate_id,
+            limiter,
+            validator_set.cse_client,
+            on_result,
+            validator_set.fallbacks.get(validator_name)
+        ))
+    
+    return tasks
+
+
+def _split_by_search_budget(
+    cse_client: Optional[Any],
+    validator_name: str,
+    profile: Dict,
+    candidate_pairs: List[tuple]
+) -> tuple:
+    """
+    Split candidates of a web-grounded axis into those that get web search and
+    those that fall back to LLM-only (in order, booking each web candidate's
+    queries, so later candidates and axes see what earlier ones reserved).
+    
+    Returns:
+        (web pairs, fallback pairs, fallback reason, reservation of the web pairs' queries)
+    """
+    web_pairs, fallback_pairs, reason, reservation = [], [], None, None
+    for candidate_id, candidate in candidate_pairs:
+        candidate_reason, reservation = reserve_web_search(
+            cse_client, validator_name, profile, candidate, reservation
+        )
+        if candidate_reason is None:
+            web_pairs.append((candidate_id, candidate))
+        else:
+            fallback_pairs.append((candidate_id, candidate))
+            reason = reason or candidate_reason
+    return web_pairs, fallback_pairs, reason, reservation
+
+
+def _axis_tasks(
+    validator_set: ValidatorSet,
+    profile: Dict,
+    candidate_pairs: List[tuple],
+    limiter: AdaptiveLimiter,
+    on_result: Optional[Callable[[Dict], None]] = None
+) -> List[Any]:
+    """Create one cross-candidate coroutine per axis ("per_axis" mode)."""
+    if not candidate_pairs:
+        return []
+    tasks = []
+    for validator_name, build_func, run_func in validator_set.validators:
+        if run_func not in WEB_GROUNDED_RUNNERS:
+            tasks.append(run_cross_candidate_async(
+                validator_set.cross_candidate_chain, validator_name, False,
+                profile, candidate_pairs, limiter, validator_set.cse_client, on_result
+            ))
+            continue
+        
+        # Candidates beyond the search budget are scored LLM-only in a separate call
+        web_pairs, fallback_pairs, reason, reservation = _split_by_search_budget(
+            validator_set.cse_client, validator_name, profile, candidate_pairs
+        )
+        if web_pairs:
+            tasks.append(run_cross_candidate_async(
+                validator_set.cross_candidate_chain, validator_name, True,
+                profile, web_pairs, limiter, validator_set.cse_client, on_result,
+                reservation=reservation
+            ))
+        if fallback_pairs:
+            tasks.append(run_cross_candidate_async(
+                validator_set.cross_candidate_chain, validator_name, False,
+                profile, fallback_pairs, limiter, validator_set.cse_client, on_result, reason
+            ))
+    return tasks
+
+
+def _order_results(results: List[Dict], candidate_ids: List[str], validator_names: List[str]) -> List[Dict]:
+    """Reorder per-axis results into the candidate-major order of the per-pair modes."""
+    position = {
+        (candidate_id, validator_name): i
+        for i, (candidate_id, validator_name) in enumerate(
+            (candidate_id, validator_name)
+            for candidate_id in candidate_ids
+            for validator_name in validator_names
+        )
+    }
+    return sorted(
+        results,
+        key=lambda r: position.get((r.get("candidate_id"), r.get("validator")), len(position))
+    )
+
+
+async def _run_per_axis(
+    validator_set: ValidatorSet,
+    profile: Dict,
+    candidates: List[Dict],
+    candidate_ids: List[str],
+    limiter: AdaptiveLimiter,
+    on_result: Optional[Callable[[Dict], None]] = None
+) -> List[Dict]:
+    """Run every axis over all candidates and return results in candidate-major order."""
+    tasks = _axis_tasks(
+        validator_set, profile, list(zip(candidate_ids, candidates)), limiter, on_result
+    )
     results = await asyncio.gather(*tasks, return_exceptions=True)
+    validator_names = [validator_name for validator_name, _, _ in validator_set.validators]
+    return _order_results(_collect_results(results), candidate_ids, validator_names)
+
+
+def prune_reasons(first_stage_results: List[Dict], cascade: CascadeConfig) -> List[str]:
+    """
+    Decide whether a candidate is pruned after the first cascade stage.
     
-    # Handle exceptions
+    Returns:
+        Reasons for pruning (empty list = candidate survives)
+    """
+    evaluated = [result for result in first_stage_results if not is_failed_run(result)]
+    if not evaluated:
+        return []
+    
+    reasons = []
+    scores = []
+    for result in evaluated:
+        try:
+            score = float(result.get("score", 0.0))
+        except (TypeError, ValueError):
+            score = 0.0
+        scores.append(score)
+        if score < cascade.min_score:
+            reasons.append(f"{result.get('validator')} 점수 {score:.2f} < {cascade.min_score:.2f}")
+    
+    mean_score = sum(scores) / len(scores)
+    if mean_score < cascade.min_mean_score:
+        reasons.append(f"1단계 평균 점수 {mean_score:.2f} < {cascade.min_mean_score:.2f}")
+    
+    return reasons
+
+
+def pruned_validator_result(validator_name: str, candidate_id: str, reasons: List[str]) -> Dict:
+    """Build the result reported for an axis skipped because the candidate was pruned."""
+    return {
+        "validator": validator_name,
+        "candidate_id": candidate_id,
+        "score": 0.0,
+        "verdict": "pruned",
+        "reasons": [f"1단계 검증에서 제외: {reason}" for reason in reasons],
+        "assumptions": ["실시간 데이터 아님"],
+        "questions_to_user": [],
+        "citations": [],
+        "_validator_name": validator_name,
+        "_candidate_id": candidate_id,
+        "_pruned": True,
+    }
+
+
+def _report_pruned(
+    validator_set: ValidatorSet,
+    candidate_id: str,
+    reasons: List[str],
+    on_result: Optional[Callable[[Dict], None]] = None
+) -> List[Dict]:
+    """Create (and report) pruned results for every axis of a skipped stage."""
+    results = [
+        pruned_validator_result(validator_name, candidate_id, reasons)
+        for validator_name, _, _ in validator_set.validators
+    ]
+    if on_result is not None:
+        for result in results:
+            on_result(result)
+    return results
+
+
+async def _run_cascade_candidate(
+    stages: tuple,
+    cascade: CascadeConfig,
+    profile: Dict,
+    candidate: Dict,
+    candidate_id: str,
+    limiter: AdaptiveLimiter,
+    on_result: Optional[Callable[[Dict], None]] = None
+) -> List[Dict]:
+    """Run the cascade for one candidate ("none" / "multi_axis" modes)."""
+    first_set, second_set = stages
+    first_results = _collect_results(await asyncio.gather(
+        *_candidate_tasks(first_set, profile, candidate, candidate_id, limiter, on_result),
+        return_exceptions=True
+    ))
+    
+    reasons = prune_reasons(first_results, cascade)
+    if reasons:
+        return first_results + _report_pruned(second_set, candidate_id, reasons, on_result)
+    
+    second_results = _collect_results(await asyncio.gather(
+        *_candidate_tasks(second_set, profile, candidate, candidate_id, limiter, on_result),
+        return_exceptions=True
+    ))
+    return first_results + second_results
+
+
+async def _run_cascade_per_axis(
+    stages: tuple,
+    cascade: CascadeConfig,
+    profile: Dict,
+    candidates: List[Dict],
+    candidate_ids: List[str],
+    limiter: AdaptiveLimiter,
+    on_result: Optional[Callable[[Dict], None]] = None
+) -> List[Dict]:
+    """Run the cascade with per-axis calls (stage 2 only covers the survivors)."""
+    first_set, second_set = stages
+    first_results = await _run_per_axis(
+        first_set, profile, candidates, candidate_ids, limiter, on_result
+    )
+    
+    results = list(first_results)
+    survivors = []
+    for candidate_id, candidate in zip(candidate_ids, candidates):
+        reasons = prune_reasons(
+            [result for result in first_results if result.get("candidate_id") == candidate_id],
+            cascade
+        )
+        if reasons:
+            results.extend(_report_pruned(second_set, candidate_id, reasons, on_result))
+        else:
+            survivors.append((candidate_id, candidate))
+    
+    if survivors:
+        results.extend(await _run_per_axis(
+            second_set,
+            profile,
+            [candidate for _, candidate in survivors],
+            [candidate_id for candidate_id, _ in survivors],
+            limiter,
+            on_result
+        ))
+    
+    validator_names = [name for name, _, _ in first_set.validators + second_set.validators]
+    return _order_results(results, candidate_ids, validator_names)
+
+
+def _prepare_cascade(
+    llm: ChatOpenAI,
+    parser: JsonOutputParser,
+    use_web_grounded: bool,
+    batch_mode: str,
+    cascade: CascadeConfig
+) -> tuple:
+    """Build the (first stage, second stage) validator sets."""
+    all_axes = [validator_name for validator_name, _, _ in get_validators(use_web_grounded=use_web_grounded)]
+    first_axes = [axis for axis in all_axes if axis in cascade.first_stage_axes]
+    second_axes = [axis for axis in all_axes if axis not in cascade.first_stage_axes]
+    return (
+        _prepare_validators(llm, parser, use_web_grounded, batch_mode, axes=first_axes),
+        _prepare_validators(llm, parser, use_web_grounded, batch_mode, axes=second_axes),
+    )
+
+
+def _candidate_coroutines(
+    validator_set,
+    cascade: Optional[CascadeConfig],
+    profile: Dict,
+    candidate: Dict,
+    candidate_id: str,
+    limiter: AdaptiveLimiter,
+    on_result: Optional[Callable[[Dict], None]] = None
+) -> List[Any]:
+    """Create the coroutines for one candidate (validator_set is a stage tuple with cascade)."""
+    if cascade is not None:
+        return [_run_cascade_candidate(
+            validator_set, cascade, profile, candidate, candidate_id, limiter, on_result
+        )]
+    return _candidate_tasks(validator_set, profile, candidate, candidate_id, limiter, on_result)
+
+
+async def _run_axis_batches(
+    validator_set,
+    cascade: Optional[CascadeConfig],
+    profile: Dict,
+    candidates: List[Dict],
+    candidate_ids: List[str],
+    limiter: AdaptiveLimiter,
+    on_result: Optional[Callable[[Dict], None]] = None
+) -> List[Dict]:
+    """Run "per_axis" mode (validator_set is a stage tuple with cascade)."""
+    if cascade is not None:
+        return await _run_cascade_per_axis(
+            validator_set, cascade, profile, candidates, candidate_ids, limiter, on_result
+        )
+    return await _run_per_axis(
+        validator_set, profile, candidates, candidate_ids, limiter, on_result
+    )
+
+
+def _collect_results(results: List[Any]) -> List[Dict]:
+    """Flatten batched results and replace exceptions returned by asyncio.gather with fail results."""
     validated_results = []
     for result in results:
         if isinstance(result, Exception):
@@ -235,19 +900,171 @@ async def run_parallel_validators_async(
                 "questions_to_user": [],
                 "citations": [],
             })
+        elif isinstance(result, list):
+            validated_results.extend(result)
         else:
             validated_results.append(result)
     
     return validated_results
 
 
+def _resolve_limiter(max_concurrent: Optional[int], limiter: Optional[AdaptiveLimiter]) -> AdaptiveLimiter:
+    """Pick the limiter for a run (explicit limiter > fixed max_concurrent > shared adaptive limiter)."""
+    if limiter is not None:
+        return limiter
+    if max_concurrent is not None:
+        return AdaptiveLimiter(initial_limit=max_concurrent, min_limit=max_concurrent, max_limit=max_concurrent)
+    return get_validator_limiter()
+
+
+async def run_parallel_validators_async(
+    llm: ChatOpenAI,
+    parser: JsonOutputParser,
+    profile: Dict,
+    candidates: List[Dict],
+    max_concurrent: Optional[int] = None,
+    use_web_grounded: bool = True,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    batch_mode: str = "none",
+    cascade: Optional[CascadeConfig] = None,
+    limiter: Optional[AdaptiveLimiter] = None
+) -> List[Dict]:
+    """
+    Run all validators for all candidates in parallel with concurrency control.
+    
+    Args:
+        llm: LLM instance
+        parser: JSON parser
+        profile: Traveler profile
+        candidates: List of candidate destinations
+        max_concurrent: Fixed concurrency limit (default: None = shared adaptive limiter)
+        use_web_grounded: If True, use web-grounded validators when available
+        on_result: Optional callback invoked with each validator result as it completes
+        batch_mode: "none" (one call per pair), "multi_axis" (one call per candidate
+            for all non-web axes) or "per_axis" (one call per axis for all candidates);
+            results keep the per-validator shape in every mode
+        cascade: If given, run cascade.first_stage_axes first and skip the remaining
+            axes for candidates that clearly fail (reported with verdict "pruned")
+        limiter: Explicit AdaptiveLimiter (overrides max_concurrent)
+    
+    Returns:
+        List of all validator results
+    """
+    if cascade is not None:
+        validator_set = _prepare_cascade(llm, parser, use_web_grounded, batch_mode, cascade)
+    else:
+        validator_set = _prepare_validators(llm, parser, use_web_grounded, batch_mode)
+    
+    # Concurrency control: fixed limit if max_concurrent is given, shared adaptive limiter otherwise
+    limiter = _resolve_limiter(max_concurrent, limiter)
+    
+    # Generate candidate IDs
+    candidate_ids = [f"C{i+1}" for i in range(len(candidates))]
+    
+    if batch_mode == "per_axis":
+        return await _run_axis_batches(
+            validator_set, cascade, profile, candidates, candidate_ids, limiter, on_result
+        )
+    
+    # Create all tasks: candidates × validators
+    tasks = []
+    for candidate_idx, candidate in enumerate(candidates):
+        candidate_id = candidate_ids[candidate_idx]
+        tasks.extend(_candidate_coroutines(
+            validator_set, cascade, profile, candidate, candidate_id, limiter, on_result
+        ))
+    
+    # Execute all tasks in parallel
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    # Handle exceptions
+    return _collect_results(results)
+
+
+async def run_pipelined_validators_async(
+    llm: ChatOpenAI,
+    parser: JsonOutputParser,
+    profile: Dict,
+    candidate_stream: AsyncIterator[Dict],
+    max_concurrent: Optional[int] = None,
+    use_web_grounded: bool = True,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    batch_mode: str = "none",
+    cascade: Optional[CascadeConfig] = None,
+    limiter: Optional[AdaptiveLimiter] = None
+) -> List[Dict]:
+    """
+    Run all validators for candidates arriving from an async stream.
+    
+    Validators for a candidate are scheduled as soon as the stream yields it,
+    so validation overlaps with generation of the remaining candidates.
+    In "per_axis" mode every call needs all candidates, so the stream is
+    drained first and there is no overlap.
+    Candidate IDs follow arrival order (C1, C2, ...), and results are returned
+    in the same order as run_parallel_validators_async.
+    
+    Args:
+        llm: LLM instance
+        parser: JSON parser
+        profile: Traveler profile
+        candidate_stream: Async iterator yielding complete candidate dicts
+        max_concurrent: Fixed concurrency limit (default: None = shared adaptive limiter)
+        use_web_grounded: If True, use web-grounded validators when available
+        on_result: Optional callback invoked with each validator result as it completes
+        batch_mode: "none" (one call per pair), "multi_axis" (one call per candidate
+            for all non-web axes) or "per_axis" (one call per axis for all candidates);
+            results keep the per-validator shape in every mode
+        cascade: If given, run cascade.first_stage_axes first and skip the remaining
+            axes for candidates that clearly fail (reported with verdict "pruned")
+        limiter: Explicit AdaptiveLimiter (overrides max_concurrent)
+    
+    Returns:
+        List of all validator results
+    """
+    if cascade is not None:
+        validator_set = _prepare_cascade(llm, parser, use_web_grounded, batch_mode, cascade)
+    else:
+        validator_set = _prepare_validators(llm, parser, use_web_grounded, batch_mode)
+    
+    # Concurrency control: fixed limit if max_concurrent is given, shared adaptive limiter otherwise
+    limiter = _resolve_limiter(max_concurrent, limiter)
+    
+    if batch_mode == "per_axis":
+        candidates = [candidate async for candidate in candidate_stream]
+        candidate_ids = [f"C{i+1}" for i in range(len(candidates))]
+        return await _run_axis_batches(
+            validator_set, cascade, profile, candidates, candidate_ids, limiter, on_result
+        )
+    
+    # Start tasks per candidate as it arrives (ensure_future starts them immediately)
+    tasks = []
+    candidate_idx = 0
+    async for candidate in candidate_stream:
+        candidate_idx += 1
+        candidate_id = f"C{candidate_idx}"
+        tasks.extend(
+            asyncio.ensure_future(task)
+            for task in _candidate_coroutines(
+                validator_set, cascade, profile, candidate, candidate_id, limiter, on_result
+            )
+        )
+    
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    return _collect_results(results)
+
+
 def run_parallel_validators(
     llm: ChatOpenAI,
     parser: JsonOutputParser,
     profile: Dict,
     candidates: List[Dict],
-    max_concurrent: int = 5,
-    use_web_grounded: bool = True
+    max_concurrent: Optional[int] = None,
+    use_web_grounded: bool = True,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    batch_mode: str = "none",
+    cascade: Optional[CascadeConfig] = None,
+    limiter: Optional[AdaptiveLimiter] = None
 ) -> List[Dict]:
     """
     Synchronous wrapper for parallel validators execution.
@@ -257,23 +1074,62 @@ def run_parallel_validators(
         parser: JSON parser
         profile: Traveler profile
         candidates: List of candidate destinations
-        max_concurrent: Maximum concurrent validator runs (default: 5)
+        max_concurrent: Fixed concurrency limit (default: None = shared adaptive limiter)
+        use_web_grounded: If True, use web-grounded validators when available
+        on_result: Optional callback invoked with each validator result as it completes
+        batch_mode: "none" (one call per pair), "multi_axis" (one call per candidate
+            for all non-web axes) or "per_axis" (one call per axis for all candidates);
+            results keep the per-validator shape in every mode
+        cascade: If given, run cascade.first_stage_axes first and skip the remaining
+            axes for candidates that clearly fail (reported with verdict "pruned")
+        limiter: Explicit AdaptiveLimiter (overrides max_concurrent)
+    
+    Returns:
+        List of all validator results
+    """
+    # Run on the shared runtime loop (no per-call event loop)
+    return get_runtime().run(
+        run_parallel_validators_async(
+            llm, parser, profile, candidates, max_concurrent, use_web_grounded, on_result, batch_mode, cascade, limiter
+        )
+    )
+
+
+def run_pipelined_validators(
+    llm: ChatOpenAI,
+    parser: JsonOutputParser,
+    profile: Dict,
+    candidate_stream: AsyncIterator[Dict],
+    max_concurrent: Optional[int] = None,
+    use_web_grounded: bool = True,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    batch_mode: str = "none",
+    cascade: Optional[CascadeConfig] = None,
+    limiter: Optional[AdaptiveLimiter] = None
+) -> List[Dict]:
+    """
+    Synchronous wrapper for pipelined validators execution.
+    
+    Args:
+        llm: LLM instance
+        parser: JSON parser
+        profile: Traveler profile
+        candidate_stream: Async iterator yielding complete candidate dicts
+        max_concurrent: Fixed concurrency limit (default: None = shared adaptive limiter)
         use_web_grounded: If True, use web-grounded validators when available
+        on_result: Optional callback invoked with each validator result as it completes
+        batch_mode: "none" (one call per pair), "multi_axis" (one call per candidate
+            for all non-web axes) or "per_axis" (one call per axis for all candidates);
+            results keep the per-validator shape in every mode
+        cascade: If given, run cascade.first_stage_axes first and skip the remaining
+            axes for candidates that clearly fail (reported with verdict "pruned")
+        limiter: Explicit AdaptiveLimiter (overrides max_concurrent)
     
     Returns:
         List of all validator results
     """
-    # Create new event loop if needed
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    # Run async function
-    return loop.run_until_complete(
-        run_parallel_validators_async(llm, parser, profile, candidates, max_concurrent, use_web_grounded)
-    )
\ No newline at end of file
+    return get_runtime().run(
+        run_pipelined_validators_async(
+            llm, parser, profile, candidate_stream, max_concurrent, use_web_grounded, on_result, batch_mode, cascade, limiter
+        )
+    )
@@ -0,0 +1,95 @@
+"""Traveler profile chain (STEP 1) and its speculative execution during LLM routing."""
+import os
+from typing import Dict, Optional
+from langchain_openai import ChatOpenAI
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.output_parsers import JsonOutputParser
+
+from chains.runtime import get_runtime
+
+# Routes whose chain starts with STEP 1 (and can take a profile extracted in advance)
+PROFILE_ROUTES = ("full", "candidates_only")
+
+
+def build_profile_chain(llm: ChatOpenAI, parser: JsonOutputParser):
+    """Build STEP 1 chain: user request -> traveler profile JSON."""
+    profile_prompt = ChatPromptTemplate.from_messages([
+        ("system", "You are a travel analyst. Return ONLY valid JSON. No markdown."),
+        ("user", """
+User travel request:
+{user_input}
+
+Return JSON schema exactly:
+{{
+  "tags": ["..."],
+  "top_priorities": ["..."],
+  "constraints": {{
+    "season": "",
+    "budget": "",
+    "companions": "",
+    "pace": "slow|medium|fast",
+    "duration_days": 0,
+    "domestic_or_international": "domestic|international|either"
+  }},
+  "avoid": ["..."],
+  "notes_for_recommender": ""
+}}
+""")
+    ])
+
+    return profile_prompt | llm | parser
+
+
+def chain_inputs(user_input: str, profile: Optional[Dict] = None) -> Dict:
+    """Inputs of a chain starting with STEP 1 (a profile extracted in advance lets it skip STEP 1)."""
+    if profile is None:
+        return {"user_input": user_input}
+    return {"user_input": user_input, "profile": profile}
+
+
+class SpeculativeProfile:
+    """
+    STEP 1 started before the route is known.
+
+    The profile call runs on the shared async runtime while the caller waits
+    for the LLM router, so a route that starts with STEP 1 gets its profile
+    without another round trip. The caller's trace context is carried over,
+    so the call appears in the same LangSmith trace.
+    """
+
+    def __init__(self, profile_chain, user_input: str):
+        self._future = get_runtime().submit(profile_chain.ainvoke({"user_input": user_input}))
+
+    def result(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Wait for the profile; None if the call failed (the chain then runs STEP 1 itself)."""
+        try:
+            profile = self._future.result(timeout)
+        except Exception as e:
+            print(f"[WARN] Speculative profile failed, running STEP 1 again: {e}")
+            return None
+        return profile if isinstance(profile, dict) else None
+
+    def cancel(self) -> None:
+        """Cancel the call (the in-flight request is abandoned) when the route does not need it."""
+        self._future.cancel()
+
+    def resolve(self, route: str) -> Optional[Dict]:
+        """Profile for a route in PROFILE_ROUTES; otherwise cancel and return None."""
+        if route in PROFILE_ROUTES:
+            return self.result()
+        self.cancel()
+        return None
+
+
+def start_speculative_profile(profile_chain, user_input: str) -> Optional[SpeculativeProfile]:
+    """
+    Start STEP 1 speculatively (e.g. alongside the LLM router).
+
+    - SPECULATIVE_PROFILE_ENABLED: "false" disables speculation (default: enabled)
+
+    Returns:
+        SpeculativeProfile, or None if disabled
+    """
+    if os.getenv("SPECULATIVE_PROFILE_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+    return SpeculativeProfile(profile_chain, user_input)
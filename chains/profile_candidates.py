@@ -0,0 +1,69 @@
+"""Fused profile + candidates chain (STEP 1 and STEP 2 in a single LLM call)."""
+from typing import Dict
+from langchain_openai import ChatOpenAI
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.output_parsers import JsonOutputParser
+
+
+def build_profile_candidates_chain(llm: ChatOpenAI, parser: JsonOutputParser):
+    """Build fused chain that returns traveler profile and destination candidates together."""
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", "You are a travel analyst and curator. First analyze the traveler, then curate destinations that fit the analysis. Return ONLY valid JSON. No markdown."),
+        ("user", """
+User travel request:
+{user_input}
+
+Task:
+1. Analyze the request into a traveler profile
+2. Based on that profile, generate 5 destination candidates that fit
+
+Return JSON schema exactly:
+{{
+  "profile": {{
+    "tags": ["..."],
+    "top_priorities": ["..."],
+    "constraints": {{
+      "season": "",
+      "budget": "",
+      "companions": "",
+      "pace": "slow|medium|fast",
+      "duration_days": 0,
+      "domestic_or_international": "domestic|international|either"
+    }},
+    "avoid": ["..."],
+    "notes_for_recommender": ""
+  }},
+  "candidates": [
+    {{
+      "name": "City, Country",
+      "why_fit": ["...","..."],
+      "watch_out": ["..."],
+      "best_length_days": 3
+    }}
+  ]
+}}
+""")
+    ])
+    
+    return prompt | llm | parser
+
+
+def run_profile_candidates_chain(chain, user_input: str) -> Dict:
+    """
+    Execute fused chain and return profile and candidates.
+    
+    Returns:
+        {"profile": dict, "candidates": list}
+    """
+    result = chain.invoke({"user_input": user_input})
+    
+    profile = result.get("profile", {})
+    candidates = result.get("candidates", [])
+    # Some responses wrap the list like the standalone STEP 2 schema
+    if isinstance(candidates, dict):
+        candidates = candidates.get("candidates", [])
+    
+    return {
+        "profile": profile,
+        "candidates": candidates
+    }
@@ -0,0 +1,81 @@
+"""Process-wide registry of built chains, keyed by (model, temperature)."""
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from langchain_core.output_parsers import JsonOutputParser
+
+from chains.llm import build_llm
+
+
+class ChainRegistry:
+    """
+    Built runnables for one (model, temperature).
+
+    LCEL runnables are immutable and carry no per-request state, so one built
+    chain serves every Streamlit session, rerun and request. get() builds a
+    chain the first time a (builder, options) pair is asked for and returns
+    the same object afterwards.
+    """
+
+    def __init__(self, model_name: str, temperature: float):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.llm = build_llm(model_name, temperature)
+        self.parser = JsonOutputParser()
+
+        # Reentrant: a builder may itself get its sub-chains from the registry
+        self._lock = threading.RLock()
+        self._chains: Dict[Tuple[Hashable, ...], Any] = {}
+        self._stats = {"builds": 0, "hits": 0}
+
+    def get(self, build_func: Callable[..., Any], *args: Hashable, **kwargs: Hashable) -> Any:
+        """Return build_func(llm, parser, *args, **kwargs), building it once (options must be hashable)."""
+        key = (build_func, args, tuple(sorted(kwargs.items())))
+        with self._lock:
+            chain = self._chains.get(key)
+            if chain is None:
+                # Building under the lock keeps concurrent first requests from building twice
+                chain = build_func(self.llm, self.parser, *args, **kwargs)
+                self._chains[key] = chain
+                self._stats["builds"] += 1
+            else:
+                self._stats["hits"] += 1
+            return chain
+
+    def stats(self) -> Dict[str, Any]:
+        """Return build / reuse counters and the number of cached chains."""
+        with self._lock:
+            return {**self._stats, "chains": len(self._chains)}
+
+
+_registries: Dict[Tuple[str, float], ChainRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_chain_registry(model_name: str, temperature: float) -> ChainRegistry:
+    """Get the shared registry (and chat model) of a (model, temperature)."""
+    key = (model_name, float(temperature))
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = ChainRegistry(model_name, temperature)
+        return _registries[key]
+
+
+def _registry_of(llm: Any) -> Optional[ChainRegistry]:
+    """Registry whose chat model is llm, if any."""
+    with _registries_lock:
+        registry = _registries.get((getattr(llm, "model_name", None), getattr(llm, "temperature", None)))
+    return registry if registry is not None and registry.llm is llm else None
+
+
+def get_chain(llm: Any, parser: JsonOutputParser, build_func: Callable[..., Any], *args: Hashable, **kwargs: Hashable) -> Any:
+    """
+    Get a chain built on llm, from the registry when llm is a registry model.
+
+    Chat models created elsewhere (e.g. with benchmark callbacks attached) are
+    not shared: their chains are built per call as before.
+    """
+    registry = _registry_of(llm)
+    if registry is not None:
+        return registry.get(build_func, *args, **kwargs)
+    return build_func(llm, parser, *args, **kwargs)
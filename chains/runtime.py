@@ -0,0 +1,122 @@
+"""Long-lived async runtime shared by all chains and Streamlit sessions."""
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import functools
+import os
+import threading
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncRuntime:
+    """
+    One dedicated event-loop thread plus a bounded, named thread pool.
+
+    - submit(coro) schedules a coroutine on the loop from any thread and returns
+      a concurrent.futures.Future (the caller's contextvars, e.g. the LangSmith
+      trace context, are carried over)
+    - run(coro) submits and waits for the result
+    - Blocking work inside coroutines goes to the pool via run_blocking()
+      (the pool is also the loop's default executor)
+    """
+
+    def __init__(self, max_workers: int = 32, thread_name_prefix: str = "travel-guide"):
+        """
+        Start the loop thread.
+
+        Args:
+            max_workers: Size of the blocking-work thread pool
+            thread_name_prefix: Prefix of the loop / worker thread names
+        """
+        self.max_workers = max_workers
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{thread_name_prefix}-worker"
+        )
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._executor)
+        self._started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name=f"{thread_name_prefix}-loop",
+            daemon=True
+        )
+        self._thread.start()
+        self._started.wait()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(self._started.set)
+        self._loop.run_forever()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def in_runtime_thread(self) -> bool:
+        """Whether the caller runs on the runtime's loop thread."""
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the runtime loop and return a future."""
+        if self._loop.is_closed():
+            raise RuntimeError("AsyncRuntime is shut down")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Submit a coroutine and block until it finishes.
+
+        Must not be called from the loop thread itself (it would deadlock).
+        """
+        if self.in_runtime_thread():
+            raise RuntimeError("AsyncRuntime.run() called from the runtime loop; await the coroutine instead")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def shutdown(self) -> None:
+        """Stop the loop and the thread pool."""
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._loop.close()
+
+
+async def run_blocking(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a blocking function in the running loop's default executor.
+
+    Unlike loop.run_in_executor, the caller's contextvars are propagated so
+    that LangSmith traces of the blocking call nest under the current run.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(None, functools.partial(context.run, func, *args))
+
+
+_runtime: Optional[AsyncRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> AsyncRuntime:
+    """
+    Get the process-wide async runtime (started on first use).
+
+    - ASYNC_RUNTIME_MAX_WORKERS: size of the blocking-work thread pool (default: 32)
+    """
+    global _runtime
+
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = AsyncRuntime(max_workers=int(os.getenv("ASYNC_RUNTIME_MAX_WORKERS", 32)))
+            atexit.register(_runtime.shutdown)
+        return _runtime
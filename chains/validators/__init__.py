@@ -1,31 +1,82 @@
 """Validators for travel destination validation."""
-from .budget_fit import build_budget_fit_validator, run_budget_fit_validator
-from .vibe_fit import build_vibe_fit_validator, run_vibe_fit_validator
-from .transit_complexity import build_transit_complexity_validator, run_transit_complexity_validator
-from .safety_risk import build_safety_risk_validator, run_safety_risk_validator
-from .seasonality_weather import build_seasonality_weather_validator, run_seasonality_weather_validator
+from .budget_fit import (
+    build_budget_fit_validator,
+    run_budget_fit_validator,
+    arun_budget_fit_validator
+)
+from .vibe_fit import (
+    build_vibe_fit_validator,
+    run_vibe_fit_validator,
+    arun_vibe_fit_validator
+)
+from .transit_complexity import (
+    build_transit_complexity_validator,
+    run_transit_complexity_validator,
+    arun_transit_complexity_validator
+)
+from .safety_risk import (
+    build_safety_risk_validator,
+    run_safety_risk_validator,
+    arun_safety_risk_validator
+)
+from .seasonality_weather import (
+    build_seasonality_weather_validator,
+    run_seasonality_weather_validator,
+    arun_seasonality_weather_validator
+)
 from .seasonality_weather_web import (
     build_seasonality_weather_web_validator,
-    run_seasonality_weather_web_validator
+    run_seasonality_weather_web_validator,
+    arun_seasonality_weather_web_validator
 )
 from .safety_risk_web import (
     build_safety_risk_web_validator,
-    run_safety_risk_web_validator
+    run_safety_risk_web_validator,
+    arun_safety_risk_web_validator
+)
+from .multi_axis import (
+    build_multi_axis_validator,
+    run_multi_axis_validator,
+    arun_multi_axis_validator
+)
+from .cross_candidate import (
+    build_cross_candidate_validator,
+    run_cross_candidate_validator,
+    arun_cross_candidate_validator,
+    search_axis_evidence,
+    asearch_axis_evidence,
+    axis_search_cost
 )
 
 __all__ = [
     "build_budget_fit_validator",
     "run_budget_fit_validator",
+    "arun_budget_fit_validator",
     "build_vibe_fit_validator",
     "run_vibe_fit_validator",
+    "arun_vibe_fit_validator",
     "build_transit_complexity_validator",
     "run_transit_complexity_validator",
+    "arun_transit_complexity_validator",
     "build_safety_risk_validator",
     "run_safety_risk_validator",
+    "arun_safety_risk_validator",
     "build_seasonality_weather_validator",
     "run_seasonality_weather_validator",
+    "arun_seasonality_weather_validator",
     "build_seasonality_weather_web_validator",
     "run_seasonality_weather_web_validator",
+    "arun_seasonality_weather_web_validator",
     "build_safety_risk_web_validator",
     "run_safety_risk_web_validator",
+    "arun_safety_risk_web_validator",
+    "build_multi_axis_validator",
+    "run_multi_axis_validator",
+    "arun_multi_axis_validator",
+    "build_cross_candidate_validator",
+    "run_cross_candidate_validator",
+    "arun_cross_candidate_validator",
+    "search_axis_evidence",
+    "asearch_axis_evidence",
+    "axis_search_cost",
 ]
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""Validation axis definitions shared by the batched validators."""
+from typing import Dict, List
+
+# Evaluation criteria per axis (same checklists as the single-axis validator prompts)
+AXIS_CRITERIA: Dict[str, Dict] = {
+    "budget_fit": {
+        "title": "Budget fit",
+        "criteria": [
+            "Accommodation costs (average range)",
+            "Food/dining costs",
+            "Transportation costs",
+            "Overall cost of living",
+            "Do NOT provide specific prices; use general ranges (budget-friendly, moderate, expensive)",
+            "Consider the traveler's stated budget from profile",
+        ],
+        "score_meaning": "1.0 = perfect fit, 0.0 = poor fit",
+    },
+    "vibe_fit": {
+        "title": "Vibe fit",
+        "criteria": [
+            "Quietness/peacefulness (if traveler prefers quiet)",
+            "Cafe culture and coffee scene",
+            "Walkability and pedestrian-friendly areas",
+            "Natural environment (parks, nature spots)",
+            "Overall atmosphere matching traveler's pace (slow/medium/fast)",
+            "Does it match the top priorities and avoid what the traveler wants to avoid?",
+        ],
+        "score_meaning": "1.0 = perfect match, 0.0 = poor match",
+    },
+    "transit_complexity": {
+        "title": "Transit complexity",
+        "criteria": [
+            "Public transportation system (subway, bus, train)",
+            "Language barriers for navigation",
+            "Distance between major attractions",
+            "Ease of walking between key areas",
+            "Need for taxis/ride-sharing",
+        ],
+        "score_meaning": "1.0 = very easy, 0.0 = very complex (lower complexity = higher score)",
+    },
+    "safety_risk": {
+        "title": "Safety risk",
+        "criteria": [
+            "General crime rates (petty theft, pickpocketing)",
+            "Tourist-targeted scams",
+            "Nighttime safety",
+            "Solo traveler safety (if applicable)",
+            "Do NOT create excessive fear; give balanced, practical advice",
+        ],
+        "score_meaning": "1.0 = very safe, 0.0 = high risk",
+    },
+    "seasonality_weather": {
+        "title": "Seasonality & weather",
+        "criteria": [
+            "Typical weather and climate comfort for the travel period",
+            "Rainfall/precipitation patterns",
+            "Tourist crowd levels (high/medium/low season)",
+            "Seasonal events or festivals",
+            "Use general seasonal patterns, NOT real-time weather data",
+        ],
+        "score_meaning": "1.0 = perfect season, 0.0 = poor season",
+    },
+}
+
+# Verdict used when an axis result is missing from a batched response
+DEFAULT_VERDICTS: Dict[str, str] = {
+    "seasonality_weather": "unknown",
+}
+
+# Reason of an axis a batched response left out
+MISSING_AXIS_REASON = "배치 응답에 해당 축 결과 없음"
+
+# Reason prefixes of results that carry no evaluation (errored runs, missing axes)
+FAILED_RUN_PREFIXES = ("검증 실패", "예외 발생", MISSING_AXIS_REASON)
+
+
+def format_axes_spec(axes: List[str]) -> str:
+    """Render the evaluation checklist for the given axes as prompt text."""
+    sections = []
+    for axis in axes:
+        spec = AXIS_CRITERIA[axis]
+        criteria = "\n".join(f"  - {item}" for item in spec["criteria"])
+        sections.append(f"[{axis}] {spec['title']} (score: {spec['score_meaning']})\n{criteria}")
+    return "\n\n".join(sections)
+
+
+def fill_validator_defaults(result: Dict, validator: str, candidate_id: str) -> Dict:
+    """Fill required validator fields the same way the single-axis runners do."""
+    if "validator" not in result:
+        result["validator"] = validator
+    if "candidate_id" not in result:
+        result["candidate_id"] = candidate_id
+    if "score" not in result:
+        result["score"] = 0.0
+    if "verdict" not in result:
+        result["verdict"] = DEFAULT_VERDICTS.get(validator, "fail")
+    if "reasons" not in result:
+        result["reasons"] = ["검증 실패"]
+    if "assumptions" not in result:
+        result["assumptions"] = ["실시간 데이터 아님"]
+    if "questions_to_user" not in result:
+        result["questions_to_user"] = []
+    return result
+
+
+def failed_validator_result(validator: str, candidate_id: str, error: Exception) -> Dict:
+    """Build the graceful-failure result for one axis."""
+    return {
+        "validator": validator,
+        "candidate_id": candidate_id,
+        "score": 0.0,
+        "verdict": DEFAULT_VERDICTS.get(validator, "fail"),
+        "reasons": [f"검증 실패: {str(error)}"],
+        "assumptions": ["실시간 데이터 아님"],
+        "questions_to_user": []
+    }
+
+
+def is_failed_run(result: Dict) -> bool:
+    """Whether a result comes from an errored validator run (or a missing batched axis) rather than an evaluation."""
+    reasons = result.get("reasons") or [""]
+    return bool(result.get("_error")) or str(reasons[0]).startswith(FAILED_RUN_PREFIXES)
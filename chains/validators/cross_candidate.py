@@ -0,0 +1,273 @@
+"""Cross-candidate validator: scores all candidates on one axis in a single call."""
+import json
+from typing import Dict, List, Optional, Tuple
+from langchain_openai import ChatOpenAI
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.output_parsers import JsonOutputParser
+
+from tools.search_provider import SearchHit, SearchProvider
+from .axes import format_axes_spec, fill_validator_defaults, failed_validator_result
+from .safety_risk_web import web_search_safety, aweb_search_safety, build_search_queries as build_safety_queries
+from .seasonality_weather_web import web_search_weather, aweb_search_weather, build_search_queries as build_weather_queries
+
+
+def safe_json(obj) -> str:
+    """Convert object to JSON string."""
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def search_axis_evidence(
+    cse_client: SearchProvider,
+    axis: str,
+    profile: Dict,
+    candidate: Dict
+) -> Tuple[List[str], List[SearchHit]]:
+    """
+    Run the web search of a web-grounded axis for one candidate.
+    
+    Returns:
+        (search queries, search hits)
+    """
+    if axis == "safety_risk":
+        return build_safety_queries(profile, candidate), web_search_safety(cse_client, profile, candidate)
+    if axis == "seasonality_weather":
+        season = profile.get("constraints", {}).get("season", "알 수 없음")
+        return (
+            build_weather_queries(profile, candidate, season),
+            web_search_weather(cse_client, profile, candidate, season)
+        )
+    raise ValueError(f"Axis {axis} is not web-grounded")
+
+
+def axis_search_cost(
+    cse_client: SearchProvider,
+    axis: str,
+    profile: Dict,
+    candidate: Dict
+) -> Tuple[Optional[str], int]:
+    """
+    PSE and number of CSE queries the web search of an axis spends for one candidate.
+    
+    Returns:
+        (cx, number of queries) - cx is None if no suitable PSE is configured
+    """
+    if axis == "safety_risk":
+        return cse_client.cx_safety or cse_client.cx_weather, len(build_safety_queries(profile, candidate))
+    if axis == "seasonality_weather":
+        season = profile.get("constraints", {}).get("season", "알 수 없음")
+        return cse_client.cx_weather, len(build_weather_queries(profile, candidate, season))
+    raise ValueError(f"Axis {axis} is not web-grounded")
+
+
+async def asearch_axis_evidence(
+    cse_client: SearchProvider,
+    axis: str,
+    profile: Dict,
+    candidate: Dict
+) -> Tuple[List[str], List[SearchHit]]:
+    """Async version of search_axis_evidence."""
+    if axis == "safety_risk":
+        return build_safety_queries(profile, candidate), await aweb_search_safety(cse_client, profile, candidate)
+    if axis == "seasonality_weather":
+        season = profile.get("constraints", {}).get("season", "알 수 없음")
+        return (
+            build_weather_queries(profile, candidate, season),
+            await aweb_search_weather(cse_client, profile, candidate, season)
+        )
+    raise ValueError(f"Axis {axis} is not web-grounded")
+
+
+def format_candidates_block(
+    candidate_pairs: List[Tuple[str, Dict]],
+    search_hits: Optional[Dict[str, List[SearchHit]]] = None
+) -> str:
+    """Render candidates (and their search results, if any) for the prompt."""
+    blocks = []
+    for candidate_id, candidate in candidate_pairs:
+        block = f"### Candidate ID: {candidate_id}\n{safe_json(candidate)}"
+        if search_hits is not None:
+            hits = search_hits.get(candidate_id, [])
+            if hits:
+                results_text = "".join(
+                    f"\n[{i}] {hit.title}\nURL: {hit.url}\n{hit.snippet}\n"
+                    for i, hit in enumerate(hits, 1)
+                )
+            else:
+                results_text = "검색 결과가 없습니다."
+            block += f"\n\nWeb search results for {candidate_id}:\n{results_text}"
+        blocks.append(block)
+    return "\n\n".join(blocks)
+
+
+def build_cross_candidate_validator(llm: ChatOpenAI, parser: JsonOutputParser):
+    """Build cross-candidate validator chain (one axis, all candidates)."""
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", "You are a travel validator for a single evaluation axis. Score every candidate destination on that axis, consistently and on the same scale. Return ONLY valid JSON. No markdown."),
+        ("user", """
+Traveler profile:
+{profile}
+
+Travel period: {season}
+
+Evaluation axis:
+{axis_spec}
+
+Candidates:
+{candidates}
+
+Constraints:
+- Score each candidate independently on this axis only, using the same scale for all
+- {evidence_rule}
+- Return exactly one result per candidate ID
+
+Return JSON schema exactly:
+{{
+  "validator": "{axis}",
+  "results": [
+    {{
+      "candidate_id": "C1",
+      "score": 0.0,
+      "verdict": "pass | warn | fail",
+      "reasons": ["..."],
+      "citations": [
+        {{
+          "title": "...",
+          "url": "...",
+          "snippet": "..."
+        }}
+      ],
+      "assumptions": ["실시간 데이터 아님", "..."],
+      "questions_to_user": []
+    }}
+  ]
+}}
+
+Scoring:
+- score: 0.0-1.0 as described for the axis
+- verdict: "pass" (score >= 0.7), "warn" (0.4 <= score < 0.7), "fail" (score < 0.4)
+""")
+    ])
+    
+    return prompt | llm | parser
+
+
+def _build_inputs(
+    profile: Dict,
+    candidate_pairs: List[Tuple[str, Dict]],
+    axis: str,
+    search_hits: Optional[Dict[str, List[SearchHit]]]
+) -> Dict:
+    """Build chain inputs."""
+    if search_hits is not None:
+        evidence_rule = "Base your evaluation on each candidate's web search results, cite them in citations, and note insufficient results in assumptions"
+    else:
+        evidence_rule = "Use general knowledge, NOT real-time data; leave citations empty"
+    
+    return {
+        "profile": safe_json(profile),
+        "season": profile.get("constraints", {}).get("season", "알 수 없음"),
+        "axis_spec": format_axes_spec([axis]),
+        "axis": axis,
+        "candidates": format_candidates_block(candidate_pairs, search_hits),
+        "evidence_rule": evidence_rule
+    }
+
+
+def _split_results(
+    result: Dict,
+    candidate_pairs: List[Tuple[str, Dict]],
+    axis: str,
+    search_hits: Optional[Dict[str, List[SearchHit]]]
+) -> List[Dict]:
+    """Split the batched response into one result dict per candidate."""
+    candidate_ids = [candidate_id for candidate_id, _ in candidate_pairs]
+    by_candidate = {}
+    for candidate_result in result.get("results", []):
+        if isinstance(candidate_result, dict) and candidate_result.get("candidate_id") in candidate_ids:
+            by_candidate.setdefault(candidate_result["candidate_id"], candidate_result)
+    
+    results = []
+    for candidate_id in candidate_ids:
+        candidate_result = dict(by_candidate.get(candidate_id, {"reasons": ["배치 응답에 해당 후보 결과 없음"]}))
+        candidate_result["validator"] = axis
+        candidate_result["candidate_id"] = candidate_id
+        fill_validator_defaults(candidate_result, axis, candidate_id)
+        
+        if search_hits is not None:
+            hits = search_hits.get(candidate_id, [])
+            if not candidate_result.get("citations"):
+                # Add search hits as citations
+                candidate_result["citations"] = [
+                    {
+                        "title": hit.title,
+                        "url": hit.url,
+                        "snippet": hit.snippet
+                    }
+                    for hit in hits[:3]  # Top 3 citations
+                ]
+            candidate_result["_num_search_hits"] = len(hits)
+        else:
+            candidate_result["citations"] = candidate_result.get("citations") or []
+        
+        results.append(candidate_result)
+    
+    return results
+
+
+def _failed_results(candidate_pairs: List[Tuple[str, Dict]], axis: str, error: Exception) -> List[Dict]:
+    """Build graceful-failure results for every candidate."""
+    failed = []
+    for candidate_id, _ in candidate_pairs:
+        failed_result = failed_validator_result(axis, candidate_id, error)
+        failed_result["citations"] = []
+        failed.append(failed_result)
+    return failed
+
+
+def run_cross_candidate_validator(
+    chain,
+    profile: Dict,
+    candidate_pairs: List[Tuple[str, Dict]],
+    axis: str,
+    search_hits: Optional[Dict[str, List[SearchHit]]] = None
+) -> List[Dict]:
+    """
+    Execute cross-candidate validator for one axis.
+    
+    Args:
+        chain: Cross-candidate validator chain
+        profile: Traveler profile
+        candidate_pairs: List of (candidate_id, candidate)
+        axis: Validator name (e.g. "vibe_fit")
+        search_hits: Per-candidate search hits for web-grounded axes (None = LLM-only)
+    
+    Returns:
+        One result dict per candidate (same shape as the single-pair validators),
+        with graceful error handling.
+    """
+    try:
+        result = chain.invoke(_build_inputs(profile, candidate_pairs, axis, search_hits))
+        return _split_results(result, candidate_pairs, axis, search_hits)
+    except Exception as e:
+        # Graceful error handling
+        return _failed_results(candidate_pairs, axis, e)
+
+
+async def arun_cross_candidate_validator(
+    chain,
+    profile: Dict,
+    candidate_pairs: List[Tuple[str, Dict]],
+    axis: str,
+    search_hits: Optional[Dict[str, List[SearchHit]]] = None
+) -> List[Dict]:
+    """
+    Execute cross-candidate validator asynchronously (chain.ainvoke, no worker thread).
+    
+    Returns one result dict per candidate, with graceful error handling.
+    """
+    try:
+        result = await chain.ainvoke(_build_inputs(profile, candidate_pairs, axis, search_hits))
+        return _split_results(result, candidate_pairs, axis, search_hits)
+    except Exception as e:
+        # Graceful error handling
+        return _failed_results(candidate_pairs, axis, e)
@@ -0,0 +1,131 @@
+"""Multi-axis validator: evaluates several axes for one candidate in a single call."""
+import json
+from typing import Dict, List
+from langchain_openai import ChatOpenAI
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.output_parsers import JsonOutputParser
+
+from .axes import MISSING_AXIS_REASON, format_axes_spec, fill_validator_defaults, failed_validator_result
+
+
+def safe_json(obj) -> str:
+    """Convert object to JSON string."""
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def build_multi_axis_validator(llm: ChatOpenAI, parser: JsonOutputParser):
+    """Build multi-axis validator chain."""
+    prompt = ChatPromptTemplate.from_messages([
+        ("system", "You are a travel validation panel. Evaluate one destination on several independent axes, judging each axis on its own criteria. Return ONLY valid JSON. No markdown."),
+        ("user", """
+Traveler profile:
+{profile}
+
+Travel period: {season}
+
+Candidate destination:
+{candidate}
+
+Candidate ID: {candidate_id}
+
+Evaluate the candidate on EACH of these axes:
+
+{axes_spec}
+
+Constraints:
+- Judge each axis independently; do not let one axis influence another
+- Use general knowledge, NOT real-time data
+- Return exactly one result per axis, using the axis name as "validator"
+
+Return JSON schema exactly:
+{{
+  "candidate_id": "",
+  "results": [
+    {{
+      "validator": "axis_name",
+      "score": 0.0,
+      "verdict": "pass | warn | fail",
+      "reasons": ["..."],
+      "assumptions": ["실시간 데이터 아님", "..."],
+      "questions_to_user": []
+    }}
+  ]
+}}
+
+Scoring (per axis):
+- score: 0.0-1.0 as described for each axis
+- verdict: "pass" (score >= 0.7), "warn" (0.4 <= score < 0.7), "fail" (score < 0.4)
+""")
+    ])
+    
+    return prompt | llm | parser
+
+
+def _build_inputs(profile: dict, candidate: dict, candidate_id: str, axes: List[str]) -> dict:
+    """Build chain inputs."""
+    return {
+        "profile": safe_json(profile),
+        "season": profile.get("constraints", {}).get("season", "알 수 없음"),
+        "candidate": safe_json(candidate),
+        "candidate_id": candidate_id,
+        "axes_spec": format_axes_spec(axes)
+    }
+
+
+def _split_results(result: dict, candidate_id: str, axes: List[str]) -> List[Dict]:
+    """Split the batched response into one result dict per requested axis."""
+    by_axis = {}
+    for axis_result in result.get("results", []):
+        if isinstance(axis_result, dict) and axis_result.get("validator") in axes:
+            by_axis.setdefault(axis_result["validator"], axis_result)
+    
+    results = []
+    for axis in axes:
+        axis_result = dict(by_axis.get(axis, {"reasons": [MISSING_AXIS_REASON]}))
+        # Batched answers must not override the requested identity
+        axis_result["validator"] = axis
+        axis_result["candidate_id"] = candidate_id
+        results.append(fill_validator_defaults(axis_result, axis, candidate_id))
+    
+    return results
+
+
+def run_multi_axis_validator(
+    chain,
+    profile: dict,
+    candidate: dict,
+    candidate_id: str,
+    axes: List[str]
+) -> List[Dict]:
+    """
+    Execute multi-axis validator.
+    
+    Returns one result dict per axis (same shape as the single-axis validators),
+    with graceful error handling.
+    """
+    try:
+        result = chain.invoke(_build_inputs(profile, candidate, candidate_id, axes))
+        return _split_results(result, candidate_id, axes)
+    except Exception as e:
+        # Graceful error handling
+        return [failed_validator_result(axis, candidate_id, e) for axis in axes]
+
+
+async def arun_multi_axis_validator(
+    chain,
+    profile: dict,
+    candidate: dict,
+    candidate_id: str,
+    axes: List[str]
+) -> List[Dict]:
+    """
+    Execute multi-axis validator asynchronously (chain.ainvoke, no worker thread).
+    
+    Returns one result dict per axis, with graceful error handling.
+    """
+    try:
+        result = await chain.ainvoke(_build_inputs(profile, candidate, candidate_id, axes))
+        return _split_results(result, candidate_id, axes)
+    except Exception as e:
+        # Graceful error handling
+        return [failed_validator_result(axis, candidate_id, e) for axis in axes]
@@ -6,7 +6,9 @@ from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
-from tools.google_cse import GoogleCSE, SearchHit
+from tools.circuit_breaker import CircuitOpenError
+from tools.evidence import compact_search_hits
+from tools.search_provider import SearchHit, SearchProvider
 
 try:
     from langsmith import traceable
@@ -51,7 +53,7 @@ def build_search_queries(profile: Dict, candidate: Dict, season: str) -> List[st
 
 @traceable(name="seasonality_weather_web_search")
 def web_search_weather(
-    cse_client: GoogleCSE,
+    cse_client: SearchProvider,
     profile: Dict,
     candidate: Dict,
     season: str
@@ -63,22 +65,35 @@ def web_search_weather(
         List of search hits
     """
     queries = build_search_queries(profile, candidate, season)
+    if not cse_client.cx_weather:
+        raise ValueError("GOOGLE_CSE_CX_WEATHER is required for weather search")
     
-    # Search all queries and combine results
-    all_hits = []
-    for query in queries:
-        hits = cse_client.search_weather(query, num_results=3)
-        all_hits.extend(hits)
+    # All queries run concurrently; hits are merged in query order and deduped by URL
+    search_hits = cse_client.search_many(queries, cx=cse_client.cx_weather, num_results=3)
     
-    # Remove duplicates by URL
-    seen_urls = set()
-    unique_hits = []
-    for hit in all_hits:
-        if hit.url not in seen_urls:
-            seen_urls.add(hit.url)
-            unique_hits.append(hit)
+    # Near-duplicates removed, most relevant first, packed into the evidence token budget
+    return compact_search_hits(search_hits, focus=[candidate.get("name", ""), season], context=queries, max_hits=5)
+
+
+@traceable(name="seasonality_weather_web_search")
+async def aweb_search_weather(
+    cse_client: SearchProvider,
+    profile: Dict,
+    candidate: Dict,
+    season: str
+) -> List[SearchHit]:
+    """
+    Perform web search for weather/seasonality information (queries run concurrently).
+    
+    Returns:
+        List of search hits
+    """
+    queries = build_search_queries(profile, candidate, season)
+    if not cse_client.cx_weather:
+        raise ValueError("GOOGLE_CSE_CX_WEATHER is required for weather search")
     
-    return unique_hits[:5]  # Return top 5 unique results
+    search_hits = await cse_client.asearch_many(queries, cx=cse_client.cx_weather, num_results=3)
+    return compact_search_hits(search_hits, focus=[candidate.get("name", ""), season], context=queries, max_hits=5)
 
 
 def build_seasonality_weather_web_validator(llm: ChatOpenAI, parser: JsonOutputParser):
@@ -144,9 +159,79 @@ Scoring:
     return prompt | llm | parser
 
 
+def _format_search_results(search_hits: List[SearchHit]) -> str:
+    """Format search results for LLM."""
+    search_results_text = ""
+    if search_hits:
+        for i, hit in enumerate(search_hits, 1):
+            search_results_text += f"\n[{i}] {hit.title}\nURL: {hit.url}\n{hit.snippet}\n"
+    else:
+        search_results_text = "검색 결과가 없습니다."
+    return search_results_text
+
+
+def _finalize_result(
+    result: Dict,
+    profile: Dict,
+    candidate: Dict,
+    candidate_id: str,
+    season: str,
+    search_hits: List[SearchHit]
+) -> Dict:
+    """Validate required fields and add citations / search metadata."""
+    if "validator" not in result:
+        result["validator"] = "seasonality_weather"
+    if "candidate_id" not in result:
+        result["candidate_id"] = candidate_id
+    if "score" not in result:
+        result["score"] = 0.0
+    if "verdict" not in result:
+        result["verdict"] = "unknown"
+    if "reasons" not in result:
+        result["reasons"] = ["검증 실패"]
+    if "assumptions" not in result:
+        result["assumptions"] = ["검색 결과 요약 기반", "실시간 데이터 아님"]
+    if "questions_to_user" not in result:
+        result["questions_to_user"] = []
+    
+    # Ensure citations are included
+    if not result.get("citations"):
+        # Add search hits as citations
+        result["citations"] = [
+            {
+                "title": hit.title,
+                "url": hit.url,
+                "snippet": hit.snippet
+            }
+            for hit in search_hits[:3]  # Top 3 citations
+        ]
+    
+    # Add search metadata
+    result["_search_queries"] = build_search_queries(profile, candidate, season)
+    result["_num_search_hits"] = len(search_hits)
+    
+    return result
+
+
+def _failed_result(candidate_id: str, error: Exception) -> Dict:
+    """Build the graceful-failure result."""
+    return {
+        "validator": "seasonality_weather",
+        "candidate_id": candidate_id,
+        "score": 0.0,
+        "verdict": "unknown",
+        "reasons": [f"검증 실패: {str(error)}"],
+        "citations": [],
+        "assumptions": ["검색 실패", "실시간 데이터 아님"],
+        "questions_to_user": [],
+        "_search_queries": [],
+        "_num_search_hits": 0
+    }
+
+
 def run_seasonality_weather_web_validator(
     chain,
-    cse_client: GoogleCSE,
+    cse_client: SearchProvider,
     profile: Dict,
     candidate: Dict,
     candidate_id: str
@@ -162,78 +247,57 @@ def run_seasonality_weather_web_validator(
         # Step 1: Web search
         search_hits = web_search_weather(cse_client, profile, candidate, season)
         
-        # Step 2: Format search results for LLM
-        search_results_text = ""
-        if search_hits:
-            for i, hit in enumerate(search_hits, 1):
-                search_results_text += f"\n[{i}] {hit.title}\nURL: {hit.url}\n{hit.snippet}\n"
-        else:
-            search_results_text = "검색 결과가 없습니다."
-        
-        # Step 3: LLM judge
+        # Step 2: LLM judge
         result = chain.invoke({
             "profile": safe_json(profile),
             "season": season,
             "candidate": safe_json(candidate),
             "candidate_id": candidate_id,
-            "search_results": search_results_text
+            "search_results": _format_search_results(search_hits)
         })
         
-        # Step 4: Validate and add citations
-        if "validator" not in result:
-            result["validator"] = "seasonality_weather"
-        if "candidate_id" not in result:
-            result["candidate_id"] = candidate_id
-        if "score" not in result:
-            result["score"] = 0.0
-        if "verdict" not in result:
-            result["verdict"] = "unknown"
-        if "reasons" not in result:
-            result["reasons"] = ["검증 실패"]
-        if "assumptions" not in result:
-            result["assumptions"] = ["검색 결과 요약 기반", "실시간 데이터 아님"]
-        if "questions_to_user" not in result:
-            result["questions_to_user"] = []
+        # Step 3: Validate and add citations
+        return _finalize_result(result, profile, candidate, candidate_id, season, search_hits)
+        
+    except CircuitOpenError:
+        # Search backend rejected the call - the caller falls back to LLM-only
+        raise
+    except Exception as e:
+        # Graceful error handling
+        return _failed_result(candidate_id, e)
+
+
+async def arun_seasonality_weather_web_validator(
+    chain,
+    cse_client: SearchProvider,
+    profile: Dict,
+    candidate: Dict,
+    candidate_id: str
+) -> Dict:
+    """
+    Execute web-grounded seasonality and weather validator asynchronously
+    (async search + chain.ainvoke, no worker thread).
+    
+    Returns validator result with citations and graceful error handling.
+    """
+    try:
+        season = profile.get("constraints", {}).get("season", "알 수 없음")
         
-        # Ensure citations are included
-        if "citations" not in result:
-            # Add search hits as citations
-            result["citations"] = [
-                {
-                    "title": hit.title,
-                    "url": hit.url,
-                    "snippet": hit.snippet
-                }
-                for hit in search_hits[:3]  # Top 3 citations
-            ]
-        elif not result.get("citations"):
-            # If citations is empty, add search hits
-            result["citations"] = [
-                {
-                    "title": hit.title,
-                    "url": hit.url,
-                    "snippet": hit.snippet
-                }
-                for hit in search_hits[:3]
-            ]
+        search_hits = await aweb_search_weather(cse_client, profile, candidate, season)
         
-        # Add search metadata
-        result["_search_queries"] = build_search_queries(profile, candidate, season)
-        result["_num_search_hits"] = len(search_hits)
+        result = await chain.ainvoke({
+            "profile": safe_json(profile),
+            "season": season,
+            "candidate": safe_json(candidate),
+            "candidate_id": candidate_id,
+            "search_results": _format_search_results(search_hits)
+        })
         
-        return result
+        return _finalize_result(result, profile, candidate, candidate_id, season, search_hits)
         
+    except CircuitOpenError:
+        # Search backend rejected the call - the caller falls back to LLM-only
+        raise
     except Exception as e:
         # Graceful error handling
-        return {
-            "validator": "seasonality_weather",
-            "candidate_id": candidate_id,
-            "score": 0.0,
-            "verdict": "unknown",
-            "reasons": [f"검증 실패: {str(e)}"],
-            "citations": [],
-            "assumptions": ["검색 실패", "실시간 데이터 아님"],
-            "questions_to_user": [],
-            "_search_queries": [],
-            "_num_search_hits": 0
-        }
\ No newline at end of file
+        return _failed_result(candidate_id, e)
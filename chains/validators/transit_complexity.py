@@ -58,6 +58,47 @@ Note: Lower complexity = higher score
     return prompt | llm | parser
 
 
+def _build_inputs(profile: dict, candidate: dict, candidate_id: str) -> dict:
+    """Build chain inputs."""
+    return {
+        "profile": safe_json(profile),
+        "candidate": safe_json(candidate),
+        "candidate_id": candidate_id
+    }
+
+
+def _finalize_result(result: dict, candidate_id: str) -> dict:
+    """Fill required fields missing from the LLM output."""
+    if "validator" not in result:
+        result["validator"] = "transit_complexity"
+    if "candidate_id" not in result:
+        result["candidate_id"] = candidate_id
+    if "score" not in result:
+        result["score"] = 0.0
+    if "verdict" not in result:
+        result["verdict"] = "fail"
+    if "reasons" not in result:
+        result["reasons"] = ["검증 실패"]
+    if "assumptions" not in result:
+        result["assumptions"] = ["실시간 데이터 아님"]
+    if "questions_to_user" not in result:
+        result["questions_to_user"] = []
+    return result
+
+
+def _failed_result(candidate_id: str, error: Exception) -> dict:
+    """Build the graceful-failure result."""
+    return {
+        "validator": "transit_complexity",
+        "candidate_id": candidate_id,
+        "score": 0.0,
+        "verdict": "fail",
+        "reasons": [f"검증 실패: {str(error)}"],
+        "assumptions": ["실시간 데이터 아님"],
+        "questions_to_user": []
+    }
+
+
 def run_transit_complexity_validator(chain, profile: dict, candidate: dict, candidate_id: str) -> dict:
     """
     Execute transit complexity validator.
@@ -65,37 +106,22 @@ def run_transit_complexity_validator(chain, profile: dict, candidate: dict, cand
     Returns validator result with graceful error handling.
     """
     try:
-        result = chain.invoke({
-            "profile": safe_json(profile),
-            "candidate": safe_json(candidate),
-            "candidate_id": candidate_id
-        })
-        
-        # Validate required fields
-        if "validator" not in result:
-            result["validator"] = "transit_complexity"
-        if "candidate_id" not in result:
-            result["candidate_id"] = candidate_id
-        if "score" not in result:
-            result["score"] = 0.0
-        if "verdict" not in result:
-            result["verdict"] = "fail"
-        if "reasons" not in result:
-            result["reasons"] = ["검증 실패"]
-        if "assumptions" not in result:
-            result["assumptions"] = ["실시간 데이터 아님"]
-        if "questions_to_user" not in result:
-            result["questions_to_user"] = []
-            
-        return result
+        result = chain.invoke(_build_inputs(profile, candidate, candidate_id))
+        return _finalize_result(result, candidate_id)
+    except Exception as e:
+        # Graceful error handling
+        return _failed_result(candidate_id, e)
+
+
+async def arun_transit_complexity_validator(chain, profile: dict, candidate: dict, candidate_id: str) -> dict:
+    """
+    Execute transit complexity validator asynchronously (chain.ainvoke, no worker thread).
+    
+    Returns validator result with graceful error handling.
+    """
+    try:
+        result = await chain.ainvoke(_build_inputs(profile, candidate, candidate_id))
+        return _finalize_result(result, candidate_id)
     except Exception as e:
         # Graceful error handling
-        return {
-            "validator": "transit_complexity",
-            "candidate_id": candidate_id,
-            "score": 0.0,
-            "verdict": "fail",
-            "reasons": [f"검증 실패: {str(e)}"],
-            "assumptions": ["실시간 데이터 아님"],
-            "questions_to_user": []
-        }
\ No newline at end of file
+        return _failed_result(candidate_id, e)
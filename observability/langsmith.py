@@ -60,6 +60,7 @@ def trace_router_decision(route_decision: RouteDecision, user_input: str) -> Dic
         "metadata": {
             "missing_fields": route_decision.missing_fields,
             "confidence": route_decision.confidence,
+            "destination": route_decision.destination,
         }
     }
 
@@ -0,0 +1,520 @@
+"""Local intent classifier: hashed character n-gram naive Bayes between the rule and LLM routers."""
+import argparse
+import json
+import os
+import statistics
+import threading
+import time
+import unicodedata
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .gazetteer import find_destination
+from .route_log import read_route_log
+from .rules import detect_missing_fields, route_user_input
+from .types import RouteDecision
+
+ROUTES = ("full", "clarify", "candidates_only", "itinerary_only")
+
+# Temperatures tried when calibrating (NB log-likelihoods are badly overconfident)
+TEMPERATURE_GRID = np.geomspace(0.05, 50.0, 121)
+
+# Rule router confidence below which the classifier tier is asked (streamlit_app.route_input)
+RULE_CONFIDENCE_THRESHOLD = 0.7
+
+# Rule-ambiguous examples needed to fit the temperature on them alone
+MIN_AMBIGUOUS_EXAMPLES = 50
+
+
+def normalize(text: str) -> str:
+    """NFKC, casefolded, single-spaced text."""
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def hash_features(text: str, num_features: int, ngram_range: Tuple[int, int] = (1, 3)) -> np.ndarray:
+    """
+    Hashed character n-grams of a text (one bucket index per n-gram, repeats kept).
+
+    Character n-grams need no tokenizer and work the same for Korean and
+    English; crc32 is stable across processes (unlike hash()), so a model
+    trained offline matches at serving time.
+    """
+    padded = f" {normalize(text)} "
+    low, high = ngram_range
+    grams = [padded[i:i + n] for n in range(low, high + 1) for i in range(len(padded) - n + 1)]
+    return np.fromiter(
+        (zlib.crc32(gram.encode("utf-8")) % num_features for gram in grams), dtype=np.int64, count=len(grams)
+    )
+
+
+def _softmax(scores: np.ndarray) -> np.ndarray:
+    shifted = scores - scores.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+class IntentClassifier:
+    """
+    Multinomial naive Bayes over hashed character n-grams, with temperature calibration.
+
+    The whole model is two float32 arrays (class priors and per-class
+    feature log-probabilities, routes x buckets) plus a temperature, stored
+    in one .npz file. Prediction is one fancy-indexed sum and a softmax.
+    """
+
+    def __init__(
+        self,
+        class_log_prior: np.ndarray,
+        feature_log_prob: np.ndarray,
+        routes: Sequence[str] = ROUTES,
+        ngram_range: Tuple[int, int] = (1, 3),
+        temperature: float = 1.0,
+        report: Optional[dict] = None
+    ):
+        self.class_log_prior = np.asarray(class_log_prior, dtype=np.float32)
+        self.feature_log_prob = np.asarray(feature_log_prob, dtype=np.float32)
+        self.routes = tuple(routes)
+        self.ngram_range = (int(ngram_range[0]), int(ngram_range[1]))
+        self.temperature = float(temperature)
+        self.report = report or {}
+
+    @property
+    def num_features(self) -> int:
+        return self.feature_log_prob.shape[1]
+
+    @classmethod
+    def fit(
+        cls,
+        texts: Sequence[str],
+        labels: Sequence[str],
+        num_features: int = 1 << 15,
+        ngram_range: Tuple[int, int] = (1, 3),
+        alpha: float = 0.1,
+        routes: Sequence[str] = ROUTES
+    ) -> "IntentClassifier":
+        """Fit priors and smoothed n-gram log-probabilities (temperature 1.0)."""
+        route_index = {route: i for i, route in enumerate(routes)}
+        counts = np.zeros((len(routes), num_features), dtype=np.float64)
+        docs = np.zeros(len(routes), dtype=np.float64)
+        for text, label in zip(texts, labels):
+            i = route_index[label]
+            counts[i] += np.bincount(hash_features(text, num_features, ngram_range), minlength=num_features)
+            docs[i] += 1
+
+        # Routes without examples keep a small prior instead of log(0)
+        class_log_prior = np.log((docs + 1.0) / (docs.sum() + len(routes)))
+        smoothed = counts + alpha
+        feature_log_prob = np.log(smoothed / smoothed.sum(axis=1, keepdims=True))
+        return cls(class_log_prior, feature_log_prob, routes, ngram_range)
+
+    def joint_log_likelihood(self, text: str) -> np.ndarray:
+        """Uncalibrated log P(route) + log P(text | route) per route."""
+        features = hash_features(text, self.num_features, self.ngram_range)
+        return self.class_log_prior + self.feature_log_prob[:, features].sum(axis=1)
+
+    def predict_proba(self, text: str) -> np.ndarray:
+        """Calibrated route probabilities (in self.routes order)."""
+        return _softmax(self.joint_log_likelihood(text) / self.temperature)
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """Most likely route and its calibrated probability."""
+        probs = self.predict_proba(text)
+        best = int(probs.argmax())
+        return self.routes[best], float(probs[best])
+
+    def save(self, path: str) -> None:
+        """Write the model to an .npz file (atomically)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                class_log_prior=self.class_log_prior,
+                feature_log_prob=self.feature_log_prob,
+                routes=np.array(self.routes),
+                ngram_range=np.array(self.ngram_range),
+                temperature=np.array(self.temperature),
+                report=np.array(json.dumps(self.report)),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IntentClassifier":
+        """Load a model written by save()."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                class_log_prior=data["class_log_prior"],
+                feature_log_prob=data["feature_log_prob"],
+                routes=[str(route) for route in data["routes"]],
+                ngram_range=tuple(data["ngram_range"]),
+                temperature=float(data["temperature"]),
+                report=json.loads(str(data["report"])),
+            )
+
+
+def fit_temperature(log_joint: np.ndarray, label_idx: np.ndarray, weights: Optional[np.ndarray] = None) -> float:
+    """Temperature minimizing the (weighted) negative log-likelihood of held-out predictions."""
+    rows = np.arange(len(label_idx))
+    best_temperature, best_nll = 1.0, np.inf
+    for temperature in TEMPERATURE_GRID:
+        scaled = log_joint / temperature
+        scaled = scaled - scaled.max(axis=1, keepdims=True)
+        log_probs = scaled - np.log(np.exp(scaled).sum(axis=1, keepdims=True))
+        nll = -np.average(log_probs[rows, label_idx], weights=weights)
+        if nll < best_nll:
+            best_temperature, best_nll = float(temperature), nll
+    return best_temperature
+
+
+def calibration_report(confidences: np.ndarray, correct: np.ndarray, bins: int = 10) -> dict:
+    """Expected calibration error and reliability table of predicted-route confidences."""
+    edges = np.linspace(0.0, 1.0, bins + 1)
+    table = []
+    ece = 0.0
+    for low, high in zip(edges[:-1], edges[1:]):
+        in_bin = (confidences > low) & (confidences <= high)
+        if not in_bin.any():
+            continue
+        mean_confidence = float(confidences[in_bin].mean())
+        accuracy = float(correct[in_bin].mean())
+        ece += in_bin.mean() * abs(mean_confidence - accuracy)
+        table.append({
+            "bin": f"{low:.1f}-{high:.1f}",
+            "count": int(in_bin.sum()),
+            "confidence": round(mean_confidence, 3),
+            "accuracy": round(accuracy, 3),
+        })
+    return {"ece": round(float(ece), 4), "reliability": table}
+
+
+def quality_report(probs: np.ndarray, label_idx: np.ndarray, threshold: float = 0.7) -> dict:
+    """Accuracy, calibration and coverage at the routing threshold of route probabilities."""
+    correct = probs.argmax(axis=1) == label_idx
+    confident = probs.max(axis=1) >= threshold
+    return {
+        "examples": len(label_idx),
+        "accuracy": round(float(correct.mean()), 4),
+        **calibration_report(probs.max(axis=1), correct),
+        "threshold": threshold,
+        "coverage_at_threshold": round(float(confident.mean()), 4),
+        "accuracy_at_threshold": round(float(correct[confident].mean()), 4) if confident.any() else None,
+    }
+
+
+def calibration_weights(ambiguous: np.ndarray) -> Tuple[np.ndarray, str]:
+    """
+    Per-example weights of the temperature fit, and what they select.
+
+    The classifier only routes inputs the rule router is unsure about, so
+    the temperature is fit on those alone once there are enough of them;
+    with fewer, all examples count but the ambiguous ones carry half the weight.
+    """
+    count = int(ambiguous.sum())
+    if count >= MIN_AMBIGUOUS_EXAMPLES or count == len(ambiguous):
+        return ambiguous.astype(np.float64), "ambiguous"
+    if count == 0:
+        return np.ones(len(ambiguous)), "all"
+    return np.where(ambiguous, (len(ambiguous) - count) / count, 1.0), "weighted"
+
+
+def train_classifier(
+    texts: Sequence[str],
+    labels: Sequence[str],
+    folds: int = 5,
+    threshold: float = 0.7,
+    seed: int = 0,
+    ambiguous: Optional[Sequence[bool]] = None,
+    **fit_kwargs
+) -> Tuple[IntentClassifier, dict]:
+    """
+    Train a classifier and report its out-of-fold quality.
+
+    Out-of-fold log-likelihoods (k-fold cross-validation) calibrate the
+    temperature and measure accuracy, calibration before / after, and the
+    share of inputs the classifier would answer at the routing threshold
+    (and how accurate those answers are). The final model is fit on all data.
+
+    Args:
+        ambiguous: Per example, whether the rule router is unsure about it
+            (the inputs the classifier tier sees); the temperature is fit on
+            these and the report has their metrics under "ambiguous"
+    """
+    routes = tuple(fit_kwargs.pop("routes", ROUTES))
+    label_idx = np.array([routes.index(label) for label in labels])
+    order = np.random.default_rng(seed).permutation(len(texts))
+    log_joint = np.zeros((len(texts), len(routes)))
+
+    folds = max(2, min(folds, len(texts)))
+    for fold in range(folds):
+        held_out = order[fold::folds]
+        train = np.setdiff1d(order, held_out)
+        model = IntentClassifier.fit(
+            [texts[i] for i in train], [labels[i] for i in train], routes=routes, **fit_kwargs
+        )
+        for i in held_out:
+            log_joint[i] = model.joint_log_likelihood(texts[i])
+
+    if ambiguous is None:
+        band = None
+        weights, calibrated_on = None, "all"
+    else:
+        band = np.asarray(ambiguous, dtype=bool)
+        weights, calibrated_on = calibration_weights(band)
+
+    temperature = fit_temperature(log_joint, label_idx, weights)
+    raw = _softmax(log_joint)
+    calibrated = _softmax(log_joint / temperature)
+
+    report = {
+        "label_counts": {route: int((label_idx == i).sum()) for i, route in enumerate(routes)},
+        "folds": folds,
+        "temperature": round(temperature, 4),
+        "calibrated_on": calibrated_on,
+        "ece_uncalibrated": calibration_report(raw.max(axis=1), raw.argmax(axis=1) == label_idx)["ece"],
+        **quality_report(calibrated, label_idx, threshold),
+        "ambiguous": None,
+    }
+    if band is not None and band.any():
+        report["ambiguous"] = {
+            **quality_report(calibrated[band], label_idx[band], threshold),
+            "ece_uncalibrated": calibration_report(
+                raw[band].max(axis=1), raw[band].argmax(axis=1) == label_idx[band]
+            )["ece"],
+        }
+
+    classifier = IntentClassifier.fit(texts, labels, routes=routes, **fit_kwargs)
+    classifier.temperature = temperature
+    classifier.report = report
+    return classifier, report
+
+
+def load_training_entries(
+    paths: Sequence[str],
+    min_confidence: float = 0.7,
+    include_classifier: bool = False
+) -> List[dict]:
+    """
+    Labelled entries of route logs / labelled JSONL files.
+
+    Entries below min_confidence are skipped (hand-labelled lines without a
+    confidence are kept), as are the classifier's own decisions unless
+    include_classifier is set, so the model does not learn from itself.
+    Repeated inputs keep their last label.
+    """
+    examples: Dict[str, dict] = {}
+    for path in paths:
+        for entry in read_route_log(path):
+            if entry["route"] not in ROUTES:
+                continue
+            if entry.get("router_type") == "classifier" and not include_classifier:
+                continue
+            if float(entry.get("confidence", 1.0)) < min_confidence:
+                continue
+            examples[entry["input"]] = entry
+    return list(examples.values())
+
+
+def load_training_data(
+    paths: Sequence[str],
+    min_confidence: float = 0.7,
+    include_classifier: bool = False
+) -> Tuple[List[str], List[str]]:
+    """Inputs and routes of load_training_entries."""
+    entries = load_training_entries(paths, min_confidence, include_classifier)
+    return [entry["input"] for entry in entries], [entry["route"] for entry in entries]
+
+
+def rule_confidence(entry: dict) -> float:
+    """
+    Rule router confidence of a logged decision.
+
+    Route logs carry it as rule_confidence when a later tier decided and as
+    confidence when the rule router decided; other lines (hand-labelled
+    data) are routed again with the current rules.
+    """
+    if "rule_confidence" in entry:
+        return float(entry["rule_confidence"])
+    if entry.get("router_type") == "rule":
+        return float(entry.get("confidence", 1.0))
+    return route_user_input(entry["input"]).confidence
+
+
+def is_rule_ambiguous(entry: dict) -> bool:
+    """Whether the classifier tier is asked for this input (the rule router is unsure)."""
+    return rule_confidence(entry) < RULE_CONFIDENCE_THRESHOLD
+
+
+def route_with_classifier(user_input: str, classifier: IntentClassifier) -> RouteDecision:
+    """Route user input with the local classifier (confidence = calibrated probability)."""
+    route, probability = classifier.predict(user_input)
+    place = find_destination(user_input)
+    return RouteDecision(
+        route=route,
+        reason=f"로컬 분류기 예측 (p={probability:.2f})",
+        confidence=probability,
+        missing_fields=detect_missing_fields(user_input) if route == "clarify" else [],
+        router_type="classifier",
+        destination=place.label if place else None
+    )
+
+
+_intent_classifier: Optional[IntentClassifier] = None
+_intent_classifier_lock = threading.Lock()
+
+
+def get_intent_classifier() -> Optional[IntentClassifier]:
+    """
+    Get the process-wide intent classifier configured from environment variables.
+
+    - ROUTER_CLASSIFIER_ENABLED: "false" disables the classifier tier (default: enabled)
+    - ROUTER_CLASSIFIER_PATH: model file (default: .cache/router_classifier.npz)
+
+    Returns:
+        Shared IntentClassifier, or None if disabled or no model has been trained
+    """
+    global _intent_classifier
+
+    if os.getenv("ROUTER_CLASSIFIER_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+
+    with _intent_classifier_lock:
+        if _intent_classifier is None:
+            path = os.getenv("ROUTER_CLASSIFIER_PATH", ".cache/router_classifier.npz")
+            if not os.path.exists(path):
+                return None
+            _intent_classifier = IntentClassifier.load(path)
+        return _intent_classifier
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def _print_quality(report: dict) -> None:
+    accuracy_at_threshold = report["accuracy_at_threshold"]
+    print(f"  accuracy: {report['accuracy']:.3f} | confidence >= {report['threshold']}: "
+          f"{report['coverage_at_threshold']:.1%} of inputs, "
+          f"accuracy {'-' if accuracy_at_threshold is None else f'{accuracy_at_threshold:.3f}'}")
+    _print_calibration(report)
+
+
+def _print_calibration(report: dict) -> None:
+    print(f"  ECE: {report['ece']:.4f}")
+    print(f"  {'bin':<10}{'count':>7}{'confidence':>12}{'accuracy':>10}")
+    for row in report["reliability"]:
+        print(f"  {row['bin']:<10}{row['count']:>7}{row['confidence']:>12.3f}{row['accuracy']:>10.3f}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(
+        description="Train, query or evaluate the local router intent classifier.",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = arg_parser.add_subparsers(dest="command", required=True)
+    default_path = os.getenv("ROUTER_CLASSIFIER_PATH", ".cache/router_classifier.npz")
+
+    train_parser = subparsers.add_parser("train", help="Train from route logs / labelled JSONL files")
+    train_parser.add_argument("--data", action="append", required=True, help="JSONL with input and route; repeatable")
+    train_parser.add_argument("--out", default=default_path)
+    train_parser.add_argument("--features", type=int, default=1 << 15, help="Hash buckets")
+    train_parser.add_argument("--ngram", type=int, nargs=2, default=(1, 3), metavar=("MIN", "MAX"))
+    train_parser.add_argument("--alpha", type=float, default=0.1, help="Additive smoothing")
+    train_parser.add_argument("--folds", type=int, default=5)
+    train_parser.add_argument("--min-confidence", type=float, default=0.7, help="Skip log entries below this")
+    train_parser.add_argument("--include-classifier", action="store_true", help="Also learn from classifier decisions")
+
+    predict_parser = subparsers.add_parser("predict", help="Classify one input")
+    predict_parser.add_argument("text")
+    predict_parser.add_argument("--model", default=default_path)
+
+    report_parser = subparsers.add_parser("report", help="Routing latency per tier and classifier calibration on a route log")
+    report_parser.add_argument("--log", required=True)
+    report_parser.add_argument("--model", default=default_path)
+
+    args = arg_parser.parse_args()
+
+    if args.command == "train":
+        entries = load_training_entries(args.data, args.min_confidence, args.include_classifier)
+        if not entries:
+            arg_parser.error("no usable training examples")
+        texts = [entry["input"] for entry in entries]
+        labels = [entry["route"] for entry in entries]
+        start = time.perf_counter()
+        classifier, report = train_classifier(
+            texts, labels, folds=args.folds, ambiguous=[is_rule_ambiguous(entry) for entry in entries],
+            num_features=args.features, ngram_range=tuple(args.ngram), alpha=args.alpha
+        )
+        classifier.save(args.out)
+        print(f"Trained {args.out} on {report['examples']} examples in {time.perf_counter() - start:.1f}s "
+              f"({os.path.getsize(args.out) / 1024:.0f} KiB)")
+        print(f"  labels: {report['label_counts']}")
+        print(f"  temperature: {report['temperature']} (fit on {report['calibrated_on']} examples)")
+
+        ambiguous = report["ambiguous"]
+        print(f"\nRule-ambiguous inputs (rule confidence < {RULE_CONFIDENCE_THRESHOLD}, "
+              f"what the classifier routes): {0 if ambiguous is None else ambiguous['examples']} examples")
+        if ambiguous is None:
+            print("  none - log LLM-routed decisions (ROUTE_LOG_PATH) to measure the classifier where it is used")
+        else:
+            print(f"  out-of-fold, ECE before calibration: {ambiguous['ece_uncalibrated']:.4f}")
+            _print_quality(ambiguous)
+
+        print(f"\nAll examples (out-of-fold, ECE before calibration: {report['ece_uncalibrated']:.4f})")
+        _print_quality(report)
+
+        latencies = []
+        for text in texts[:1000]:
+            start = time.perf_counter()
+            classifier.predict(text)
+            latencies.append((time.perf_counter() - start) * 1e6)
+        print(f"  predict latency: p50 {statistics.median(latencies):.0f} µs, p99 {_percentile(latencies, 0.99):.0f} µs")
+
+    elif args.command == "predict":
+        classifier = IntentClassifier.load(args.model)
+        start = time.perf_counter()
+        probs = classifier.predict_proba(args.text)
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        for route, prob in sorted(zip(classifier.routes, probs), key=lambda pair: -pair[1]):
+            print(f"{route:<16}{prob:.3f}")
+        print(f"\n{elapsed_us:.0f} µs")
+
+    else:
+        entries = list(read_route_log(args.log))
+        if not entries:
+            arg_parser.error(f"no entries in {args.log}")
+
+        print(f"=== Routing latency by tier ({len(entries)} decisions) ===")
+        print(f"{'router':<12}{'share':>8}{'p50 ms':>10}{'p95 ms':>10}{'mean conf':>11}")
+        by_tier: Dict[str, List[dict]] = {}
+        for entry in entries:
+            by_tier.setdefault(entry.get("router_type", "?"), []).append(entry)
+        for tier, tier_entries in sorted(by_tier.items()):
+            latencies = [e["latency_ms"] for e in tier_entries if e.get("latency_ms") is not None] or [0.0]
+            confidence = statistics.fmean(float(e.get("confidence", 0.0)) for e in tier_entries)
+            print(f"{tier:<12}{len(tier_entries) / len(entries):>8.1%}{statistics.median(latencies):>10.2f}"
+                  f"{_percentile(latencies, 0.95):>10.2f}{confidence:>11.2f}")
+
+        if os.path.exists(args.model):
+            classifier = IntentClassifier.load(args.model)
+            # Same inputs the classifier routes in production, labelled by the LLM router
+            labelled = [
+                e for e in entries
+                if e.get("router_type") != "classifier" and e["route"] in classifier.routes and is_rule_ambiguous(e)
+            ]
+            print(f"\n=== Classifier vs. LLM labels on rule-ambiguous inputs "
+                  f"(rule confidence < {RULE_CONFIDENCE_THRESHOLD}, {len(labelled)} decisions) ===")
+            if labelled:
+                probs = np.array([classifier.predict_proba(e["input"]) for e in labelled])
+                label_idx = np.array([classifier.routes.index(e["route"]) for e in labelled])
+                _print_quality(quality_report(probs, label_idx, RULE_CONFIDENCE_THRESHOLD))
+            else:
+                print("  no LLM-routed decisions in the log")
+
+
+if __name__ == "__main__":
+    main()
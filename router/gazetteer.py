@@ -0,0 +1,198 @@
+"""Bundled city / country gazetteer with trie-based longest-match lookup."""
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_GAZETTEER_PATH = os.path.join(os.path.dirname(__file__), "data", "gazetteer.tsv")
+
+# Trie node key holding the place an alias ends at (no alias contains "\0")
+_END = "\0"
+
+# Rest of the Hangul run after a Korean alias
+_HANGUL_RUN = re.compile(r"[가-힣]*")
+
+# Particles and travel suffixes that may follow a Korean alias in the same
+# word; up to three may stack (부산여행을, 도쿄에서는). Longer ones come first
+# so the alternation does not stop at a prefix (이랑 before 이).
+_PARTICLES = r"에서|에는|에|으로|로|의|은|는|이랑|이|가|을|를|도|까지|부터|만|와|과|랑|하고|쪽"
+_TRAVEL_SUFFIXES = r"여행지|여행|행|시|일정|코스|투어|근교"
+_SUFFIX_RUN = re.compile(rf"(?:{_TRAVEL_SUFFIXES}|{_PARTICLES}){{0,3}}")
+# Strict aliases (trailing "!" in the TSV): nothing, or a travel suffix first
+_STRICT_SUFFIX_RUN = re.compile(rf"(?:(?:{_TRAVEL_SUFFIXES})(?:{_TRAVEL_SUFFIXES}|{_PARTICLES}){{0,2}})?")
+
+
+
+@dataclass(frozen=True)
+class Place:
+    """A gazetteer entry."""
+    name: str     # Canonical English name, e.g. "Tokyo"
+    country: str  # Country the place belongs to (the name itself for countries)
+    kind: str     # "city" or "country"
+
+    @property
+    def label(self) -> str:
+        """Display name, e.g. "Tokyo, Japan" or "Japan"."""
+        return self.name if self.kind == "country" else f"{self.name}, {self.country}"
+
+
+@dataclass(frozen=True)
+class PlaceMatch:
+    """A place name found in a text (text[start:end] is the matched alias)."""
+    start: int
+    end: int
+    place: Place
+
+
+class Gazetteer:
+    """
+    Character trie over the lowercased aliases of places.
+
+    Lookups only start at word starts and take the longest alias there, so
+    "new york city" wins over "new york", "인도네시아" over "인도", and
+    "비즈니스" never matches "니스". English aliases must also end at a word
+    boundary ("japan" does not match "japanese"). Particles attach directly
+    to Korean names ("도쿄에서", "제주도로"), so a Korean alias may be followed
+    by particles and travel suffixes within the word, but by nothing else
+    ("대만족" is not Taiwan, "대구탕" is not Daegu).
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, Place]] = ()):
+        self._root: Dict[str, dict] = {}
+        self._places: Dict[str, Place] = {}
+        self._start_pattern: Optional[re.Pattern] = None
+        for alias, place in entries:
+            self.add(alias, place)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Gazetteer":
+        """
+        Load a gazetteer TSV: kind, name, country, |-separated aliases per line.
+
+        Blank lines and lines starting with "#" are skipped.
+        """
+        gazetteer = cls()
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.rstrip("\n")
+                if not line.strip() or line.startswith("#"):
+                    continue
+                columns = line.split("\t")
+                if len(columns) != 4:
+                    raise ValueError(f"{path}:{line_no}: expected 4 tab-separated columns, got {len(columns)}")
+                kind, name, country, aliases = columns
+                place = Place(name=name, country=country, kind=kind)
+                for alias in aliases.split("|"):
+                    gazetteer.add(alias, place)
+        return gazetteer
+
+    def add(self, alias: str, place: Place) -> None:
+        """
+        Add an alias of a place (matched case-insensitively).
+
+        A trailing "!" marks a strict Korean alias: within the word it must be
+        followed by a travel suffix, not a bare particle ("전주!" matches
+        "전주 여행" and "전주행" but not "전주에").
+        """
+        alias = " ".join(alias.lower().split())
+        strict = alias.endswith("!")
+        alias = alias.rstrip("!")
+        if not alias:
+            return
+        node = self._root
+        for char in alias:
+            node = node.setdefault(char, {})
+        if alias[-1].isascii():
+            # English aliases need a word boundary after them
+            suffix_run = None
+        else:
+            suffix_run = _STRICT_SUFFIX_RUN if strict else _SUFFIX_RUN
+        node[_END] = (place, suffix_run)
+        self._places[place.label] = place
+        self._start_pattern = None
+
+    def __len__(self) -> int:
+        """Number of distinct places."""
+        return len(self._places)
+
+    def match_at(self, text: str, start: int) -> Optional[PlaceMatch]:
+        """Longest place alias of lowercased text starting at start, if any."""
+        node = self._root
+        best = None
+        i = start
+        length = len(text)
+        while i < length:
+            node = node.get(text[i])
+            if node is None:
+                break
+            i += 1
+            end = node.get(_END)
+            if end is not None:
+                place, suffix_run = end
+                if suffix_run is None:
+                    matched = i == length or not (text[i].isascii() and text[i].isalnum())
+                else:
+                    matched = suffix_run.fullmatch(_HANGUL_RUN.match(text, i).group()) is not None
+                if matched:
+                    best = PlaceMatch(start, i, place)
+        return best
+
+    def iter_matches(self, text: str) -> Iterator[PlaceMatch]:
+        """Non-overlapping place names in lowercased text, left to right."""
+        if self._start_pattern is None:
+            # Word starts with a character some alias starts with: the regex
+            # engine skips everything else without a trie walk
+            first_chars = "".join(sorted(self._root))
+            self._start_pattern = re.compile(f"(?<!\\w)[{re.escape(first_chars)}]")
+
+        next_start = 0
+        for word in self._start_pattern.finditer(text):
+            start = word.start()
+            if start < next_start:
+                continue
+            match = self.match_at(text, start)
+            if match is not None:
+                yield match
+                next_start = match.end
+
+    def find_all(self, text: str) -> List[PlaceMatch]:
+        """All non-overlapping place names in lowercased text, left to right."""
+        return list(self.iter_matches(text))
+
+    def find_destination(self, text: str) -> Optional[Place]:
+        """
+        Most specific place in lowercased text: the first city, else the first country.
+
+        ("일본 도쿄 3박4일" -> Tokyo, Japan)
+        """
+        first = None
+        for match in self.iter_matches(text):
+            if match.place.kind == "city":
+                return match.place
+            if first is None:
+                first = match.place
+        return first
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """
+    Get the shared gazetteer, compiled on first use.
+
+    GAZETTEER_PATH selects a different TSV file (default: the bundled router/data/gazetteer.tsv).
+    """
+    global _gazetteer
+
+    with _gazetteer_lock:
+        if _gazetteer is None:
+            _gazetteer = Gazetteer.from_file(os.getenv("GAZETTEER_PATH", DEFAULT_GAZETTEER_PATH))
+        return _gazetteer
+
+
+def find_destination(text: str) -> Optional[Place]:
+    """Most specific place named in text (case-insensitive), using the shared gazetteer."""
+    return get_gazetteer().find_destination(text.lower())
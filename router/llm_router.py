@@ -2,6 +2,7 @@
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
+from chains.registry import get_chain
 from .types import RouteDecision
 
 
@@ -36,7 +37,7 @@ def route_with_llm(user_input: str, llm: ChatOpenAI, parser: JsonOutputParser) -
     """
     Use LLM to route user input when rule-based router is uncertain.
     """
-    router_chain = build_llm_router(llm, parser)
+    router_chain = get_chain(llm, parser, build_llm_router)
     
     try:
         result = router_chain.invoke({"user_input": user_input})
@@ -0,0 +1,92 @@
+"""Opt-in JSONL log of routing decisions (training data for the intent classifier)."""
+import json
+import os
+import threading
+import time
+from typing import Iterator, Optional
+
+from .types import RouteDecision
+
+
+class RouteLog:
+    """
+    Append-only JSONL file of routing decisions.
+
+    One line per routed request: the raw input, the final decision, the rule
+    router's decision and the routing latency. The raw input is stored as
+    typed, so the log is opt-in (ROUTE_LOG_PATH).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def append(
+        self,
+        user_input: str,
+        decision: RouteDecision,
+        rule_decision: Optional[RouteDecision] = None,
+        latency_ms: Optional[float] = None
+    ) -> None:
+        """Append one decision (never raises: logging must not break routing)."""
+        entry = {
+            "ts": round(time.time(), 3),
+            "input": user_input,
+            "route": decision.route,
+            "router_type": decision.router_type,
+            "confidence": round(decision.confidence, 4),
+            "destination": decision.destination,
+            "latency_ms": None if latency_ms is None else round(latency_ms, 3),
+        }
+        if rule_decision is not None and rule_decision is not decision:
+            entry["rule_route"] = rule_decision.route
+            entry["rule_confidence"] = rule_decision.confidence
+        try:
+            line = json.dumps(entry, ensure_ascii=False)
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[WARN] Route log write failed: {e}")
+
+
+def read_route_log(path: str) -> Iterator[dict]:
+    """Entries of a route log (or any JSONL file with "input" and "route"), skipping malformed lines."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict) and entry.get("input") and entry.get("route"):
+                yield entry
+
+
+_route_log: Optional[RouteLog] = None
+_route_log_lock = threading.Lock()
+
+
+def get_route_log() -> Optional[RouteLog]:
+    """
+    Get the process-wide route log configured from environment variables.
+
+    - ROUTE_LOG_PATH: JSONL file to append decisions to (default: unset = no logging)
+
+    Returns:
+        Shared RouteLog, or None if disabled
+    """
+    global _route_log
+
+    path = os.getenv("ROUTE_LOG_PATH")
+    if not path:
+        return None
+
+    with _route_log_lock:
+        if _route_log is None:
+            _route_log = RouteLog(path)
+        return _route_log
@@ -1,65 +1,72 @@
 """Rule-based router for routing user input to appropriate chains."""
 import re
 from typing import List, Optional
+from .gazetteer import find_destination
 from .types import RouteDecision
 
 
+# Field and keyword patterns, compiled once at import. Only whether a pattern
+# matches somewhere matters, so each field's pattern list is folded into one
+# alternation reduced to what decides a match (e.g. r'[가-힣]*\s*일' matches
+# exactly when '일' occurs).
+# Inputs are lowercased before matching.
+FIELD_PATTERNS = {
+    # 일 / N박M일 / N night / N day
+    "duration": re.compile(r'일|\d\s*(?:night|day)'),
+    # 예산 / budget / N만원 / N천원 / N만 원
+    "budget": re.compile(r'예산|budget|\d(?:[만천]\s*|\s*[만천])원'),
+    "companions": re.compile(r'혼자|솔로|alone|solo|친구|가족|연인|부부|동행|with|family|friend'),
+    "purpose": re.compile(
+        r'휴식|관광|여행|쇼핑|맛집|카페|걷기|힐링|relax|travel|tourism|shopping|food|cafe|walking'
+    ),
+}
+
+# Destinations come from the gazetteer (router/data/gazetteer.tsv). Places it
+# does not know only leave a weak hint: a Korean word ending in 시 / 도 / 군
+# (강화군, 울진시), which is also true of plenty of other words (다시, 하루도).
+WEAK_DESTINATION_PATTERN = re.compile(r'(?<=[가-힣])[시도군](?![가-힣])')
+
+# Explicit "candidates only" request (후보만 / 여행지 후보 / 추천 후보 all contain 후보)
+CANDIDATES_PATTERN = re.compile(r'후보|candidates|options')
+
+# Explicit itinerary request
+ITINERARY_PATTERN = re.compile(r'일정|코스|스케줄|itinerary|schedule|plan')
+
+
+def _detect_fields(user_lower: str) -> dict:
+    """Detected fields (other than destination) of lowercased input."""
+    return {field: pattern.search(user_lower) is not None for field, pattern in FIELD_PATTERNS.items()}
+
+
+def _missing_fields(detected: dict) -> List[str]:
+    """Korean labels of the key fields not detected."""
+    missing_fields = []
+    if not detected["duration"]:
+        missing_fields.append("기간")
+    if not detected["budget"]:
+        missing_fields.append("예산")
+    if not detected["companions"]:
+        missing_fields.append("동행")
+    if not detected["purpose"]:
+        missing_fields.append("목적")
+    return missing_fields
+
+
+def detect_missing_fields(user_input: str) -> List[str]:
+    """Key fields (기간 / 예산 / 동행 / 목적) the input does not mention."""
+    return _missing_fields(_detect_fields(user_input.lower()))
+
+
 def extract_keywords(user_input: str) -> dict:
     """
     Extract key information from user input.
     Returns dict with detected fields.
     """
     user_lower = user_input.lower()
-    
-    detected = {
-        "duration": False,
-        "budget": False,
-        "companions": False,
-        "purpose": False,
-        "destination": False,
-    }
-    
-    # Duration detection
-    duration_patterns = [
-        r'\d+\s*일', r'\d+\s*박\s*\d+\s*일', r'\d+\s*night', r'\d+\s*day',
-        r'[가-힣]*\s*박\s*[가-힣]*\s*일', r'[가-힣]*\s*일'
-    ]
-    if any(re.search(pattern, user_lower) for pattern in duration_patterns):
-        detected["duration"] = True
-    
-    # Budget detection
-    budget_patterns = [
-        r'\d+[만천]\s*원', r'\d+\s*만원', r'\d+\s*천원', r'budget', r'예산',
-        r'\d+[만천]\s*원\s*[이하이상]?', r'[가-힣]*\s*예산'
-    ]
-    if any(re.search(pattern, user_lower) for pattern in budget_patterns):
-        detected["budget"] = True
-    
-    # Companions detection
-    companion_patterns = [
-        r'혼자', r'솔로', r'혼자서', r'alone', r'solo',
-        r'친구', r'가족', r'연인', r'부부', r'동행', r'with', r'family', r'friend'
-    ]
-    if any(re.search(pattern, user_lower) for pattern in companion_patterns):
-        detected["companions"] = True
-    
-    # Purpose detection
-    purpose_patterns = [
-        r'휴식', r'관광', r'여행', r'쇼핑', r'맛집', r'카페', r'걷기', r'힐링',
-        r'relax', r'travel', r'tourism', r'shopping', r'food', r'cafe', r'walking'
-    ]
-    if any(re.search(pattern, user_lower) for pattern in purpose_patterns):
-        detected["purpose"] = True
-    
-    # Destination detection (specific place names)
-    destination_patterns = [
-        r'[가-힣]+[시도]', r'[가-힣]+[국가]', r'[A-Z][a-z]+\s*[A-Z]?[a-z]*',  # City names
-        r'도쿄', r'오사카', r'파리', r'런던', r'뉴욕', r'서울', r'부산',
-        r'tokyo', r'osaka', r'paris', r'london', r'new york', r'seoul'
-    ]
-    if any(re.search(pattern, user_lower) for pattern in destination_patterns):
-        detected["destination"] = True
-    
+    detected = _detect_fields(user_lower)
+    detected["destination"] = (
+        find_destination(user_lower) is not None or WEAK_DESTINATION_PATTERN.search(user_lower) is not None
+    )
     return detected
 
 
@@ -70,11 +77,16 @@ def route_user_input(user_input: str) -> RouteDecision:
     Rules:
     - clarify: Less than 2 key fields detected
     - candidates_only: Keywords like "후보만", "여행지 후보"
-    - itinerary_only: Keywords like "일정", "코스", "3박4일" + destination hint
+    - itinerary_only: Keywords like "일정", "코스", "3박4일" + destination
+      (a gazetteer place; a weak hint only gets low confidence, so the LLM router confirms)
     - full: Default case
+
+    The destination found in the gazetteer is attached to every decision.
     """
     user_lower = user_input.lower()
-    detected = extract_keywords(user_input)
+    detected = _detect_fields(user_lower)
+    place = find_destination(user_lower)
+    destination = place.label if place else None
     
     # Count detected fields
     field_count = sum([
@@ -86,45 +98,46 @@ def route_user_input(user_input: str) -> RouteDecision:
     
     # Rule 1: Clarify - insufficient information
     if field_count <= 2:
-        missing_fields = []
-        if not detected["duration"]:
-            missing_fields.append("기간")
-        if not detected["budget"]:
-            missing_fields.append("예산")
-        if not detected["companions"]:
-            missing_fields.append("동행")
-        if not detected["purpose"]:
-            missing_fields.append("목적")
-        
         return RouteDecision(
             route="clarify",
             reason=f"조건 부족 (감지된 필드: {field_count}개)",
             confidence=0.9,
-            missing_fields=missing_fields,
-            router_type="rule"
+            missing_fields=_missing_fields(detected),
+            router_type="rule",
+            destination=destination
         )
     
     # Rule 2: Candidates only - explicit request for candidates
-    candidates_keywords = ["후보만", "후보", "여행지 후보", "추천 후보", "candidates", "options"]
-    if any(keyword in user_lower for keyword in candidates_keywords):
+    if CANDIDATES_PATTERN.search(user_lower):
         return RouteDecision(
             route="candidates_only",
             reason="후보만 요청 키워드 감지",
             confidence=0.95,
             missing_fields=[],
-            router_type="rule"
+            router_type="rule",
+            destination=destination
         )
     
     # Rule 3: Itinerary only - explicit request for itinerary with destination
-    itinerary_keywords = ["일정", "코스", "스케줄", "itinerary", "schedule", "plan"]
-    has_itinerary_keyword = any(keyword in user_lower for keyword in itinerary_keywords)
+    has_itinerary_keyword = ITINERARY_PATTERN.search(user_lower) is not None
     
-    if has_itinerary_keyword and detected["destination"]:
+    if has_itinerary_keyword and place is not None:
         return RouteDecision(
             route="itinerary_only",
-            reason="일정 요청 + 목적지 명시",
+            reason=f"일정 요청 + 목적지 명시 ({place.name})",
             confidence=0.9,
             missing_fields=[],
+            router_type="rule",
+            destination=destination
+        )
+    
+    if has_itinerary_keyword and WEAK_DESTINATION_PATTERN.search(user_lower):
+        # Possibly a place the gazetteer does not know: below the LLM router threshold
+        return RouteDecision(
+            route="itinerary_only",
+            reason="일정 요청 + 목적지 추정 (지명 사전에 없음)",
+            confidence=0.6,
+            missing_fields=[],
             router_type="rule"
         )
     
@@ -134,5 +147,6 @@ def route_user_input(user_input: str) -> RouteDecision:
         reason="충분한 조건 + 전체 추천 요청",
         confidence=0.85,
         missing_fields=[],
-        router_type="rule"
+        router_type="rule",
+        destination=destination
     )
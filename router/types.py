@@ -10,6 +10,7 @@ class RouteDecision(BaseModel):
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score (0.0-1.0)")
     missing_fields: List[str] = Field(default_factory=list, description="Missing fields that need clarification")
     router_type: str = Field(default="rule", description="Router type: 'rule' or 'llm'")
+    destination: Optional[str] = Field(default=None, description="Destination named in the input, e.g. 'Tokyo, Japan' (rule router gazetteer match)")
 
 
 class RouteResult(BaseModel):
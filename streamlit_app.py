@@ -1,5 +1,7 @@
 import os
 import json
+import time
+from typing import Dict, Optional, Tuple
 import streamlit as st
 import pandas as pd
 from dotenv import load_dotenv
@@ -7,14 +9,22 @@ from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.runnables import RunnableLambda
+from langchain_core.globals import set_llm_cache
 
 from router.rules import route_user_input
+from router.classifier import get_intent_classifier, route_with_classifier
 from router.llm_router import route_with_llm
+from router.route_log import get_route_log
 from router.types import RouteDecision, RouteResult
-from chains.full_chain import build_full_chain, run_full_chain, build_full_chain_v2, run_full_chain_v2, safe_json
+from chains.registry import get_chain_registry
+from chains.llm_cache import get_llm_cache
+from chains.concurrency import get_validator_limiter
+from tools.search_provider import get_search_provider
+from chains.full_chain import build_full_chain, run_full_chain, build_full_chain_v2, run_full_chain_v2, stream_full_chain_v2, safe_json
 from chains.clarify import build_clarify_chain, run_clarify_chain
 from chains.itinerary_only import build_itinerary_only_chain, run_itinerary_only_chain
 from chains.candidates_only import build_candidates_only_chain, run_candidates_only_chain
+from chains.profile import SpeculativeProfile, build_profile_chain, start_speculative_profile
 from observability.langsmith import trace_router_decision, generate_request_id
 try:
     from langsmith import traceable
@@ -30,6 +40,13 @@ def run_rule_router(input_text: str) -> RouteDecision:
     """Rule-based router."""
     return route_user_input(input_text)
 
+def run_classifier_router(input_text: str) -> Optional[RouteDecision]:
+    """Local intent classifier router (None if no model is trained)."""
+    classifier = get_intent_classifier()
+    if classifier is None:
+        return None
+    return route_with_classifier(input_text, classifier)
+
 def run_llm_router(input_text: str, llm_instance: ChatOpenAI, parser_instance: JsonOutputParser) -> RouteDecision:
     """LLM-based router."""
     return route_with_llm(input_text, llm_instance, parser_instance)
@@ -90,15 +107,74 @@ os.environ["OPENAI_API_KEY"] = OPENAI_API_KEY
 model_name = st.sidebar.selectbox("LLM 모델", ["gpt-4o-mini", "gpt-4.1-mini"], index=0)
 temperature = st.sidebar.slider("temperature", 0.0, 1.0, 0.4, 0.05)
 
-llm = ChatOpenAI(model=model_name, temperature=temperature)
-parser = JsonOutputParser()
+# LLM 응답 캐시 (LRU + SQLite, LLM_CACHE_* 환경변수로 설정)
+llm_cache = get_llm_cache()
+set_llm_cache(llm_cache)
+if llm_cache is not None:
+    cache_stats = llm_cache.stats()
+    st.sidebar.caption(
+        f"LLM 캐시: hit {cache_stats['hits']} / miss {cache_stats['misses']} "
+        f"({cache_stats['hit_rate']:.0%}), {cache_stats['disk_entries']}개 저장"
+    )
+
+# 검색 provider (SEARCH_PROVIDER=google_cse | local)
+cse_client = get_search_provider()
+if cse_client is not None and cse_client.name == "local_index":
+    index_stats = cse_client.stats()
+    st.sidebar.caption(
+        f"로컬 검색 인덱스: passage {index_stats['documents']}개 "
+        f"({', '.join(f'{name} {count}' for name, count in index_stats['collections'].items())}), "
+        f"검색 {index_stats['searches']}회"
+    )
 
-# Chains 초기화
-full_chain_v2 = build_full_chain_v2(llm, parser)  # Use v2 with validators
-full_chain = build_full_chain(llm, parser)  # Keep v1 for fallback
-clarify_chain = build_clarify_chain(llm, parser)
-itinerary_only_chain = build_itinerary_only_chain(llm, parser)
-candidates_only_chain = build_candidates_only_chain(llm, parser)
+# 검색 결과 캐시 (SQLite, PSE별 TTL, SEARCH_CACHE_* 환경변수로 설정)
+if cse_client is not None and cse_client.cache is not None:
+    search_stats = cse_client.cache.stats()
+    st.sidebar.caption(
+        f"검색 캐시: hit {search_stats['hits']} (stale {search_stats['stale_hits']}) / miss {search_stats['misses']} "
+        f"({search_stats['hit_rate']:.0%}), {search_stats['entries']}개 저장"
+    )
+if cse_client is not None and cse_client.quota is not None:
+    quota_stats = cse_client.quota.stats(cse_client.api_key)
+    st.sidebar.caption(
+        f"CSE 할당량: 오늘 {quota_stats['daily_used']} / {quota_stats['daily_budget']}회 사용 "
+        f"(부족 시 LLM-only 검증으로 전환)"
+    )
+if cse_client is not None and cse_client.breaker is not None:
+    breaker_stats = cse_client.breaker.stats()
+    if breaker_stats["state"] != "closed":
+        st.sidebar.caption(
+            f"⚠️ 검색 circuit {breaker_stats['state']} - LLM-only 검증 사용 중 "
+            f"(재시도까지 {breaker_stats['retry_in_s']:.0f}초)"
+        )
+
+# 라우터 로컬 분류기 (python -m router.classifier train 으로 학습, ROUTER_CLASSIFIER_* 환경변수로 설정)
+intent_classifier = get_intent_classifier()
+if intent_classifier is not None and intent_classifier.report:
+    classifier_report = intent_classifier.report
+    st.sidebar.caption(
+        f"라우터 분류기: 학습 {classifier_report['examples']}건, 정확도 {classifier_report['accuracy']:.0%}, "
+        f"ECE {classifier_report['ece']:.3f} (LLM 라우터 앞 단계)"
+    )
+
+# Validator 동시 실행 한도 (AIMD, 429/지연에 따라 자동 조절)
+limiter_metrics = get_validator_limiter().metrics()
+st.sidebar.caption(
+    f"Validator 동시 실행: 한도 {limiter_metrics['limit']}, 대기 {limiter_metrics['queue_depth']}, "
+    f"429 {limiter_metrics['rate_limited']}회"
+)
+
+# Chains 초기화 (모델/temperature별로 한 번만 빌드되어 모든 세션과 rerun이 공유)
+chain_registry = get_chain_registry(model_name, temperature)
+llm = chain_registry.llm
+parser = chain_registry.parser
+
+full_chain_v2 = chain_registry.get(build_full_chain_v2, pipeline_candidates=True)  # Use v2 with validators
+full_chain = chain_registry.get(build_full_chain)  # Keep v1 for fallback
+clarify_chain = chain_registry.get(build_clarify_chain)
+itinerary_only_chain = chain_registry.get(build_itinerary_only_chain)
+candidates_only_chain = chain_registry.get(build_candidates_only_chain)
+profile_chain = chain_registry.get(build_profile_chain)  # STEP 1 started speculatively during LLM routing
 
 # ====== UI ======
 left, right = st.columns([1, 1])
@@ -113,16 +189,17 @@ with left:
 with right:
     st.subheader("2) 체이닝 결과")
 
-def execute_route(route_decision: RouteDecision, user_input: str) -> RouteResult:
+def execute_route(route_decision: RouteDecision, user_input: str, profile: Optional[Dict] = None) -> RouteResult:
     """
     Execute chain based on route decision.
+    profile: STEP 1 result extracted during routing (full / candidates_only skip STEP 1).
     """
     route = route_decision.route
     
     if route == "full":
         # Full v2 chain (5-step with validators)
         print(f"[DEBUG] Running Full Chain v2 with validators...")
-        result_data = run_full_chain_v2(full_chain_v2, user_input)
+        result_data = run_full_chain_v2(full_chain_v2, user_input, profile)
         
         # Debug: Check if v2 structure
         is_v2 = "validators_results" in result_data and "aggregation" in result_data
@@ -147,7 +224,7 @@ def execute_route(route_decision: RouteDecision, user_input: str) -> RouteResult
         )
     elif route == "candidates_only":
         # Candidates only chain
-        result_data = run_candidates_only_chain(candidates_only_chain, user_input)
+        result_data = run_candidates_only_chain(candidates_only_chain, user_input, profile)
         return RouteResult(
             route=route,
             router_reason=route_decision.reason,
@@ -171,6 +248,51 @@ def execute_route(route_decision: RouteDecision, user_input: str) -> RouteResult
         )
 
 
+def route_input(
+    user_input: str,
+    llm_instance: ChatOpenAI,
+    parser_instance: JsonOutputParser
+) -> Tuple[RouteDecision, Optional[SpeculativeProfile]]:
+    """
+    Decide the route: rule router first, then the local classifier, and the
+    LLM router only if both are unsure (confidence < 0.7).
+    
+    While the LLM router runs, STEP 1 (profile) is started speculatively:
+    full and candidates_only both begin with it. The returned
+    SpeculativeProfile (None if the LLM router was not needed) must be
+    resolved with the final route.
+    """
+    speculative_profile = None
+    start = time.perf_counter()
+
+    # Step 1: Rule-based routing
+    rule_decision = run_rule_router(user_input)
+    route_decision = rule_decision
+    
+    # Step 2: Local classifier, then LLM router fallback if confidence is still low
+    if route_decision.confidence < 0.7:
+        classifier_decision = run_classifier_router(user_input)
+        if classifier_decision is not None and classifier_decision.confidence >= 0.7:
+            route_decision = classifier_decision
+        else:
+            speculative_profile = start_speculative_profile(profile_chain, user_input)
+            route_decision = run_llm_router(user_input, llm_instance, parser_instance)
+    
+    # Opt-in training data / latency log for the classifier (ROUTE_LOG_PATH)
+    route_log = get_route_log()
+    if route_log is not None:
+        route_log.append(user_input, route_decision, rule_decision, (time.perf_counter() - start) * 1000)
+    
+    return route_decision, speculative_profile
+
+
+def resolve_profile(route_decision: RouteDecision, speculative_profile: Optional[SpeculativeProfile]) -> Optional[Dict]:
+    """Speculative profile if the route starts with STEP 1; otherwise it is cancelled."""
+    if speculative_profile is None:
+        return None
+    return speculative_profile.resolve(route_decision.route)
+
+
 @traceable(
     name="travel_guide_router_chain",
     run_type="chain"
@@ -183,38 +305,53 @@ def run_router_and_chain(user_input: str, llm_instance: ChatOpenAI, parser_insta
     All steps (routing, decision, chain execution) are executed within this single trace,
     creating a cohesive view in LangSmith.
     """
-    # Step 1: Rule-based routing
-    route_decision = run_rule_router(user_input)
-    
-    # Step 2: LLM router fallback if confidence is low
-    if route_decision.confidence < 0.7:
-        route_decision = run_llm_router(user_input, llm_instance, parser_instance)
+    # Step 1-2: Rule router → local classifier → LLM router fallback (+ speculative profile)
+    route_decision, speculative_profile = route_input(user_input, llm_instance, parser_instance)
     
     # Step 3: Generate router decision metadata
     router_metadata = trace_router_decision(route_decision, user_input)
     
     # Step 4: Execute route (chain execution happens here)
-    route_result = execute_route(route_decision, user_input)
+    route_result = execute_route(route_decision, user_input, resolve_profile(route_decision, speculative_profile))
     
     # Add metadata to the trace
     return route_result
 
-if run:
-    if not user_input.strip():
-        st.warning("여행 조건을 입력해줘.")
-        st.stop()
 
-    with st.spinner("라우팅 및 체이닝 실행 중..."):
-        try:
-            # Unified router and chain execution as single traceable sequence
-            route_result = run_router_and_chain(user_input, llm, parser)
-            
-        except Exception as e:
-            st.error("실행 중 오류가 났어. (JSON 파싱/모델 응답 형식 문제일 가능성이 큼)")
-            st.exception(e)
-            st.stop()
+@traceable(
+    name="travel_guide_router_chain",
+    run_type="chain"
+)
+def stream_router_and_chain(user_input: str, llm_instance: ChatOpenAI, parser_instance: JsonOutputParser):
+    """
+    Streaming variant of run_router_and_chain (same unified trace).
+    
+    Yields ("route", RouteDecision) first. The full route then yields every
+    step event of stream_full_chain_v2 as it completes; all routes finish
+    with ("result", RouteResult).
+    """
+    route_decision, speculative_profile = route_input(user_input, llm_instance, parser_instance)
+    router_metadata = trace_router_decision(route_decision, user_input)
+    yield "route", route_decision
+    profile = resolve_profile(route_decision, speculative_profile)
+    
+    if route_decision.route == "full":
+        for event, payload in stream_full_chain_v2(full_chain_v2, user_input, profile):
+            if event == "done":
+                yield "result", RouteResult(
+                    route="full",
+                    router_reason=route_decision.reason,
+                    data=payload
+                )
+            else:
+                yield event, payload
+    else:
+        yield "result", execute_route(route_decision, user_input, profile)
+
 
-    # Display route info
+# ====== Rendering ======
+def render_route_badge(route: str, reason: str):
+    """Render selected route and router reason."""
     route_badge_color = {
         "full": "🟢",
         "clarify": "🟡",
@@ -227,256 +364,283 @@ if run:
         "candidates_only": "후보만",
         "itinerary_only": "일정만"
     }
-    st.markdown(f"**선택된 라우트:** {route_badge_color.get(route_result.route, '⚪')} `{route_labels.get(route_result.route, route_result.route)}` | **이유:** {route_result.router_reason}")
+    st.markdown(f"**선택된 라우트:** {route_badge_color.get(route, '⚪')} `{route_labels.get(route, route)}` | **이유:** {reason}")
 
-    # Route별 결과 렌더링
-    if route_result.route == "full":
-        data = route_result.data
-        
-        # Check if v2 data structure (has validators_results and aggregation)
-        is_v2 = "validators_results" in data and "aggregation" in data
+
+def render_full_status(data: dict):
+    """Render version info for a completed full route."""
+    # Check if v2 data structure (has validators_results and aggregation)
+    is_v2 = "validators_results" in data and "aggregation" in data
+    
+    # Check if web-grounded (has citations in validator results)
+    has_citations = False
+    if is_v2:
+        validators_results = data.get("validators_results", [])
+        for result in validators_results:
+            if result.get("citations"):
+                has_citations = True
+                break
+    
+    # Display version info
+    if is_v2:
+        if has_citations:
+            st.success("✅ 완료! (Travel Concierge v2 Web-Grounded - 검색 기반 검증)")
+            st.info(f"🔍 검증 완료: {len(data.get('validators_results', []))}개 검증 결과 (웹 검색 기반), Aggregation 완료")
+        else:
+            st.success("✅ 완료! (Travel Concierge v2 - Validators 실행됨)")
+            st.info(f"🔍 검증 완료: {len(data.get('validators_results', []))}개 검증 결과, Aggregation 완료")
+    else:
+        st.warning("⚠️ v1 구조로 실행됨 (validators_results 또는 aggregation 없음)")
+        st.success("완료!")
+
+
+def render_profile_step(profile: dict):
+    """STEP 1 rendering."""
+    with st.expander("STEP 1) 여행자 프로필", expanded=False):
+        st.code(safe_json(profile), language="json")
+
+
+def render_candidates_step(candidates):
+    """STEP 2 rendering."""
+    with st.expander("STEP 2) 후보 5곳", expanded=False):
+        st.code(safe_json(candidates), language="json")
+
+
+def render_validator_summary_table(validators_results: list, candidates: list):
+    """Render per-candidate validator summary table."""
+    # Group by candidate
+    by_candidate = {}
+    for result in validators_results:
+        candidate_id = result.get("candidate_id", "unknown")
+        if candidate_id not in by_candidate:
+            by_candidate[candidate_id] = []
+        by_candidate[candidate_id].append(result)
+    
+    # Display validator summary table
+    if by_candidate:
+        st.write("**후보별 검증 요약**")
         
-        # Check if web-grounded (has citations in validator results)
-        has_citations = False
-        if is_v2:
-            validators_results = data.get("validators_results", [])
-            for result in validators_results:
-                if result.get("citations"):
-                    has_citations = True
-                    break
+        summary_data = []
+        for candidate_id, results in by_candidate.items():
+            candidate_name = next(
+                (c.get("name", candidate_id) for c in candidates
+                 if f"C{candidates.index(c)+1}" == candidate_id),
+                candidate_id
+            )
+            row = {"후보": candidate_name}
+            for result in results:
+                validator_name = result.get("validator", "unknown")
+                score = result.get("score", 0.0)
+                verdict = result.get("verdict", "fail")
+                row[validator_name] = f"{score:.2f} ({verdict})"
+            summary_data.append(row)
         
-        # Display version info
-        if is_v2:
-            if has_citations:
-                st.success("✅ 완료! (Travel Concierge v2 Web-Grounded - 검색 기반 검증)")
-                st.info(f"🔍 검증 완료: {len(data.get('validators_results', []))}개 검증 결과 (웹 검색 기반), Aggregation 완료")
-            else:
-                st.success("✅ 완료! (Travel Concierge v2 - Validators 실행됨)")
-                st.info(f"🔍 검증 완료: {len(data.get('validators_results', []))}개 검증 결과, Aggregation 완료")
-        else:
-            st.warning("⚠️ v1 구조로 실행됨 (validators_results 또는 aggregation 없음)")
-            st.success("완료!")
+        if summary_data:
+            df = pd.DataFrame(summary_data)
+            st.dataframe(df, use_container_width=True)
+
+
+def render_validators_progress(validators_results: list, candidates: list):
+    """STEP 3 rendering while validators are still running."""
+    with st.expander(f"STEP 3) 검증 진행 중... ({len(validators_results)}개 완료)", expanded=False):
+        render_validator_summary_table(validators_results, candidates)
+
+
+def render_validators_step(validators_results: list, candidates: list):
+    """STEP 3 rendering."""
+    with st.expander("STEP 3) 검증 결과 (Parallel Validators)", expanded=False):
+        render_validator_summary_table(validators_results, candidates)
         
-        with st.expander("STEP 1) 여행자 프로필", expanded=False):
-            st.code(safe_json(data["profile"]), language="json")
+        # Detailed results with citations
+        st.write("**상세 검증 결과**")
         
-        with st.expander("STEP 2) 후보 5곳", expanded=False):
-            st.code(safe_json(data["candidates"]), language="json")
+        # Group by validator and show citations
+        by_validator = {}
+        for result in validators_results:
+            validator_name = result.get("validator", "unknown")
+            if validator_name not in by_validator:
+                by_validator[validator_name] = []
+            by_validator[validator_name].append(result)
         
-        if is_v2:
-            # STEP 3: Validators Results
-            with st.expander("STEP 3) 검증 결과 (Parallel Validators)", expanded=False):
-                validators_results = data.get("validators_results", [])
+        # Display validator results with citations
+        for validator_name, results in by_validator.items():
+            st.markdown(f"#### {validator_name} 검증 결과")
+            for result in results:
+                candidate_id = result.get("candidate_id", "unknown")
+                score = result.get("score", 0.0)
+                verdict = result.get("verdict", "fail")
                 
-                # Group by candidate
-                by_candidate = {}
-                for result in validators_results:
-                    candidate_id = result.get("candidate_id", "unknown")
-                    if candidate_id not in by_candidate:
-                        by_candidate[candidate_id] = []
-                    by_candidate[candidate_id].append(result)
+                st.write(f"**{candidate_id}**: 점수 {score:.2f} ({verdict})")
+                if result.get("reasons"):
+                    st.write("**이유:**")
+                    for reason in result.get("reasons", [])[:2]:
+                        st.write(f"  • {reason}")
                 
-                # Display validator summary table
-                if by_candidate:
-                    st.write("**후보별 검증 요약**")
-                    
-                    summary_data = []
-                    for candidate_id, results in by_candidate.items():
-                        candidate_name = next(
-                            (c.get("name", candidate_id) for c in data.get("candidates", []) 
-                             if f"C{data.get('candidates', []).index(c)+1}" == candidate_id),
-                            candidate_id
-                        )
-                        row = {"후보": candidate_name}
-                        for result in results:
-                            validator_name = result.get("validator", "unknown")
-                            score = result.get("score", 0.0)
-                            verdict = result.get("verdict", "fail")
-                            row[validator_name] = f"{score:.2f} ({verdict})"
-                        summary_data.append(row)
+                # Show citations if available
+                citations = result.get("citations", [])
+                if citations:
+                    st.write("**출처 (Citations):**")
+                    for i, cite in enumerate(citations[:3], 1):
+                        st.write(f"{i}. [{cite.get('title', 'No title')}]({cite.get('url', '#')})")
+                        if cite.get("snippet"):
+                            st.caption(cite.get("snippet", "")[:150] + "...")
+            st.divider()
+        
+        # Full JSON
+        st.write("**전체 Validators JSON**")
+        st.code(safe_json(validators_results), language="json")
+
+
+def render_evidence_summary(evidence_summary: list, title: str):
+    """Render evidence summary (citations) grouped by axis."""
+    if evidence_summary:
+        st.write(title)
+        for evidence in evidence_summary:
+            axis = evidence.get("axis", "unknown")
+            sources = evidence.get("sources", [])
+            if sources:
+                st.write(f"**{axis}**:")
+                for source in sources[:3]:
+                    st.write(f"  • [{source}]({source})")
+
+
+def render_aggregation_step(aggregation: dict):
+    """STEP 4 rendering."""
+    with st.expander("STEP 4) 검증 결과 종합 (Aggregator)", expanded=True):
+        # Display ranked candidates
+        ranked = aggregation.get("ranked_candidates", [])
+        if ranked:
+            st.write("**순위별 후보**")
+            for i, candidate in enumerate(ranked[:3], 1):  # Top 3
+                with st.container():
+                    st.markdown(f"### {i}. {candidate.get('name', 'Unknown')} (점수: {candidate.get('total_score', 0):.2f})")
+                    st.write(f"**요약:** {candidate.get('summary', '')}")
                     
-                    if summary_data:
-                        df = pd.DataFrame(summary_data)
-                        st.dataframe(df, use_container_width=True)
-                
-                # Detailed results with citations
-                st.write("**상세 검증 결과**")
-                
-                # Group by validator and show citations
-                by_validator = {}
-                for result in validators_results:
-                    validator_name = result.get("validator", "unknown")
-                    if validator_name not in by_validator:
-                        by_validator[validator_name] = []
-                    by_validator[validator_name].append(result)
-                
-                # Display validator results with citations
-                for validator_name, results in by_validator.items():
-                    st.markdown(f"#### {validator_name} 검증 결과")
-                    for result in results:
-                        candidate_id = result.get("candidate_id", "unknown")
-                        score = result.get("score", 0.0)
-                        verdict = result.get("verdict", "fail")
-                        
-                        st.write(f"**{candidate_id}**: 점수 {score:.2f} ({verdict})")
-                        if result.get("reasons"):
-                            st.write("**이유:**")
-                            for reason in result.get("reasons", [])[:2]:
-                                st.write(f"  • {reason}")
-                        
-                        # Show citations if available
-                        citations = result.get("citations", [])
-                        if citations:
-                            st.write("**출처 (Citations):**")
-                            for i, cite in enumerate(citations[:3], 1):
-                                st.write(f"{i}. [{cite.get('title', 'No title')}]({cite.get('url', '#')})")
-                                if cite.get("snippet"):
-                                    st.caption(cite.get("snippet", "")[:150] + "...")
-                    st.divider()
-                
-                # Full JSON
-                st.write("**전체 Validators JSON**")
-                st.code(safe_json(validators_results), language="json")
-            
-            # STEP 4: Aggregation
-            with st.expander("STEP 4) 검증 결과 종합 (Aggregator)", expanded=True):
-                aggregation = data.get("aggregation", {})
-                
-                # Display ranked candidates
-                ranked = aggregation.get("ranked_candidates", [])
-                if ranked:
-                    st.write("**순위별 후보**")
-                    for i, candidate in enumerate(ranked[:3], 1):  # Top 3
-                        with st.container():
-                            st.markdown(f"### {i}. {candidate.get('name', 'Unknown')} (점수: {candidate.get('total_score', 0):.2f})")
-                            st.write(f"**요약:** {candidate.get('summary', '')}")
-                            
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                if candidate.get("strengths"):
-                                    st.write("**강점:**")
-                                    for strength in candidate.get("strengths", [])[:3]:
-                                        st.write(f"✅ {strength}")
-                            with col2:
-                                if candidate.get("risks"):
-                                    st.write("**리스크:**")
-                                    for risk in candidate.get("risks", [])[:3]:
-                                        st.write(f"⚠️ {risk}")
-                            
-                            if candidate.get("watchouts"):
-                                st.write("**주의사항:**")
-                                for watchout in candidate.get("watchouts", [])[:2]:
-                                    st.write(f"🔔 {watchout}")
-                            st.divider()
-                
-                # Final choice
-                final_choice = aggregation.get("final_choice", {})
-                if final_choice:
-                    st.write("**최종 선택**")
-                    st.markdown(f"### 🏆 {final_choice.get('name', 'Unknown')}")
-                    if final_choice.get("why"):
-                        st.write("**선택 이유:**")
-                        for reason in final_choice.get("why", []):
-                            st.write(f"• {reason}")
-                    if final_choice.get("what_to_confirm"):
-                        st.write("**확인 필요 사항:**")
-                        for confirm in final_choice.get("what_to_confirm", []):
-                            st.write(f"❓ {confirm}")
-                
-                # Evidence summary (citations)
-                evidence_summary = aggregation.get("evidence_summary", [])
-                if evidence_summary:
-                    st.write("**검증 근거 출처 (Evidence Summary)**")
-                    for evidence in evidence_summary:
-                        axis = evidence.get("axis", "unknown")
-                        sources = evidence.get("sources", [])
-                        if sources:
-                            st.write(f"**{axis}**:")
-                            for source in sources[:3]:
-                                st.write(f"  • [{source}]({source})")
-                
-                # Disclaimer
-                if aggregation.get("disclaimer"):
-                    st.info(aggregation.get("disclaimer"))
-                
-                # Full JSON (expander 중첩 방지를 위해 일반 코드 블록 사용)
-                st.write("**전체 Aggregation JSON:**")
-                st.code(safe_json(aggregation), language="json")
-            
-            # STEP 5: Final Recommendation
-            with st.expander("STEP 5) 최종 추천 + 3박4일 일정", expanded=True):
-                final = data.get("final", {})
-                
-                # Winner
-                winner = final.get("winner", {})
-                if winner:
-                    st.markdown(f"### 🎯 추천 여행지: {winner.get('name', 'Unknown')}")
-                    if winner.get("why"):
-                        st.write("**추천 이유:**")
-                        for reason in winner.get("why", []):
-                            st.write(f"• {reason}")
-                    if winner.get("best_area_to_stay"):
-                        st.write(f"**추천 숙박 지역:** {winner.get('best_area_to_stay')}")
-                    if winner.get("budget_tip"):
-                        st.write(f"**예산 팁:** {winner.get('budget_tip')}")
-                
-                # Validation summary
-                validation_summary = final.get("validation_summary", {})
-                if validation_summary:
-                    st.write("**검증 근거 요약**")
                     col1, col2 = st.columns(2)
                     with col1:
-                        if validation_summary.get("key_strengths"):
-                            st.write("**핵심 강점:**")
-                            for strength in validation_summary.get("key_strengths", [])[:3]:
+                        if candidate.get("strengths"):
+                            st.write("**강점:**")
+                            for strength in candidate.get("strengths", [])[:3]:
                                 st.write(f"✅ {strength}")
                     with col2:
-                        if validation_summary.get("key_risks"):
-                            st.write("**핵심 리스크:**")
-                            for risk in validation_summary.get("key_risks", [])[:3]:
+                        if candidate.get("risks"):
+                            st.write("**리스크:**")
+                            for risk in candidate.get("risks", [])[:3]:
                                 st.write(f"⚠️ {risk}")
                     
-                    if validation_summary.get("watchouts"):
+                    if candidate.get("watchouts"):
                         st.write("**주의사항:**")
-                        for watchout in validation_summary.get("watchouts", [])[:3]:
+                        for watchout in candidate.get("watchouts", [])[:2]:
                             st.write(f"🔔 {watchout}")
-                
-                # Show evidence summary from aggregation if available
-                aggregation = data.get("aggregation", {})
-                evidence_summary = aggregation.get("evidence_summary", [])
-                if evidence_summary:
-                    st.write("**검증 출처 (Citations)**")
-                    for evidence in evidence_summary:
-                        axis = evidence.get("axis", "unknown")
-                        sources = evidence.get("sources", [])
-                        if sources:
-                            st.write(f"**{axis}**:")
-                            for source in sources[:3]:
-                                st.write(f"  • [{source}]({source})")
-                
-                # Itinerary
-                itinerary = final.get("itinerary", [])
-                if itinerary:
-                    st.write("**3박 4일 일정**")
-                    for day_info in itinerary:
-                        day = day_info.get("day", 0)
-                        st.write(f"**Day {day}**")
-                        if day_info.get("morning"):
-                            st.write(f"  🌅 오전: {day_info['morning']}")
-                        if day_info.get("afternoon"):
-                            st.write(f"  ☀️ 오후: {day_info['afternoon']}")
-                        if day_info.get("evening"):
-                            st.write(f"  🌙 저녁: {day_info['evening']}")
-                
-                # Full JSON (expander 중첩 방지를 위해 일반 코드 블록 사용)
-                st.write("**전체 Final JSON:**")
-                st.code(safe_json(final), language="json")
-        else:
-            # Fallback to v1 display
-            with st.expander("STEP 3) 비교표", expanded=False):
-                st.code(safe_json(data.get("comparison", {})), language="json")
-            with st.expander("STEP 4) 최종 추천 + 3박4일 일정", expanded=True):
-                st.code(safe_json(data.get("final", {})), language="json")
+                    st.divider()
+        
+        # Final choice
+        final_choice = aggregation.get("final_choice", {})
+        if final_choice:
+            st.write("**최종 선택**")
+            st.markdown(f"### 🏆 {final_choice.get('name', 'Unknown')}")
+            if final_choice.get("why"):
+                st.write("**선택 이유:**")
+                for reason in final_choice.get("why", []):
+                    st.write(f"• {reason}")
+            if final_choice.get("what_to_confirm"):
+                st.write("**확인 필요 사항:**")
+                for confirm in final_choice.get("what_to_confirm", []):
+                    st.write(f"❓ {confirm}")
+        
+        # Evidence summary (citations)
+        render_evidence_summary(aggregation.get("evidence_summary", []), "**검증 근거 출처 (Evidence Summary)**")
+        
+        # Disclaimer
+        if aggregation.get("disclaimer"):
+            st.info(aggregation.get("disclaimer"))
+        
+        # Full JSON (expander 중첩 방지를 위해 일반 코드 블록 사용)
+        st.write("**전체 Aggregation JSON:**")
+        st.code(safe_json(aggregation), language="json")
+
+
+def render_final_step(final: dict, aggregation: dict):
+    """STEP 5 rendering."""
+    with st.expander("STEP 5) 최종 추천 + 3박4일 일정", expanded=True):
+        # Winner
+        winner = final.get("winner", {})
+        if winner:
+            st.markdown(f"### 🎯 추천 여행지: {winner.get('name', 'Unknown')}")
+            if winner.get("why"):
+                st.write("**추천 이유:**")
+                for reason in winner.get("why", []):
+                    st.write(f"• {reason}")
+            if winner.get("best_area_to_stay"):
+                st.write(f"**추천 숙박 지역:** {winner.get('best_area_to_stay')}")
+            if winner.get("budget_tip"):
+                st.write(f"**예산 팁:** {winner.get('budget_tip')}")
+        
+        # Validation summary
+        validation_summary = final.get("validation_summary", {})
+        if validation_summary:
+            st.write("**검증 근거 요약**")
+            col1, col2 = st.columns(2)
+            with col1:
+                if validation_summary.get("key_strengths"):
+                    st.write("**핵심 강점:**")
+                    for strength in validation_summary.get("key_strengths", [])[:3]:
+                        st.write(f"✅ {strength}")
+            with col2:
+                if validation_summary.get("key_risks"):
+                    st.write("**핵심 리스크:**")
+                    for risk in validation_summary.get("key_risks", [])[:3]:
+                        st.write(f"⚠️ {risk}")
+            
+            if validation_summary.get("watchouts"):
+                st.write("**주의사항:**")
+                for watchout in validation_summary.get("watchouts", [])[:3]:
+                    st.write(f"🔔 {watchout}")
+        
+        # Show evidence summary from aggregation if available
+        render_evidence_summary(aggregation.get("evidence_summary", []), "**검증 출처 (Citations)**")
+        
+        # Itinerary
+        itinerary = final.get("itinerary", [])
+        if itinerary:
+            st.write("**3박 4일 일정**")
+            for day_info in itinerary:
+                day = day_info.get("day", 0)
+                st.write(f"**Day {day}**")
+                if day_info.get("morning"):
+                    st.write(f"  🌅 오전: {day_info['morning']}")
+                if day_info.get("afternoon"):
+                    st.write(f"  ☀️ 오후: {day_info['afternoon']}")
+                if day_info.get("evening"):
+                    st.write(f"  🌙 저녁: {day_info['evening']}")
+        
+        # Full JSON (expander 중첩 방지를 위해 일반 코드 블록 사용)
+        st.write("**전체 Final JSON:**")
+        st.code(safe_json(final), language="json")
+
+
+def render_full_result(data: dict):
+    """Render a completed full route result (v2, or v1 fallback)."""
+    render_full_status(data)
+    render_profile_step(data["profile"])
+    render_candidates_step(data["candidates"])
+    
+    if "validators_results" in data and "aggregation" in data:
+        render_validators_step(data.get("validators_results", []), data.get("candidates", []))
+        render_aggregation_step(data.get("aggregation", {}))
+        render_final_step(data.get("final", {}), data.get("aggregation", {}))
+    else:
+        # Fallback to v1 display
+        with st.expander("STEP 3) 비교표", expanded=False):
+            st.code(safe_json(data.get("comparison", {})), language="json")
+        with st.expander("STEP 4) 최종 추천 + 3박4일 일정", expanded=True):
+            st.code(safe_json(data.get("final", {})), language="json")
+
+
+def render_route_result(route_result: RouteResult):
+    """Render result for non-streamed routes."""
+    if route_result.route == "full":
+        render_full_result(route_result.data)
     
     elif route_result.route == "clarify":
         st.info("추가 정보가 필요합니다.")
@@ -523,3 +687,66 @@ if run:
     
     else:
         st.info(route_result.data.get("message", "기능 구현 중입니다."))
+
+
+if run:
+    if not user_input.strip():
+        st.warning("여행 조건을 입력해줘.")
+        st.stop()
+
+    try:
+        # Unified router and chain execution as single traceable sequence
+        events = stream_router_and_chain(user_input, llm, parser)
+        
+        with st.spinner("라우팅 중..."):
+            _, route_decision = next(events)
+        render_route_badge(route_decision.route, route_decision.reason)
+        
+        if route_decision.route == "full":
+            # Render each step as soon as it is ready
+            status_slot = st.empty()
+            step_slots = {
+                step: st.empty()
+                for step in ("profile", "candidates", "validators", "aggregation", "final")
+            }
+            candidates = []
+            partial_results = []
+            aggregation = {}
+            
+            with st.spinner("체이닝 실행 중..."):
+                for event, payload in events:
+                    if event == "profile":
+                        with step_slots["profile"].container():
+                            render_profile_step(payload)
+                    elif event == "candidates":
+                        candidates = payload
+                        with step_slots["candidates"].container():
+                            render_candidates_step(candidates)
+                    elif event == "validator_result":
+                        partial_results.append(payload)
+                        with step_slots["validators"].container():
+                            render_validators_progress(partial_results, candidates)
+                    elif event == "validators_results":
+                        with step_slots["validators"].container():
+                            render_validators_step(payload, candidates)
+                    elif event == "aggregation":
+                        aggregation = payload
+                        with step_slots["aggregation"].container():
+                            render_aggregation_step(aggregation)
+                    elif event == "final":
+                        with step_slots["final"].container():
+                            render_final_step(payload, aggregation)
+                    elif event == "result":
+                        with status_slot.container():
+                            render_full_status(payload.data)
+        else:
+            with st.spinner("체이닝 실행 중..."):
+                for event, payload in events:
+                    if event == "result":
+                        route_result = payload
+            render_route_result(route_result)
+        
+    except Exception as e:
+        st.error("실행 중 오류가 났어. (JSON 파싱/모델 응답 형식 문제일 가능성이 큼)")
+        st.exception(e)
+        st.stop()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Unit tests for the local (numpy) aggregator ranking."""
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from chains.aggregator import AggregatorConfig, build_score_matrix, rank_candidates, run_local_aggregator
+
+
+def result(candidate_id, validator, score, verdict="pass", **extra):
+    """Minimal validator result."""
+    return {
+        "candidate_id": candidate_id,
+        "validator": validator,
+        "score": score,
+        "verdict": verdict,
+        "reasons": [f"{validator} 평가"],
+        **extra,
+    }
+
+
+def totals(candidate_ids, results, config=None):
+    """Total score per candidate and candidate ids from best to worst."""
+    config = config or AggregatorConfig()
+    axes, scores, penalties, present = build_score_matrix(candidate_ids, results, config)
+    total_scores, order = rank_candidates(axes, scores, penalties, present, config)
+    return dict(zip(candidate_ids, total_scores.tolist())), [candidate_ids[i] for i in order]
+
+
+def test_weighted_mean_skips_missing_axes():
+    """Axes without a result are left out of the mean instead of counting as 0.0."""
+    config = AggregatorConfig(axis_weights={"budget_fit": 3.0, "vibe_fit": 1.0})
+    scores, _ = totals(["C1", "C2"], [
+        result("C1", "budget_fit", 0.8),
+        result("C1", "vibe_fit", 0.4),
+        result("C2", "vibe_fit", 0.6),
+    ], config)
+    assert scores["C1"] == round((3.0 * 0.8 + 1.0 * 0.4) / 4.0, 4), scores
+    assert scores["C2"] == 0.6, scores
+
+
+def test_fail_is_penalized_unknown_is_not():
+    """A fail verdict subtracts its penalty; an unknown verdict does not."""
+    config = AggregatorConfig()
+    scores, _ = totals(["C1", "C2", "C3"], [
+        result("C1", "safety_risk", 0.5, "pass"),
+        result("C2", "safety_risk", 0.5, "fail"),
+        result("C3", "safety_risk", 0.5, "unknown"),
+    ], config)
+    assert scores["C1"] == 0.5, scores
+    assert scores["C2"] == round(0.5 - config.verdict_penalties["fail"], 4), scores
+    assert scores["C3"] == 0.5, scores
+
+
+def test_ties_keep_candidate_order():
+    """Equal totals rank in candidate order."""
+    candidate_ids = ["C1", "C2", "C3", "C4"]
+    _, order = totals(candidate_ids, [
+        result("C1", "vibe_fit", 0.7),
+        result("C2", "vibe_fit", 0.9),
+        result("C3", "vibe_fit", 0.7),
+        result("C4", "vibe_fit", 0.9),
+    ])
+    assert order == ["C2", "C4", "C1", "C3"], order
+
+
+def test_failed_runs_are_excluded():
+    """Errored runs and missing batched axes do not drag a candidate down."""
+    candidates = [{"name": "Kyoto"}, {"name": "Osaka"}]
+    results = [
+        result("C1", "budget_fit", 0.8),
+        result("C1", "vibe_fit", 0.0, "fail", reasons=["검증 실패: Request timed out"]),
+        result("C1", "safety_risk", 0.0, "fail", _error=True),
+        result("C1", "transit_complexity", 0.0, "fail", reasons=["배치 응답에 해당 축 결과 없음"]),
+        result("C1", "seasonality_weather", 0.0, "fail", reasons=["예외 발생: boom"]),
+        result("C2", "budget_fit", 0.7),
+        result("C2", "vibe_fit", 0.7),
+    ]
+    scores, order = totals(["C1", "C2"], results)
+    assert scores["C1"] == 0.8, scores
+    assert order == ["C1", "C2"], order
+
+    aggregation = run_local_aggregator({}, candidates, results)
+    top = aggregation["ranked_candidates"][0]
+    assert top["candidate_id"] == "C1" and top["total_score"] == 0.8, top
+    assert not any("검증 실패" in risk or "예외 발생" in risk for risk in top["risks"]), top["risks"]
+
+
+if __name__ == "__main__":
+    test_weighted_mean_skips_missing_axes()
+    test_fail_is_penalized_unknown_is_not()
+    test_ties_keep_candidate_order()
+    test_failed_runs_are_excluded()
+    print("✓ local aggregator tests passed")
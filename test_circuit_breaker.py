@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Tests for the search circuit breaker: state machine, half-open probe slot and LLM-only fallback."""
+import asyncio
+import os
+import sys
+from unittest import mock
+
+import requests
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from tools import circuit_breaker
+from tools.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from tools.google_cse import GoogleCSE
+from chains.concurrency import AdaptiveLimiter
+from chains.parallel_validators import run_validator_async
+from chains.validators import run_safety_risk_validator, run_safety_risk_web_validator
+
+CX = "cx-safety"
+
+
+class FakeClock:
+    """Stands in for the time module of tools.circuit_breaker (monotonic only)."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeResponse:
+    status_code = 200
+    text = ""
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"items": [{"title": "t", "link": "https://example.com", "snippet": "s"}]}
+
+
+class FakeChain:
+    """LLM-only validator chain answering with a fixed result."""
+
+    async def ainvoke(self, inputs):
+        return {"score": 0.7, "verdict": "pass", "reasons": ["일반 지식 기준 안전"]}
+
+
+def make_breaker():
+    return CircuitBreaker("cse", failure_threshold=2, reset_timeout_s=30.0)
+
+
+def make_client(breaker, get):
+    """CSE client without cache / quota whose session calls get."""
+    client = GoogleCSE(api_key="test-key", cx_safety=CX, cache=None, quota=None, breaker=breaker)
+    client._session.get = get
+    return client
+
+
+def trip(breaker, clock):
+    """Open the breaker and wait until it is half-open."""
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    clock.advance(breaker.stats()["retry_in_s"])
+    assert breaker.state == HALF_OPEN
+
+
+def test_closed_open_half_open():
+    """Consecutive failures open the breaker; after the reset timeout it lets exactly one probe through."""
+    clock = FakeClock()
+    with mock.patch.object(circuit_breaker, "time", clock):
+        breaker = make_breaker()
+        assert breaker.state == CLOSED
+        breaker.record_failure()
+        assert breaker.state == CLOSED and breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == OPEN and not breaker.allow_request()
+        clock.advance(29.0)
+        assert breaker.state == OPEN
+        clock.advance(1.0)
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        # Failed probe: open again with the timeout doubled
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        clock.advance(30.0)
+        assert breaker.state == OPEN
+        clock.advance(30.0)
+        assert breaker.state == HALF_OPEN
+
+
+def test_probe_slot_released():
+    """The probe slot is freed by a success, a failure and an unexpected exception."""
+    clock = FakeClock()
+    with mock.patch.object(circuit_breaker, "time", clock), \
+            mock.patch("tools.google_cse.get_rate_limiter", return_value=None):
+        # Success closes the breaker
+        breaker = make_breaker()
+        trip(breaker, clock)
+        client = make_client(breaker, lambda *args, **kwargs: FakeResponse())
+        assert len(client._fetch("q", CX, 3, "active")) == 1
+        assert breaker.state == CLOSED
+
+        # Failure re-opens it; the next half-open period has a free probe again
+        breaker = make_breaker()
+        trip(breaker, clock)
+
+        def connection_error(*args, **kwargs):
+            raise requests.exceptions.ConnectionError("down")
+
+        client = make_client(breaker, connection_error)
+        assert client._fetch("q", CX, 3, "active") is None
+        assert breaker.state == OPEN
+        clock.advance(breaker.stats()["retry_in_s"])
+        assert breaker.allow_request()
+
+        # Unexpected exception: neither outcome is recorded, the slot is handed back
+        breaker = make_breaker()
+        trip(breaker, clock)
+
+        def unexpected(*args, **kwargs):
+            raise RuntimeError("bug")
+
+        client = make_client(breaker, unexpected)
+        try:
+            client._fetch("q", CX, 3, "active")
+            assert False, "RuntimeError expected"
+        except RuntimeError:
+            pass
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow_request()
+
+        # While the probe is out, other searches are rejected with CircuitOpenError
+        try:
+            client.search("q2", cx=CX)
+            assert False, "CircuitOpenError expected"
+        except CircuitOpenError as e:
+            assert e.state == HALF_OPEN
+
+
+def test_validator_falls_back_on_circuit_open():
+    """A web-grounded validator whose search is rejected is scored by its LLM-only fallback."""
+    clock = FakeClock()
+    with mock.patch.object(circuit_breaker, "time", clock), \
+            mock.patch("tools.google_cse.get_rate_limiter", return_value=None):
+        breaker = make_breaker()
+        trip(breaker, clock)
+        # Another session holds the probe slot
+        assert breaker.allow_request()
+        client = make_client(breaker, lambda *args, **kwargs: FakeResponse())
+
+        result = asyncio.run(run_validator_async(
+            "safety_risk",
+            FakeChain(),
+            run_safety_risk_web_validator,
+            {"constraints": {"companions": "혼자"}},
+            {"name": "Kyoto, Japan"},
+            "C1",
+            AdaptiveLimiter(),
+            client,
+            fallback=(FakeChain(), run_safety_risk_validator)
+        ))
+
+    assert result["_web_fallback"] == "circuit_open", result
+    assert result["_search_breaker"] == HALF_OPEN
+    assert result["score"] == 0.7 and not result.get("_error"), result
+
+
+if __name__ == "__main__":
+    test_closed_open_half_open()
+    test_probe_slot_released()
+    test_validator_falls_back_on_circuit_open()
+    print("✓ circuit breaker tests passed")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Tests for CSE quota reservations, per-attempt booking of retries and the daily reset."""
+import datetime
+import os
+import sys
+from unittest import mock
+
+import requests
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from tools import cse_quota
+from tools.cse_quota import CSEQuota, QUOTA_TIMEZONE, use_reservation
+from tools.google_cse import GoogleCSE
+
+CX = "cx-safety"
+
+
+class FakeResponse:
+    """Just enough of requests.Response for GoogleCSE._fetch."""
+
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.text = ""
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code}", response=self)
+
+    def json(self):
+        return {"items": [{"title": "t", "link": "https://example.com", "snippet": "s"}]}
+
+
+def make_client(quota: CSEQuota, status_codes):
+    """CSE client without cache / breaker whose session answers with status_codes in turn."""
+    client = GoogleCSE(api_key="test-key", cx_safety=CX, backoff_factor=0.0, cache=None, quota=quota, breaker=None)
+    codes = list(status_codes)
+    sent = []
+
+    def fake_get(*args, **kwargs):
+        sent.append(kwargs.get("params", {}).get("q"))
+        return FakeResponse(codes.pop(0))
+
+    client._session.get = fake_get
+    return client, sent
+
+
+def daily_used(quota: CSEQuota) -> int:
+    return quota.stats("test-key")["daily_used"]
+
+
+def pacific(year, month, day, hour, minute=0) -> float:
+    return datetime.datetime(year, month, day, hour, minute, tzinfo=QUOTA_TIMEZONE).timestamp()
+
+
+def test_reserve_retry_refund():
+    """Reserved queries cover retries; what is left is refunded."""
+    quota = CSEQuota(daily_budget=10, database_path=":memory:")
+    with mock.patch("tools.google_cse.get_rate_limiter", return_value=None):
+        # 3 queries reserved, 1 search with one 5xx retry = 2 attempts, 1 refunded
+        client, sent = make_client(quota, [503, 200])
+        reservation = client.reserve(CX, 3, "high")
+        assert reservation is not None and daily_used(quota) == 3
+        with use_reservation(reservation):
+            assert len(client.search("kyoto safety", cx=CX)) == 1
+            assert len(sent) == 2 and daily_used(quota) == 3 and reservation.remaining == 1
+        assert daily_used(quota) == 2 and reservation.remaining == 0
+
+        # A retry beyond the reservation is booked on its own
+        client, sent = make_client(quota, [503, 200])
+        with use_reservation(client.reserve(CX, 1, "high")):
+            client.search("osaka safety", cx=CX)
+        assert len(sent) == 2 and daily_used(quota) == 4
+
+        # A retry the quota refuses is not sent
+        quota = CSEQuota(daily_budget=1, database_path=":memory:")
+        client, sent = make_client(quota, [503, 200])
+        assert client.search("nara safety", cx=CX) == []
+        assert len(sent) == 1 and daily_used(quota) == 1
+
+
+def test_priority_floor():
+    """Near the end of the budget, normal-priority batches are refused while high-priority ones still fit."""
+    quota = CSEQuota(daily_budget=100, database_path=":memory:")
+    assert quota.try_spend("test-key", CX, 88)
+    # 12 left: normal keeps a floor of 10, high has none
+    assert quota.reserve("test-key", CX, 3, "normal") is None
+    assert daily_used(quota) == 88
+    high = quota.reserve("test-key", CX, 3, "high")
+    assert high is not None and high.remaining == 3 and daily_used(quota) == 91
+    # 9 left: of two candidates needing 5 each, only the first gets them
+    assert quota.reserve("test-key", CX, 5, "high") is not None
+    assert quota.reserve("test-key", CX, 5, "high") is None
+    assert daily_used(quota) == 96
+
+
+def test_daily_reset_at_pacific_midnight():
+    """Counts reset at midnight Pacific time, not UTC."""
+    quota = CSEQuota(daily_budget=5, database_path=":memory:")
+    with mock.patch.object(cse_quota.time, "time", return_value=pacific(2026, 10, 18, 20)):
+        # 20:00 Pacific is already the next day in UTC
+        assert quota.try_spend("test-key", CX, 5)
+        assert not quota.try_spend("test-key", CX)
+    with mock.patch.object(cse_quota.time, "time", return_value=pacific(2026, 10, 18, 23, 59)):
+        assert quota.reserve("test-key", CX, 1, "high") is None
+    with mock.patch.object(cse_quota.time, "time", return_value=pacific(2026, 10, 19, 0, 1)):
+        assert daily_used(quota) == 0
+        assert quota.reserve("test-key", CX, 5, "high") is not None
+
+
+if __name__ == "__main__":
+    test_reserve_retry_refund()
+    test_priority_floor()
+    test_daily_reset_at_pacific_midnight()
+    print("✓ CSE quota tests passed")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Regression tests for gazetteer destination detection in the rule router."""
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from router.gazetteer import find_destination
+from router.rules import route_user_input
+
+
+# Ordinary words that start with a Korean place alias
+NOT_PLACES = ["대만족", "인도어", "호주머니", "부산스럽지", "전주에", "광주리", "대구탕"]
+
+# Place names with attached particles / travel suffixes
+PLACES = {
+    "도쿄에서": "Tokyo, Japan",
+    "제주도로": "Jeju, South Korea",
+    "부산여행을": "Busan, South Korea",
+    "대만이랑": "Taiwan",
+    "전주 여행": "Jeonju, South Korea",
+    "전주행 기차": "Jeonju, South Korea",
+    "인도네시아": "Indonesia",
+    "일본 도쿄 3박4일": "Tokyo, Japan",
+    "new york city": "New York, United States",
+}
+
+
+def test_words_are_not_places():
+    """Words that merely start with a place alias are not destinations."""
+    for word in NOT_PLACES:
+        place = find_destination(word)
+        assert place is None, f"{word} -> {place.label}"
+
+
+def test_places_with_suffixes():
+    """Place names followed by particles or travel suffixes are found."""
+    for text, label in PLACES.items():
+        place = find_destination(text)
+        assert place is not None and place.label == label, f"{text} -> {place and place.label}"
+
+
+def test_no_confident_itinerary_without_place():
+    """"대만족" must not turn an itinerary request into a confident itinerary_only route."""
+    decision = route_user_input("가족이랑 3박4일, 예산 100만원, 맛집 위주로 대만족할 일정 짜줘")
+    assert decision.destination is None
+    assert not (decision.route == "itinerary_only" and decision.confidence >= 0.7)
+
+
+if __name__ == "__main__":
+    test_words_are_not_places()
+    test_places_with_suffixes()
+    test_no_confident_itinerary_without_place()
+    print("✓ gazetteer regression tests passed")
@@ -1,4 +1,12 @@
 """Tools for web search and external APIs."""
-from .google_cse import GoogleCSE, SearchHit
+from .search_provider import SearchHit, SearchProvider, get_search_provider
+from .google_cse import GoogleCSE, get_cse_client
+from .local_index import LocalSearchIndex, build_index, get_local_index
+from .evidence import EvidenceConfig, compact_evidence, get_evidence_config
+from .search_cache import SearchCache, get_search_cache
+from .single_flight import SingleFlight, get_single_flight
+from .cse_quota import CSEQuota, QuotaReservation, get_cse_quota, use_reservation
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+from .rate_limiter import RateLimiter, TokenBucket, get_rate_limiter
 
-__all__ = ["GoogleCSE", "SearchHit"]
\ No newline at end of file
+__all__ = ["SearchHit", "SearchProvider", "get_search_provider", "GoogleCSE", "get_cse_client", "LocalSearchIndex", "build_index", "get_local_index", "EvidenceConfig", "compact_evidence", "get_evidence_config", "SearchCache", "get_search_cache", "SingleFlight", "get_single_flight", "CSEQuota", "QuotaReservation", "get_cse_quota", "use_reservation", "CircuitBreaker", "CircuitOpenError", "get_circuit_breaker", "RateLimiter", "TokenBucket", "get_rate_limiter"]
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""Circuit breaker for external backends (shared by all validators and sessions)."""
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """A call was rejected by an open (or fully probed half-open) circuit."""
+
+    def __init__(self, name: str, state: str):
+        super().__init__(f"{name} circuit breaker is {state}")
+        self.name = name
+        self.state = state
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker.
+
+    - closed: calls go through; failure_threshold consecutive failures open the circuit
+    - open: calls are rejected immediately (callers degrade instead of waiting
+      for timeouts) until reset_timeout_s has passed
+    - half_open: up to half_open_max_calls probe calls go through; a successful
+      probe closes the circuit, a failed one re-opens it with the reset timeout
+      doubled (up to max_reset_timeout_s)
+
+    Callers ask allow_request() before a call and report the outcome with
+    record_success() / record_failure(); a permitted call that is not made
+    after all must be handed back with release().
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout_s: float = 30.0,
+        max_reset_timeout_s: float = 600.0,
+        half_open_max_calls: int = 1
+    ):
+        """
+        Initialize breaker.
+
+        Args:
+            name: Backend name (used in traces and stats)
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout_s: Time the circuit stays open before probing
+            max_reset_timeout_s: Upper bound of the reset timeout after failed probes
+            half_open_max_calls: Concurrent probe calls allowed while half-open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout_s = reset_timeout_s
+        self.max_reset_timeout_s = max_reset_timeout_s
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._reset_timeout_s = reset_timeout_s
+        self._probes = 0
+        self._stats = {"rejected": 0, "failures": 0, "successes": 0, "opened": 0}
+
+    def _current_state(self, now: float) -> str:
+        """State with the open -> half-open transition applied (caller holds the lock)."""
+        if self._state == OPEN and now - self._opened_at >= self._reset_timeout_s:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Whether a call may go out now (counts a probe while half-open)."""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def release(self) -> None:
+        """Hand back a permitted call that was not made."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_success(self) -> None:
+        """Report a successful call (closes a half-open circuit)."""
+        with self._lock:
+            self._stats["successes"] += 1
+            self._failures = 0
+            if self._state != CLOSED:
+                self._state = CLOSED
+                self._reset_timeout_s = self.base_reset_timeout_s
+                self._probes = 0
+
+    def record_failure(self) -> None:
+        """Report a failed call (may open the circuit)."""
+        now = time.monotonic()
+        with self._lock:
+            self._stats["failures"] += 1
+            state = self._current_state(now)
+            if state == HALF_OPEN:
+                # Probe failed - back off longer before the next probe
+                self._reset_timeout_s = min(self.max_reset_timeout_s, self._reset_timeout_s * 2)
+                self._open(now)
+            elif state == CLOSED:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    self._open(now)
+
+    def _open(self, now: float) -> None:
+        """Open the circuit (caller holds the lock)."""
+        self._state = OPEN
+        self._opened_at = now
+        self._probes = 0
+        self._stats["opened"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return state, consecutive failures, time until the next probe and counters."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._current_state(now)
+            return {
+                "name": self.name,
+                "state": state,
+                "consecutive_failures": self._failures,
+                "retry_in_s": max(0.0, self._opened_at + self._reset_timeout_s - now) if state == OPEN else 0.0,
+                **self._stats,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> Optional[CircuitBreaker]:
+    """
+    Get the process-wide circuit breaker of a backend (e.g. "cse").
+
+    - CIRCUIT_BREAKER_ENABLED: "false" disables circuit breaking (default: enabled)
+    - CIRCUIT_BREAKER_FAILURE_THRESHOLD: consecutive failures that open the circuit (default: 5)
+    - CIRCUIT_BREAKER_RESET_SECONDS: open time before the first probe (default: 30)
+    - CIRCUIT_BREAKER_MAX_RESET_SECONDS: upper bound after failed probes (default: 600)
+
+    Returns:
+        Shared CircuitBreaker, or None if disabled
+    """
+    if os.getenv("CIRCUIT_BREAKER_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5)),
+                reset_timeout_s=float(os.getenv("CIRCUIT_BREAKER_RESET_SECONDS", 30)),
+                max_reset_timeout_s=float(os.getenv("CIRCUIT_BREAKER_MAX_RESET_SECONDS", 600)),
+            )
+        return _breakers[name]
@@ -0,0 +1,325 @@
+"""Google CSE quota governor: daily / per-minute query budgets per API key and per PSE."""
+import contextlib
+import contextvars
+import datetime
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterator, Optional
+
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+try:
+    QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except ZoneInfoNotFoundError:
+    # No tz database (e.g. slim containers) - approximate with PST
+    QUOTA_TIMEZONE = datetime.timezone(datetime.timedelta(hours=-8))
+
+# Share of the daily budget that must remain for a caller of each priority to
+# start new searches (low-priority work degrades first, high-priority last)
+PRIORITY_FLOORS = {"high": 0.0, "normal": 0.1, "low": 0.3}
+
+
+def quota_day(now: Optional[float] = None) -> str:
+    """Current quota day (Google resets CSE quotas at midnight Pacific time)."""
+    moment = datetime.datetime.fromtimestamp(now if now is not None else time.time(), QUOTA_TIMEZONE)
+    return moment.date().isoformat()
+
+
+def key_scope(api_key: str) -> str:
+    """Scope name of an API key (hashed, the key itself is never stored)."""
+    return "key:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+class CSEQuota:
+    """
+    Counts CSE queries against daily and per-minute budgets.
+
+    - Daily budget per API key (the 100 queries/day free tier by default) and,
+      optionally, per PSE; counts are kept in SQLite so restarts do not reset them
+    - Per-minute budget per API key (sliding 60 s window, in memory)
+    - try_spend() is pessimistic: it books the query before the call is made
+      and refuses once a budget is used up, so we never send searches that
+      would come back as quota errors
+    - can_afford() lets callers check ahead whether a batch of queries still
+      fits above their priority floor, to degrade to LLM-only validation early;
+      reserve() does the check and books the batch in one step, so concurrent
+      callers cannot all pass the check and then run out halfway
+    - mark_exhausted() records a quota error from Google (e.g. another process
+      shares the key) so the rest of the day is not spent retrying
+    """
+
+    def __init__(
+        self,
+        daily_budget: int = 100,
+        pse_daily_budget: Optional[int] = None,
+        minute_budget: int = 100,
+        database_path: str = ".cache/cse_quota.sqlite"
+    ):
+        """
+        Initialize quota governor.
+
+        Args:
+            daily_budget: Queries per API key per day
+            pse_daily_budget: Queries per PSE per day (None = only the key budget applies)
+            minute_budget: Queries per API key per minute
+            database_path: SQLite file path (":memory:" for a non-persistent store)
+        """
+        self.daily_budget = daily_budget
+        self.pse_daily_budget = pse_daily_budget
+        self.minute_budget = minute_budget
+
+        self._lock = threading.Lock()
+        self._minute_windows: Dict[str, deque] = {}
+        self._stats = {"spent": 0, "refused": 0, "refunded": 0, "exhausted": 0}
+
+        directory = os.path.dirname(database_path)
+        if database_path != ":memory:" and directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(database_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cse_quota ("
+            " scope TEXT NOT NULL,"
+            " day TEXT NOT NULL,"
+            " used INTEGER NOT NULL,"
+            " PRIMARY KEY (scope, day))"
+        )
+        self._conn.commit()
+
+    def _used(self, scope: str, day: str) -> int:
+        """Queries spent today in a scope (caller holds the lock)."""
+        row = self._conn.execute(
+            "SELECT used FROM cse_quota WHERE scope = ? AND day = ?", (scope, day)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _set_used(self, scope: str, day: str, used: int) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cse_quota (scope, day, used) VALUES (?, ?, ?)", (scope, day, used)
+        )
+
+    def _minute_window(self, scope: str, now: float) -> deque:
+        """Timestamps of the last minute's queries (caller holds the lock)."""
+        window = self._minute_windows.setdefault(scope, deque())
+        while window and now - window[0] >= 60:
+            window.popleft()
+        return window
+
+    def _remaining(self, api_key: str, cx: str, now: float) -> Dict[str, int]:
+        """Remaining daily / per-minute queries (caller holds the lock)."""
+        day = quota_day(now)
+        scope = key_scope(api_key)
+        daily = self.daily_budget - self._used(scope, day)
+        if self.pse_daily_budget is not None:
+            daily = min(daily, self.pse_daily_budget - self._used(f"cx:{cx}", day))
+        minute = self.minute_budget - len(self._minute_window(scope, now))
+        return {"daily": max(0, daily), "minute": max(0, minute)}
+
+    def can_afford(self, api_key: str, cx: str, queries: int = 1, priority: str = "normal") -> bool:
+        """Whether `queries` more searches fit in the budgets above the priority's floor."""
+        floor = PRIORITY_FLOORS.get(priority, PRIORITY_FLOORS["normal"]) * self.daily_budget
+        with self._lock:
+            remaining = self._remaining(api_key, cx, time.time())
+        return remaining["daily"] - queries >= floor and remaining["minute"] >= queries
+
+    def _book(self, api_key: str, cx: str, queries: int, now: float) -> None:
+        """Add queries to today's counters and the minute window (caller holds the lock)."""
+        day = quota_day(now)
+        scope = key_scope(api_key)
+        self._set_used(scope, day, self._used(scope, day) + queries)
+        if self.pse_daily_budget is not None:
+            self._set_used(f"cx:{cx}", day, self._used(f"cx:{cx}", day) + queries)
+        self._conn.commit()
+        self._minute_window(scope, now).extend([now] * queries)
+        self._stats["spent"] += queries
+
+    def try_spend(self, api_key: str, cx: str, queries: int = 1) -> bool:
+        """Book queries before sending them; False (nothing booked) if a budget is used up."""
+        now = time.time()
+        with self._lock:
+            remaining = self._remaining(api_key, cx, now)
+            if remaining["daily"] < queries or remaining["minute"] < queries:
+                self._stats["refused"] += 1
+                return False
+            self._book(api_key, cx, queries, now)
+            return True
+
+    def reserve(
+        self,
+        api_key: str,
+        cx: str,
+        queries: int,
+        priority: str = "normal",
+        reservation: Optional["QuotaReservation"] = None
+    ) -> Optional["QuotaReservation"]:
+        """
+        Book a batch of queries ahead if it fits above the priority's floor.
+
+        The check and the booking happen under one lock (unlike can_afford()
+        followed by try_spend() per query). Searches draw on the reservation
+        while it is active (use_reservation); the unused rest is refunded.
+
+        Args:
+            reservation: Reservation to add the queries to (e.g. earlier candidates of a batch)
+
+        Returns:
+            The reservation holding the queries, or None (nothing booked) if they do not fit
+        """
+        floor = PRIORITY_FLOORS.get(priority, PRIORITY_FLOORS["normal"]) * self.daily_budget
+        now = time.time()
+        with self._lock:
+            remaining = self._remaining(api_key, cx, now)
+            if remaining["daily"] - queries < floor or remaining["minute"] < queries:
+                self._stats["refused"] += 1
+                return None
+            self._book(api_key, cx, queries, now)
+        if reservation is None:
+            reservation = QuotaReservation(self, api_key, cx)
+        reservation.add(queries)
+        return reservation
+
+    def refund(self, api_key: str, cx: str, queries: int) -> None:
+        """Give back booked queries that were never sent."""
+        if queries <= 0:
+            return
+        now = time.time()
+        day = quota_day(now)
+        scope = key_scope(api_key)
+        with self._lock:
+            self._set_used(scope, day, max(0, self._used(scope, day) - queries))
+            if self.pse_daily_budget is not None:
+                self._set_used(f"cx:{cx}", day, max(0, self._used(f"cx:{cx}", day) - queries))
+            self._conn.commit()
+            window = self._minute_window(scope, now)
+            for _ in range(min(queries, len(window))):
+                window.pop()
+            self._stats["refunded"] += queries
+
+    def mark_exhausted(self, api_key: str, cx: str) -> None:
+        """Treat today's budgets as used up (Google reported a quota error)."""
+        day = quota_day()
+        with self._lock:
+            self._set_used(key_scope(api_key), day, max(self.daily_budget, self._used(key_scope(api_key), day)))
+            if self.pse_daily_budget is not None:
+                self._set_used(f"cx:{cx}", day, max(self.pse_daily_budget, self._used(f"cx:{cx}", day)))
+            self._conn.commit()
+            self._stats["exhausted"] += 1
+
+    def stats(self, api_key: str, cx: Optional[str] = None) -> Dict[str, Any]:
+        """Return today's usage of an API key (and PSE) and the spend / refuse counters."""
+        day = quota_day()
+        with self._lock:
+            used = self._used(key_scope(api_key), day)
+            stats = {
+                **self._stats,
+                "day": day,
+                "daily_used": used,
+                "daily_budget": self.daily_budget,
+                "daily_remaining": max(0, self.daily_budget - used),
+            }
+            if cx is not None:
+                stats["remaining"] = self._remaining(api_key, cx, time.time())
+            return stats
+
+
+class QuotaReservation:
+    """
+    Queries of one PSE booked ahead for a unit of work (e.g. one validator's searches).
+
+    Searches sent while it is active (use_reservation) take their query from
+    the reservation instead of booking it; what is left when the work is done
+    (cache hits, queries shared with other sessions, searches never made) is
+    refunded by release().
+    """
+
+    def __init__(self, quota: Optional[CSEQuota], api_key: str, cx: str):
+        self.quota = quota
+        self.api_key = api_key
+        self.cx = cx
+        self._left = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        """Booked queries not taken yet."""
+        with self._lock:
+            return self._left
+
+    def add(self, queries: int) -> None:
+        """Count queries booked for this reservation."""
+        with self._lock:
+            self._left += queries
+
+    def take(self, cx: str) -> bool:
+        """Take one booked query for a search on cx (False if none is left for it)."""
+        with self._lock:
+            if cx != self.cx or self._left <= 0:
+                return False
+            self._left -= 1
+            return True
+
+    def release(self) -> None:
+        """Refund the queries not taken (idempotent)."""
+        with self._lock:
+            left, self._left = self._left, 0
+        if left and self.quota is not None:
+            self.quota.refund(self.api_key, self.cx, left)
+
+
+_active_reservation: contextvars.ContextVar = contextvars.ContextVar("cse_quota_reservation", default=None)
+
+
+def active_reservation() -> Optional[QuotaReservation]:
+    """Reservation the current context's searches draw on, if any."""
+    return _active_reservation.get()
+
+
+@contextlib.contextmanager
+def use_reservation(reservation: Optional[QuotaReservation]) -> Iterator[Optional[QuotaReservation]]:
+    """Let searches in the block (and tasks it starts) draw on a reservation; release it on exit."""
+    if reservation is None:
+        yield None
+        return
+    token = _active_reservation.set(reservation)
+    try:
+        yield reservation
+    finally:
+        _active_reservation.reset(token)
+        reservation.release()
+
+
+_cse_quota: Optional[CSEQuota] = None
+_cse_quota_lock = threading.Lock()
+
+
+def get_cse_quota() -> Optional[CSEQuota]:
+    """
+    Get the process-wide CSE quota governor configured from environment variables.
+
+    - CSE_QUOTA_ENABLED: "false" disables budgeting (default: enabled)
+    - GOOGLE_CSE_DAILY_BUDGET: queries per API key per day (default: 100, the free tier)
+    - GOOGLE_CSE_PSE_DAILY_BUDGET: queries per PSE per day (default: unset = no per-PSE budget)
+    - GOOGLE_CSE_MINUTE_BUDGET: queries per API key per minute (default: 100)
+    - CSE_QUOTA_PATH: SQLite path of the daily counters (default: .cache/cse_quota.sqlite)
+
+    Returns:
+        Shared CSEQuota, or None if disabled
+    """
+    global _cse_quota
+
+    if os.getenv("CSE_QUOTA_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+
+    with _cse_quota_lock:
+        if _cse_quota is None:
+            pse_daily_budget = os.getenv("GOOGLE_CSE_PSE_DAILY_BUDGET")
+            _cse_quota = CSEQuota(
+                daily_budget=int(os.getenv("GOOGLE_CSE_DAILY_BUDGET", 100)),
+                pse_daily_budget=int(pse_daily_budget) if pse_daily_budget else None,
+                minute_budget=int(os.getenv("GOOGLE_CSE_MINUTE_BUDGET", 100)),
+                database_path=os.getenv("CSE_QUOTA_PATH", ".cache/cse_quota.sqlite"),
+            )
+        return _cse_quota
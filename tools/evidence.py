@@ -0,0 +1,211 @@
+"""Evidence compaction: near-duplicate removal, relevance ranking and token-budget packing of search hits."""
+import os
+import re
+import unicodedata
+import zlib
+from functools import lru_cache
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .local_index import tokenize
+from .rate_limiter import CHARS_PER_TOKEN
+from .search_provider import SearchHit
+
+# Mersenne prime for the MinHash permutations (a * x + b) mod p
+MINHASH_PRIME = (1 << 61) - 1
+
+# Prompt overhead of one formatted hit ("\n[i] title\nURL: url\n...\n")
+HIT_OVERHEAD_CHARS = 12
+
+
+@dataclass
+class EvidenceConfig:
+    """
+    Evidence compaction settings.
+
+    - token_budget: estimated prompt tokens all hits of one search may use
+    - dedup_threshold: estimated Jaccard similarity of snippet shingles above
+      which a hit is a near-duplicate of a higher-ranked one (mirrors, syndicated copies)
+    - shingle_chars: character shingle length (works for Korean and English alike)
+    - num_perm: MinHash permutations (more = more precise similarity estimate)
+    - min_snippet_tokens: a snippet is truncated to fit the budget only if at
+      least this much of it fits; otherwise the hit is dropped
+    """
+    token_budget: int = 400
+    dedup_threshold: float = 0.6
+    shingle_chars: int = 5
+    num_perm: int = 64
+    min_snippet_tokens: int = 20
+
+
+def _normalize(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+@lru_cache(maxsize=8)
+def _permutations(num_perm: int, seed: int):
+    """MinHash permutation coefficients (fixed per seed so signatures are comparable)."""
+    rng = np.random.default_rng(seed)
+    return (
+        rng.integers(1, MINHASH_PRIME, size=num_perm, dtype=np.uint64),
+        rng.integers(0, MINHASH_PRIME, size=num_perm, dtype=np.uint64),
+    )
+
+
+def minhash_signature(text: str, shingle_chars: int = 5, num_perm: int = 64, seed: int = 1) -> np.ndarray:
+    """MinHash signature of a text's character shingles (uint64 array of num_perm values)."""
+    normalized = _normalize(text)
+    if len(normalized) <= shingle_chars:
+        shingles = {normalized}
+    else:
+        shingles = {normalized[i:i + shingle_chars] for i in range(len(normalized) - shingle_chars + 1)}
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles), dtype=np.uint64, count=len(shingles)
+    )
+
+    a, b = _permutations(num_perm, seed)
+    # crc32 values are < 2**32 and a, b < 2**61: the product may wrap, which is
+    # fine for hashing (it stays a fixed pseudo-random permutation per (a, b))
+    permuted = (hashes[:, None] * a[None, :] + b[None, :]) % np.uint64(MINHASH_PRIME)
+    return permuted.min(axis=0)
+
+
+def estimate_similarity(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return float(np.mean(signature_a == signature_b))
+
+
+def relevance_score(hit: SearchHit, focus_terms: Sequence[str], context_terms: Sequence[str]) -> float:
+    """
+    Term-overlap relevance of a hit.
+
+    focus_terms (destination, season) count double compared to context_terms
+    (the search queries); each distinct term counts once.
+    """
+    terms = set(tokenize(f"{hit.title} {hit.snippet}"))
+    focus = set(focus_terms)
+    context = set(context_terms) - focus
+    score = 0.0
+    if focus:
+        score += 2.0 * len(focus & terms) / len(focus)
+    if context:
+        score += len(context & terms) / len(context)
+    return score
+
+
+def hit_tokens(hit: SearchHit) -> int:
+    """Estimated prompt tokens of a formatted hit."""
+    return (len(hit.title) + len(hit.url) + len(hit.snippet) + HIT_OVERHEAD_CHARS) // CHARS_PER_TOKEN + 1
+
+
+def truncate_snippet(snippet: str, max_chars: int) -> str:
+    """Cut a snippet at a word boundary (marking the cut with an ellipsis)."""
+    if len(snippet) <= max_chars:
+        return snippet
+    cut = snippet[:max(0, max_chars - 1)]
+    if " " in cut:
+        cut = cut[:cut.rfind(" ")]
+    return re.sub(r"[\s,.;:]+$", "", cut) + "…"
+
+
+def compact_evidence(
+    hits: Sequence[SearchHit],
+    focus: Sequence[str],
+    context: Sequence[str] = (),
+    max_hits: Optional[int] = None,
+    config: Optional[EvidenceConfig] = None
+) -> List[SearchHit]:
+    """
+    Compact search hits for a judge prompt.
+
+    1. Rank hits by relevance to focus (e.g. destination, season) and context
+       (e.g. the search queries); the search engine's order breaks ties
+    2. Drop near-duplicates (MinHash similarity of snippets above the
+       threshold) of a hit ranked higher
+    3. Pack hits in rank order into the token budget; a hit that does not fit
+       whole keeps a truncated snippet if enough of it fits (and fills the
+       budget), otherwise it is skipped for smaller hits further down
+
+    Titles and URLs are never altered, so citations stay intact.
+
+    Args:
+        hits: Search hits (merged, URL-deduplicated)
+        focus: Texts whose terms matter most
+        context: Texts whose terms also count
+        max_hits: Cap on returned hits (None = budget only)
+        config: Compaction settings (defaults if None)
+
+    Returns:
+        Compacted hits, best first
+    """
+    config = config or EvidenceConfig()
+    if not hits:
+        return []
+
+    focus_terms = [term for text in focus if text for term in tokenize(text)]
+    context_terms = [term for text in context if text for term in tokenize(text)]
+    ranked = sorted(
+        enumerate(hits),
+        key=lambda pair: (-relevance_score(pair[1], focus_terms, context_terms), pair[0])
+    )
+
+    kept: List[SearchHit] = []
+    signatures: List[np.ndarray] = []
+    for _, hit in ranked:
+        signature = minhash_signature(hit.snippet or hit.title, config.shingle_chars, config.num_perm)
+        if any(estimate_similarity(signature, other) >= config.dedup_threshold for other in signatures):
+            continue
+        kept.append(hit)
+        signatures.append(signature)
+
+    packed: List[SearchHit] = []
+    remaining = config.token_budget
+    for hit in kept[:max_hits]:
+        tokens = hit_tokens(hit)
+        if tokens <= remaining:
+            packed.append(hit)
+            remaining -= tokens
+            continue
+        # Room left for part of the snippet? (otherwise a smaller hit may still fit)
+        snippet_room = remaining - hit_tokens(replace(hit, snippet=""))
+        if snippet_room >= config.min_snippet_tokens or not packed:
+            max_chars = max(0, snippet_room) * CHARS_PER_TOKEN
+            packed.append(replace(hit, snippet=truncate_snippet(hit.snippet, max_chars)))
+            break
+
+    return packed
+
+
+def get_evidence_config() -> Optional[EvidenceConfig]:
+    """
+    Get the evidence compaction settings from environment variables.
+
+    - EVIDENCE_COMPACTION_ENABLED: "false" passes search hits through unchanged (default: enabled)
+    - EVIDENCE_TOKEN_BUDGET: estimated prompt tokens per search (default: 400)
+    - EVIDENCE_DEDUP_THRESHOLD: near-duplicate similarity threshold (default: 0.6)
+
+    Returns:
+        EvidenceConfig, or None if disabled
+    """
+    if os.getenv("EVIDENCE_COMPACTION_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+
+    return EvidenceConfig(
+        token_budget=int(os.getenv("EVIDENCE_TOKEN_BUDGET", 400)),
+        dedup_threshold=float(os.getenv("EVIDENCE_DEDUP_THRESHOLD", 0.6)),
+    )
+
+
+def compact_search_hits(
+    hits: Sequence[SearchHit],
+    focus: Sequence[str],
+    context: Sequence[str] = (),
+    max_hits: Optional[int] = None
+) -> List[SearchHit]:
+    """compact_evidence with the environment settings (only capped at max_hits if compaction is disabled)."""
+    config = get_evidence_config()
+    if config is None:
+        return list(hits[:max_hits])
+    return compact_evidence(hits, focus, context, max_hits=max_hits, config=config)
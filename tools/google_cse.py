@@ -1,30 +1,56 @@
 """Google Custom Search Engine (CSE) client for web-grounded validation."""
+import asyncio
+import concurrent.futures
 import os
+import contextvars
+import threading
+import time
+import weakref
+import httpx
 import requests
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from dataclasses import asdict
+from urllib3.util.retry import Retry
 
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+from .cse_quota import CSEQuota, QuotaReservation, active_reservation, get_cse_quota
+from .rate_limiter import get_rate_limiter
+from .search_cache import STALE, SearchCache, get_search_cache, normalize_query
+from .search_provider import SearchHit, SearchProvider
+from .single_flight import get_single_flight
 
-@dataclass
-class SearchHit:
-    """Standard search result structure."""
-    title: str
-    url: str
-    snippet: str
-    display_url: Optional[str] = None
 
+# Transient server-side failures worth retrying (429 is left to the rate limiter:
+# CSE answers 429 for an exhausted daily quota, which retrying cannot fix)
+RETRY_STATUS_CODES = (500, 502, 503, 504)
 
-class GoogleCSE:
+
+class GoogleCSE(SearchProvider):
     """
     Google Custom Search Engine client.
     Used for retrieving web information from trusted domains.
+    
+    Connections are pooled and kept alive: sync calls share one requests.Session,
+    async calls share one httpx.AsyncClient per event loop, so consecutive
+    queries skip the TCP + TLS handshake to googleapis.com.
     """
     
+    name = "google_cse"
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         cx_weather: Optional[str] = None,
-        cx_safety: Optional[str] = None
+        cx_safety: Optional[str] = None,
+        pool_size: int = 10,
+        max_retries: int = 2,
+        backoff_factor: float = 0.3,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        cache: Optional[SearchCache] = None,
+        quota: Optional[CSEQuota] = None,
+        breaker: Optional[CircuitBreaker] = None
     ):
         """
         Initialize Google CSE client.
@@ -33,6 +59,14 @@ class GoogleCSE:
             api_key: Google CSE API key (or from GOOGLE_CSE_API_KEY env)
             cx_weather: Weather PSE ID (or from GOOGLE_CSE_CX_WEATHER env)
             cx_safety: Safety PSE ID (or from GOOGLE_CSE_CX_SAFETY env)
+            pool_size: Max keep-alive connections to googleapis.com
+            max_retries: Retries on connection errors and 5xx responses (each 5xx retry books a query)
+            backoff_factor: Exponential backoff base between retries (seconds)
+            connect_timeout: Per-call connect timeout (seconds)
+            read_timeout: Per-call read timeout (seconds)
+            cache: Optional search result cache (stale entries are refreshed in the background)
+            quota: Optional quota governor (searches beyond the budget are not sent)
+            breaker: Optional circuit breaker (searches fail fast while it is open)
         """
         self.api_key = api_key or os.getenv("GOOGLE_CSE_API_KEY")
         self.cx_weather = cx_weather or os.getenv("GOOGLE_CSE_CX_WEATHER")
@@ -41,6 +75,63 @@ class GoogleCSE:
         
         if not self.api_key:
             raise ValueError("GOOGLE_CSE_API_KEY is required")
+        
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self.cache = cache
+        self.quota = quota
+        self.breaker = breaker
+        
+        # Pooled keep-alive session for sync calls (requests.Session is thread-safe for GETs).
+        # The transport only retries requests that never reached Google (like httpx);
+        # 5xx retries are done in _fetch, which books each attempt on the quota
+        retry = Retry(
+            total=max_retries,
+            read=False,
+            status_forcelist=(),
+            backoff_factor=backoff_factor,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        
+        # One httpx.AsyncClient per event loop (clients cannot be shared across loops)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+        
+        # Fan-out pool for search_many and background revalidation (created on first use)
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
+        # Strong references to async revalidation tasks until they finish
+        self._background_tasks: set = set()
+    
+    def _build_params(self, query: str, cx: str, num_results: int, safe_search: str) -> Dict[str, Any]:
+        """Build request parameters."""
+        return {
+            "key": self.api_key,
+            "cx": cx,
+            "q": query,
+            "num": min(num_results, 10),  # Google CSE max is 10
+            "safe": safe_search
+        }
+    
+    @staticmethod
+    def _parse_hits(data: Dict[str, Any], num_results: int) -> List[SearchHit]:
+        """Convert a CSE JSON response to SearchHit objects."""
+        hits = []
+        for item in data.get("items", [])[:num_results]:
+            hit = SearchHit(
+                title=item.get("title", ""),
+                url=item.get("link", ""),
+                snippet=item.get("snippet", ""),
+                display_url=item.get("displayLink", "")
+            )
+            hits.append(hit)
+        return hits
     
     def search(
         self,
@@ -59,43 +150,344 @@ class GoogleCSE:
             safe_search: Safe search level (active, off)
         
         Returns:
-            List of SearchHit objects
+            List of SearchHit objects ([] if the call failed)
+        
+        Raises:
+            CircuitOpenError: Cache miss while the circuit breaker rejects calls
         """
         if not cx:
             raise ValueError("Custom Search Engine ID (cx) is required")
         
-        params = {
-            "key": self.api_key,
-            "cx": cx,
-            "q": query,
-            "num": min(num_results, 10),  # Google CSE max is 10
-            "safe": safe_search
-        }
+        cache = self._cache_for(safe_search)
+        if cache is not None:
+            cached, state = cache.lookup(cx, query, num_results)
+            if state == STALE and cache.begin_revalidation(cx, query, num_results):
+                # Serve the stale result now, refresh it in the background
+                self._get_executor().submit(self._revalidate, query, cx, num_results, safe_search)
+            if cached is not None:
+                return [SearchHit(**hit) for hit in cached]
+        
+        # Identical queries in flight (e.g. other sessions) share one API call
+        flights = get_single_flight("cse")
+        if flights is not None:
+            key = self._flight_key(query, cx, num_results, safe_search)
+            return flights.do(key, self._fetch_and_store, query, cx, num_results, safe_search)
+        return self._fetch_and_store(query, cx, num_results, safe_search)
+    
+    @staticmethod
+    def _flight_key(query: str, cx: str, num_results: int, safe_search: str) -> Tuple[str, str, int, str]:
+        return (cx, normalize_query(query), num_results, safe_search)
+    
+    def _fetch_and_store(self, query: str, cx: str, num_results: int, safe_search: str) -> List[SearchHit]:
+        """Call the API and cache a successful response."""
+        hits = self._fetch(query, cx, num_results, safe_search)
+        if hits is None:
+            return []
+        cache = self._cache_for(safe_search)
+        if cache is not None:
+            cache.update(cx, query, num_results, [asdict(hit) for hit in hits])
+        return hits
+    
+    def _cache_for(self, safe_search: str) -> Optional[SearchCache]:
+        """Cache to use for a call (keys assume the default safe search level)."""
+        return self.cache if safe_search == "active" else None
+    
+    def can_afford(self, cx: Optional[str], queries: int = 1, priority: str = "normal") -> bool:
+        """Whether the quota leaves room for `queries` more searches at this priority."""
+        if not cx:
+            return False
+        return self.quota is None or self.quota.can_afford(self.api_key, cx, queries, priority)
+    
+    def reserve(
+        self,
+        cx: Optional[str],
+        queries: int = 1,
+        priority: str = "normal",
+        reservation: Optional[QuotaReservation] = None
+    ) -> Optional[QuotaReservation]:
+        """Book `queries` searches ahead above the priority's floor; None if they do not fit."""
+        if not cx:
+            return None
+        if self.quota is None:
+            return reservation or QuotaReservation(None, self.api_key, cx)
+        return self.quota.reserve(self.api_key, cx, queries, priority, reservation)
+    
+    def _spend_quota(self, cx: str) -> bool:
+        """Book one query on the quota, from the active reservation if any (True if there is no quota)."""
+        if self.quota is None:
+            return True
+        reservation = active_reservation()
+        if reservation is not None and reservation.quota is self.quota and reservation.take(cx):
+            return True
+        return self.quota.try_spend(self.api_key, cx)
+    
+    def _record_quota_error(self, cx: str, status_code: int, body: str) -> None:
+        """Mark the daily quota as used up when Google reports it exhausted."""
+        if self.quota is not None and status_code == 429 and "per day" in body.lower():
+            self.quota.mark_exhausted(self.api_key, cx)
+    
+    def _acquire_call(self, cx: str) -> bool:
+        """
+        Check the circuit breaker, then book the query on the quota.
+        
+        Raises:
+            CircuitOpenError: The breaker rejected the call (open, or half-open
+                with its probe already out), so callers can degrade instead of
+                treating it as a search without results
+        """
+        if self.breaker is not None and not self.breaker.allow_request():
+            raise CircuitOpenError(self.breaker.name, self.breaker.state)
+        if not self._spend_quota(cx):
+            self._release_call()
+            return False
+        return True
+    
+    def _release_call(self) -> None:
+        """Give back a breaker probe slot taken by _acquire_call without recording an outcome."""
+        if self.breaker is not None:
+            self.breaker.release()
+    
+    def _record_outcome(self, ok: bool) -> None:
+        """Feed the outcome of a sent call to the circuit breaker."""
+        if self.breaker is None:
+            return
+        if ok:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+    
+    def _fetch(self, query: str, cx: str, num_results: int, safe_search: str) -> Optional[List[SearchHit]]:
+        """
+        Call the CSE API (circuit breaker and quota checked, rate limited).
+        
+        Returns None on failure so errors are never cached.
+        """
+        if not self._acquire_call(cx):
+            return None
         
+        recorded = False
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
+            params = self._build_params(query, cx, num_results, safe_search)
             
-            data = response.json()
-            hits = []
+            # Shared per-PSE query bucket (smooths bursts from concurrent sessions)
+            rate_limiter = get_rate_limiter()
+            if rate_limiter is not None:
+                rate_limiter.acquire([(rate_limiter.cse_bucket(cx), 1)])
             
-            for item in data.get("items", [])[:num_results]:
-                hit = SearchHit(
-                    title=item.get("title", ""),
-                    url=item.get("link", ""),
-                    snippet=item.get("snippet", ""),
-                    display_url=item.get("displayLink", "")
-                )
-                hits.append(hit)
+            try:
+                for attempt in range(self.max_retries + 1):
+                    response = self._session.get(self.base_url, params=params, timeout=self.timeout)
+                    if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                        break
+                    # A retry is another billed query
+                    if not self._spend_quota(cx):
+                        break
+                    time.sleep(self.backoff_factor * (2 ** attempt))
+                response.raise_for_status()
+                
+                hits = self._parse_hits(response.json(), num_results)
+                
+            except requests.exceptions.RequestException as e:
+                # Graceful error handling
+                if isinstance(e, requests.exceptions.HTTPError) and e.response is not None:
+                    self._record_quota_error(cx, e.response.status_code, e.response.text)
+                self._record_outcome(False)
+                recorded = True
+                return None
+            except (KeyError, ValueError) as e:
+                # JSON parsing error
+                self._record_outcome(False)
+                recorded = True
+                return None
             
+            self._record_outcome(True)
+            recorded = True
             return hits
-            
-        except requests.exceptions.RequestException as e:
-            # Graceful error handling
-            return []
-        except (KeyError, ValueError) as e:
-            # JSON parsing error
+        finally:
+            if not recorded:
+                # Abandoned call (interrupted, unexpected error): free the half-open probe slot
+                self._release_call()
+    
+    def _revalidate(self, query: str, cx: str, num_results: int, safe_search: str) -> None:
+        """Refresh a stale cache entry (runs on the fan-out pool)."""
+        try:
+            hits = self._fetch(query, cx, num_results, safe_search)
+            if hits is not None:
+                self.cache.update(cx, query, num_results, [asdict(hit) for hit in hits])
+        except CircuitOpenError:
+            # Backend is failing - keep serving the stale entry
+            pass
+        finally:
+            self.cache.end_revalidation(cx, query, num_results)
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the AsyncClient bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            connect_timeout, read_timeout = self.timeout
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+                # httpx retries connection failures only; status retries are done in _afetch
+                transport=httpx.AsyncHTTPTransport(retries=self.max_retries)
+            )
+            self._async_clients[loop] = client
+        return client
+    
+    async def asearch(
+        self,
+        query: str,
+        cx: Optional[str] = None,
+        num_results: int = 5,
+        safe_search: str = "active"
+    ) -> List[SearchHit]:
+        """
+        Perform web search using Google CSE without blocking the event loop.
+        
+        Same arguments and graceful error handling as search().
+        """
+        if not cx:
+            raise ValueError("Custom Search Engine ID (cx) is required")
+        
+        cache = self._cache_for(safe_search)
+        if cache is not None:
+            # SQLite lookup off the event loop
+            cached, state = await asyncio.get_running_loop().run_in_executor(
+                None, cache.lookup, cx, query, num_results
+            )
+            if state == STALE and cache.begin_revalidation(cx, query, num_results):
+                task = asyncio.ensure_future(self._arevalidate(query, cx, num_results, safe_search))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            if cached is not None:
+                return [SearchHit(**hit) for hit in cached]
+        
+        flights = get_single_flight("cse")
+        if flights is not None:
+            key = self._flight_key(query, cx, num_results, safe_search)
+            return await flights.ado(key, self._afetch_and_store, query, cx, num_results, safe_search)
+        return await self._afetch_and_store(query, cx, num_results, safe_search)
+    
+    async def _afetch_and_store(self, query: str, cx: str, num_results: int, safe_search: str) -> List[SearchHit]:
+        """Async version of _fetch_and_store."""
+        hits = await self._afetch(query, cx, num_results, safe_search)
+        if hits is None:
             return []
+        cache = self._cache_for(safe_search)
+        if cache is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, cache.update, cx, query, num_results, [asdict(hit) for hit in hits]
+            )
+        return hits
+    
+    async def _afetch(self, query: str, cx: str, num_results: int, safe_search: str) -> Optional[List[SearchHit]]:
+        """Async version of _fetch."""
+        if not self._acquire_call(cx):
+            return None
+        
+        recorded = False
+        try:
+            params = self._build_params(query, cx, num_results, safe_search)
+            
+            rate_limiter = get_rate_limiter()
+            if rate_limiter is not None:
+                await rate_limiter.aacquire([(rate_limiter.cse_bucket(cx), 1)])
+            
+            try:
+                client = self._get_async_client()
+                for attempt in range(self.max_retries + 1):
+                    response = await client.get(self.base_url, params=params)
+                    if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                        break
+                    if not self._spend_quota(cx):
+                        break
+                    await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+                response.raise_for_status()
+                
+                hits = self._parse_hits(response.json(), num_results)
+                
+            except httpx.HTTPError as e:
+                # Graceful error handling
+                if isinstance(e, httpx.HTTPStatusError):
+                    self._record_quota_error(cx, e.response.status_code, e.response.text)
+                self._record_outcome(False)
+                recorded = True
+                return None
+            except (KeyError, ValueError) as e:
+                # JSON parsing error
+                self._record_outcome(False)
+                recorded = True
+                return None
+            
+            self._record_outcome(True)
+            recorded = True
+            return hits
+        finally:
+            if not recorded:
+                # Abandoned call (cancelled while rate limited or in flight, unexpected
+                # error) - neither a success nor a failure: free the half-open probe slot
+                self._release_call()
+    
+    async def _arevalidate(self, query: str, cx: str, num_results: int, safe_search: str) -> None:
+        """Async version of _revalidate (runs as a background task)."""
+        try:
+            hits = await self._afetch(query, cx, num_results, safe_search)
+            if hits is not None:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.cache.update, cx, query, num_results, [asdict(hit) for hit in hits]
+                )
+        except CircuitOpenError:
+            pass
+        finally:
+            self.cache.end_revalidation(cx, query, num_results)
+    
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.pool_size,
+                    thread_name_prefix="google-cse"
+                )
+            return self._executor
+    
+    def search_many(
+        self,
+        queries: Sequence[str],
+        cx: Optional[str] = None,
+        num_results: int = 5,
+        max_results: Optional[int] = None
+    ) -> List[SearchHit]:
+        """
+        Run several queries concurrently and merge their hits.
+        
+        Latency is bounded by the slowest query instead of the sum of all of them.
+        
+        Args:
+            queries: Search query strings
+            cx: Custom Search Engine ID
+            num_results: Number of results per query (max 10)
+            max_results: Cap on merged hits (None = keep all)
+        
+        Returns:
+            SearchHit objects in query order, deduplicated by URL
+        """
+        if not cx:
+            raise ValueError("Custom Search Engine ID (cx) is required")
+        
+        if len(queries) <= 1:
+            results = [self.search(query, cx=cx, num_results=num_results) for query in queries]
+        else:
+            executor = self._get_executor()
+            # Each query runs in a copy of the caller's context (quota reservation, traces)
+            futures = [
+                executor.submit(contextvars.copy_context().run, self.search, query, cx=cx, num_results=num_results)
+                for query in queries
+            ]
+            # Let every query finish before raising (a breaker probe is not abandoned)
+            concurrent.futures.wait(futures)
+            results = [future.result() for future in futures]
+        return self.merge_hits(results, max_results)
     
     def search_weather(
         self,
@@ -135,4 +527,72 @@ class GoogleCSE:
         if not self.cx_safety:
             raise ValueError("GOOGLE_CSE_CX_SAFETY is required for safety search")
         
-        return self.search(query, cx=self.cx_safety, num_results=num_results)
\ No newline at end of file
+        return self.search(query, cx=self.cx_safety, num_results=num_results)
+    
+    async def asearch_weather(
+        self,
+        query: str,
+        num_results: int = 5
+    ) -> List[SearchHit]:
+        """Async version of search_weather."""
+        if not self.cx_weather:
+            raise ValueError("GOOGLE_CSE_CX_WEATHER is required for weather search")
+        
+        return await self.asearch(query, cx=self.cx_weather, num_results=num_results)
+    
+    async def asearch_safety(
+        self,
+        query: str,
+        num_results: int = 5
+    ) -> List[SearchHit]:
+        """Async version of search_safety."""
+        if not self.cx_safety:
+            raise ValueError("GOOGLE_CSE_CX_SAFETY is required for safety search")
+        
+        return await self.asearch(query, cx=self.cx_safety, num_results=num_results)
+    
+    def close(self) -> None:
+        """Close pooled connections (async clients are dropped with their loops)."""
+        self._session.close()
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+_cse_client: Optional[GoogleCSE] = None
+_cse_client_lock = threading.Lock()
+
+
+def get_cse_client() -> Optional[GoogleCSE]:
+    """
+    Get the process-wide Google CSE client configured from environment variables.
+    
+    - GOOGLE_CSE_API_KEY / GOOGLE_CSE_CX_WEATHER / GOOGLE_CSE_CX_SAFETY: credentials
+    - GOOGLE_CSE_POOL_SIZE: max keep-alive connections (default: 10)
+    - GOOGLE_CSE_MAX_RETRIES / GOOGLE_CSE_BACKOFF: retries on connection errors and 5xx (default: 2 / 0.3s)
+    - GOOGLE_CSE_CONNECT_TIMEOUT / GOOGLE_CSE_READ_TIMEOUT: per-call timeouts (default: 3.05s / 10s)
+    - SEARCH_CACHE_*: result cache settings (see tools.search_cache.get_search_cache)
+    - GOOGLE_CSE_*_BUDGET / CSE_QUOTA_*: quota settings (see tools.cse_quota.get_cse_quota)
+    - CIRCUIT_BREAKER_*: circuit breaker settings (see tools.circuit_breaker.get_circuit_breaker)
+    
+    Returns:
+        Shared GoogleCSE, or None if GOOGLE_CSE_API_KEY is not set
+    """
+    global _cse_client
+    
+    with _cse_client_lock:
+        if _cse_client is None:
+            if not os.getenv("GOOGLE_CSE_API_KEY"):
+                return None
+            _cse_client = GoogleCSE(
+                pool_size=int(os.getenv("GOOGLE_CSE_POOL_SIZE", 10)),
+                max_retries=int(os.getenv("GOOGLE_CSE_MAX_RETRIES", 2)),
+                backoff_factor=float(os.getenv("GOOGLE_CSE_BACKOFF", 0.3)),
+                connect_timeout=float(os.getenv("GOOGLE_CSE_CONNECT_TIMEOUT", 3.05)),
+                read_timeout=float(os.getenv("GOOGLE_CSE_READ_TIMEOUT", 10)),
+                cache=get_search_cache(),
+                quota=get_cse_quota(),
+                breaker=get_circuit_breaker("cse"),
+            )
+        return _cse_client
@@ -0,0 +1,440 @@
+"""
+Offline BM25 evidence index: a drop-in search provider over a local travel corpus.
+
+The index is built once from JSONL dumps (e.g. Wikivoyage pages, travel
+advisories) and memory-mapped at query time, so web-grounded validators get
+evidence without network calls, quota or rate limits.
+
+Corpus format (one JSON object per line):
+    {"title": "Tokyo", "url": "https://...", "text": "...",
+     "section": "Climate", "collection": "weather"}
+"section", "collection" and "display_url" are optional.
+
+Usage:
+    python -m tools.local_index build --corpus weather=data/wikivoyage.jsonl --corpus safety=data/advisories.jsonl
+    python -m tools.local_index search "Tokyo March weather" --collection weather
+"""
+import argparse
+import json
+import math
+import os
+import re
+import shutil
+import threading
+import time
+import unicodedata
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import numpy as np
+
+from .search_provider import SearchHit, SearchProvider
+
+# Bump when the on-disk layout or tokenization changes (old indexes must be rebuilt)
+INDEX_VERSION = 1
+
+DEFAULT_COLLECTION = "general"
+
+# Score accumulation uses a dense array when the passage ID span of a query is
+# at most this many times the number of postings read
+DENSE_SPAN_FACTOR = 16
+
+TOKEN_PATTERN = re.compile(r"\w+")
+HANGUL_PATTERN = re.compile(r"[가-힣]")
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "the", "to", "with",
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index terms (NFKC, case-folded).
+
+    Hangul words are split into character bigrams so particles and compounds
+    still match ("도쿄의" -> "도쿄", "쿄의") without a morphological analyzer.
+    """
+    tokens = []
+    for word in TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).casefold()):
+        if HANGUL_PATTERN.search(word):
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        elif word not in STOPWORDS and (len(word) > 1 or word.isdigit()):
+            tokens.append(word)
+    return tokens
+
+
+def split_passages(text: str, passage_words: int) -> List[str]:
+    """Split a document into passages of about passage_words words."""
+    words = text.split()
+    return [" ".join(words[i:i + passage_words]) for i in range(0, len(words), passage_words)]
+
+
+def iter_corpus(spec: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read records of a corpus spec ("collection=path" or "path").
+
+    The record's own "collection" field wins over the spec's collection.
+    """
+    collection, _, path = spec.rpartition("=")
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            record.setdefault("collection", collection or DEFAULT_COLLECTION)
+            yield record
+
+
+def build_index(
+    corpus_specs: Sequence[str],
+    index_path: str,
+    passage_words: int = 80,
+    snippet_chars: int = 400,
+    k1: float = 1.2,
+    b: float = 0.75
+) -> Dict[str, Any]:
+    """
+    Build a BM25 index from corpus files.
+
+    Documents are split into passages (the unit of retrieval, so hits carry a
+    focused snippet). Each collection is indexed independently (own document
+    frequencies and average length), like a separate PSE. BM25 term weights
+    are precomputed per posting and postings are stored impact-ordered, so a
+    query is a few array slices and one scatter-add.
+
+    Files written to index_path:
+        meta.json            version, BM25 parameters, per-collection stats
+        vocab.json           {collection: {term: [posting start, posting count]}}
+        postings_doc.npy     uint32 passage IDs
+        postings_weight.npy  float32 BM25 weights (descending within a term)
+        doc_offsets.npy      uint64 byte offsets of passages in docs.bin
+        docs.bin             passage records (title, url, snippet, display_url) as JSON lines
+
+    Args:
+        corpus_specs: "collection=path" or "path" JSONL files
+        index_path: Output directory (replaced atomically)
+        passage_words: Words per passage
+        snippet_chars: Max snippet length stored per passage
+        k1: BM25 term frequency saturation
+        b: BM25 length normalization
+
+    Returns:
+        meta.json contents
+    """
+    tmp_path = index_path.rstrip("/") + ".tmp"
+    if os.path.exists(tmp_path):
+        shutil.rmtree(tmp_path)
+    os.makedirs(tmp_path)
+
+    # (collection, term) -> passage IDs / term frequencies (compact arrays: dumps are large)
+    posting_docs: Dict[Tuple[str, str], array] = {}
+    posting_tfs: Dict[Tuple[str, str], array] = {}
+    doc_lengths = array("I")
+    doc_offsets = array("Q", [0])
+    collection_stats: Dict[str, Dict[str, float]] = {}
+
+    with open(os.path.join(tmp_path, "docs.bin"), "wb") as docs_file:
+        for spec in corpus_specs:
+            for record in iter_corpus(spec):
+                collection = record["collection"]
+                title = record.get("title", "")
+                if record.get("section"):
+                    title = f"{title} - {record['section']}"
+                url = record.get("url", "")
+                display_url = record.get("display_url") or urlparse(url).netloc
+
+                for passage in split_passages(record.get("text", ""), passage_words):
+                    terms = tokenize(f"{title} {passage}")
+                    if not terms:
+                        continue
+                    doc_id = len(doc_lengths)
+                    for term, tf in Counter(terms).items():
+                        key = (collection, term)
+                        if key not in posting_docs:
+                            posting_docs[key] = array("I")
+                            posting_tfs[key] = array("H")
+                        posting_docs[key].append(doc_id)
+                        posting_tfs[key].append(min(tf, 65535))
+                    doc_lengths.append(len(terms))
+
+                    stats = collection_stats.setdefault(collection, {"documents": 0, "total_length": 0})
+                    stats["documents"] += 1
+                    stats["total_length"] += len(terms)
+
+                    line = json.dumps({
+                        "title": title,
+                        "url": url,
+                        "snippet": passage[:snippet_chars],
+                        "display_url": display_url,
+                    }, ensure_ascii=False).encode("utf-8") + b"\n"
+                    docs_file.write(line)
+                    doc_offsets.append(doc_offsets[-1] + len(line))
+
+    lengths = np.frombuffer(doc_lengths, dtype=np.uint32).astype(np.float32)
+    total_postings = sum(len(docs) for docs in posting_docs.values())
+    out_docs = np.empty(total_postings, dtype=np.uint32)
+    out_weights = np.empty(total_postings, dtype=np.float32)
+    vocab: Dict[str, Dict[str, List[int]]] = {collection: {} for collection in collection_stats}
+
+    position = 0
+    for collection, term in sorted(posting_docs):
+        stats = collection_stats[collection]
+        num_docs = stats["documents"]
+        avg_length = stats["total_length"] / num_docs
+
+        docs = np.frombuffer(posting_docs[(collection, term)], dtype=np.uint32)
+        tfs = np.frombuffer(posting_tfs[(collection, term)], dtype=np.uint16).astype(np.float32)
+        df = len(docs)
+        idf = math.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+        weights = idf * tfs * (k1 + 1) / (tfs + k1 * (1 - b + b * lengths[docs] / avg_length))
+
+        # Impact order: the best postings of a term come first
+        order = np.argsort(-weights, kind="stable")
+        out_docs[position:position + df] = docs[order]
+        out_weights[position:position + df] = weights[order]
+        vocab[collection][term] = [position, df]
+        position += df
+
+    np.save(os.path.join(tmp_path, "postings_doc.npy"), out_docs)
+    np.save(os.path.join(tmp_path, "postings_weight.npy"), out_weights)
+    np.save(os.path.join(tmp_path, "doc_offsets.npy"), np.frombuffer(doc_offsets, dtype=np.uint64))
+
+    meta = {
+        "version": INDEX_VERSION,
+        "k1": k1,
+        "b": b,
+        "passage_words": passage_words,
+        "documents": len(doc_lengths),
+        "postings": total_postings,
+        "collections": {
+            collection: {
+                "documents": stats["documents"],
+                "avg_length": stats["total_length"] / stats["documents"],
+                "terms": len(vocab[collection]),
+            }
+            for collection, stats in collection_stats.items()
+        },
+    }
+    with open(os.path.join(tmp_path, "vocab.json"), "w", encoding="utf-8") as f:
+        json.dump(vocab, f, ensure_ascii=False, separators=(",", ":"))
+    with open(os.path.join(tmp_path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    # Swap in the new index (readers of the old one keep their open mappings)
+    if os.path.exists(index_path):
+        shutil.rmtree(index_path)
+    os.replace(tmp_path, index_path)
+    return meta
+
+
+class LocalSearchIndex(SearchProvider):
+    """
+    Memory-mapped BM25 index used as a search provider.
+
+    - cx_weather / cx_safety are collection names (None if the index has no
+      such collection; safety search then falls back to the weather collection
+      like it does with PSEs)
+    - Posting arrays and passages are memory-mapped: opening the index is
+      cheap and the OS page cache is shared between processes
+    - Each query term reads at most max_postings of its highest-weight
+      postings (impact-ordered early termination), which bounds query time
+      for very common terms
+    - No quota, rate limit, cache or circuit breaker: lookups are local
+    """
+
+    name = "local_index"
+
+    def __init__(
+        self,
+        index_path: str = ".cache/local_index",
+        weather_collection: str = "weather",
+        safety_collection: str = "safety",
+        max_postings: int = 4096
+    ):
+        """
+        Open an index built with build_index.
+
+        Args:
+            index_path: Index directory
+            weather_collection: Collection searched for weather / seasonality evidence
+            safety_collection: Collection searched for safety evidence
+            max_postings: Postings read per query term (highest weights first)
+        """
+        with open(os.path.join(index_path, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != INDEX_VERSION:
+            raise ValueError(
+                f"Local index at {index_path} has version {self.meta.get('version')}, "
+                f"expected {INDEX_VERSION} (rebuild with: python -m tools.local_index build)"
+            )
+        with open(os.path.join(index_path, "vocab.json"), encoding="utf-8") as f:
+            self._vocab: Dict[str, Dict[str, List[int]]] = json.load(f)
+
+        self.index_path = index_path
+        self.max_postings = max_postings
+        self.cx_weather = weather_collection if weather_collection in self._vocab else None
+        self.cx_safety = safety_collection if safety_collection in self._vocab else None
+
+        self._postings_doc = np.load(os.path.join(index_path, "postings_doc.npy"), mmap_mode="r")
+        self._postings_weight = np.load(os.path.join(index_path, "postings_weight.npy"), mmap_mode="r")
+        self._doc_offsets = np.load(os.path.join(index_path, "doc_offsets.npy"), mmap_mode="r")
+        self._docs = np.memmap(os.path.join(index_path, "docs.bin"), dtype=np.uint8, mode="r")
+
+        self._stats_lock = threading.Lock()
+        self._stats = {"searches": 0, "hits": 0}
+
+    def _load_hit(self, doc_id: int) -> SearchHit:
+        start, end = int(self._doc_offsets[doc_id]), int(self._doc_offsets[doc_id + 1])
+        return SearchHit(**json.loads(self._docs[start:end].tobytes()))
+
+    def search(
+        self,
+        query: str,
+        cx: Optional[str] = None,
+        num_results: int = 5,
+        safe_search: str = "active"
+    ) -> List[SearchHit]:
+        """
+        Search one collection with BM25.
+
+        Args:
+            query: Search query string
+            cx: Collection name
+            num_results: Number of results to return
+            safe_search: Ignored (the corpus is curated)
+
+        Returns:
+            List of SearchHit objects, best first
+        """
+        if not cx:
+            raise ValueError("Search scope (cx) is required")
+
+        vocab = self._vocab.get(cx, {})
+        slices = [vocab[term] for term in dict.fromkeys(tokenize(query)) if term in vocab]
+        hits: List[SearchHit] = []
+        if slices:
+            docs = np.concatenate([
+                self._postings_doc[start:start + min(count, self.max_postings)] for start, count in slices
+            ])
+            weights = np.concatenate([
+                self._postings_weight[start:start + min(count, self.max_postings)] for start, count in slices
+            ])
+            if len(slices) > 1:
+                # Sum weights per passage: dense scatter-add over the passage ID span
+                # when it is small relative to the postings read, otherwise sort-based
+                low = int(docs.min())
+                span = int(docs.max()) - low + 1
+                if span <= DENSE_SPAN_FACTOR * len(docs):
+                    weights = np.bincount(docs - low, weights=weights, minlength=span)
+                    docs = np.flatnonzero(weights)
+                    weights = weights[docs]
+                    docs += low
+                else:
+                    docs, inverse = np.unique(docs, return_inverse=True)
+                    weights = np.bincount(inverse, weights=weights)
+
+            if len(docs) > num_results:
+                top = np.argpartition(-weights, num_results)[:num_results]
+            else:
+                top = np.arange(len(docs))
+            top = top[np.argsort(-weights[top], kind="stable")]
+            hits = [self._load_hit(int(doc_id)) for doc_id in docs[top]]
+
+        with self._stats_lock:
+            self._stats["searches"] += 1
+            self._stats["hits"] += len(hits)
+        return hits
+
+    def stats(self) -> Dict[str, Any]:
+        """Return index size and search counters."""
+        with self._stats_lock:
+            return {
+                **self._stats,
+                "documents": self.meta["documents"],
+                "postings": self.meta["postings"],
+                "collections": {name: info["documents"] for name, info in self.meta["collections"].items()},
+            }
+
+
+_local_index: Optional[LocalSearchIndex] = None
+_local_index_lock = threading.Lock()
+
+
+def get_local_index() -> Optional[LocalSearchIndex]:
+    """
+    Get the process-wide local evidence index configured from environment variables.
+
+    - LOCAL_INDEX_PATH: index directory (default: .cache/local_index)
+    - LOCAL_INDEX_WEATHER_COLLECTION / LOCAL_INDEX_SAFETY_COLLECTION:
+      collections searched per axis (default: weather / safety)
+    - LOCAL_INDEX_MAX_POSTINGS: postings read per query term (default: 4096)
+
+    Returns:
+        Shared LocalSearchIndex, or None if no index has been built
+    """
+    global _local_index
+
+    with _local_index_lock:
+        if _local_index is None:
+            index_path = os.getenv("LOCAL_INDEX_PATH", ".cache/local_index")
+            if not os.path.exists(os.path.join(index_path, "meta.json")):
+                return None
+            _local_index = LocalSearchIndex(
+                index_path=index_path,
+                weather_collection=os.getenv("LOCAL_INDEX_WEATHER_COLLECTION", "weather"),
+                safety_collection=os.getenv("LOCAL_INDEX_SAFETY_COLLECTION", "safety"),
+                max_postings=int(os.getenv("LOCAL_INDEX_MAX_POSTINGS", 4096)),
+            )
+        return _local_index
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(
+        description="Build or query the local BM25 evidence index.",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = arg_parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="Build the index from JSONL corpus files")
+    build_parser.add_argument(
+        "--corpus", action="append", required=True,
+        help='JSONL corpus file, optionally prefixed with its collection ("weather=path"); repeatable'
+    )
+    build_parser.add_argument("--out", default=os.getenv("LOCAL_INDEX_PATH", ".cache/local_index"))
+    build_parser.add_argument("--passage-words", type=int, default=80)
+    build_parser.add_argument("--k1", type=float, default=1.2)
+    build_parser.add_argument("--b", type=float, default=0.75)
+
+    search_parser = subparsers.add_parser("search", help="Query a built index")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--collection", default="weather")
+    search_parser.add_argument("--num", type=int, default=5)
+    search_parser.add_argument("--index", default=os.getenv("LOCAL_INDEX_PATH", ".cache/local_index"))
+
+    args = arg_parser.parse_args()
+
+    if args.command == "build":
+        start = time.perf_counter()
+        meta = build_index(args.corpus, args.out, passage_words=args.passage_words, k1=args.k1, b=args.b)
+        print(f"Built {args.out} in {time.perf_counter() - start:.1f}s: "
+              f"{meta['documents']} passages, {meta['postings']} postings")
+        for name, info in meta["collections"].items():
+            print(f"  {name}: {info['documents']} passages, {info['terms']} terms")
+    else:
+        index = LocalSearchIndex(args.index)
+        start = time.perf_counter()
+        hits = index.search(args.query, cx=args.collection, num_results=args.num)
+        elapsed_us = (time.perf_counter() - start) * 1e6
+        for rank, hit in enumerate(hits, 1):
+            print(f"{rank}. {hit.title} ({hit.display_url})\n   {hit.snippet[:160]}")
+        print(f"\n{len(hits)} hits in {elapsed_us:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Process-wide rate limiting for OpenAI and Google CSE calls."""
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Rough token estimate: ~4 characters per token (Korean text is denser, so this
+# over-reserves slightly, which is the safe direction for a limiter)
+CHARS_PER_TOKEN = 4
+DEFAULT_COMPLETION_TOKENS = 512
+
+# Known per-model limits (requests/min, tokens/min); others use OPENAI_RPM / OPENAI_TPM
+MODEL_LIMITS: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (500, 200_000),
+    "gpt-4.1-mini": (500, 200_000),
+}
+
+
+def estimate_tokens(messages: Sequence[Any], max_tokens: Optional[int] = None) -> int:
+    """
+    Estimate prompt + completion tokens of a chat call before sending it.
+
+    Args:
+        messages: LangChain messages (or strings)
+        max_tokens: Completion limit if set on the model
+    """
+    chars = 0
+    for message in messages:
+        content = getattr(message, "content", message)
+        if isinstance(content, list):
+            content = " ".join(str(part.get("text", "")) if isinstance(part, dict) else str(part) for part in content)
+        chars += len(str(content))
+    return chars // CHARS_PER_TOKEN + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+class TokenBucket:
+    """
+    Token bucket implemented as GCRA with reservations.
+
+    reserve() books capacity immediately and returns how long the caller must
+    wait before using it. Because every caller books in arrival order, waiting
+    callers are served FIFO and bursts are spread out at the configured rate.
+    """
+
+    def __init__(self, rate_per_s: float, capacity: float):
+        """
+        Args:
+            rate_per_s: Refill rate (units per second)
+            capacity: Burst size (units)
+        """
+        self.rate_per_s = rate_per_s
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._tat = 0.0  # theoretical arrival time (monotonic clock)
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Book `amount` units and return the wait in seconds (0.0 = go now)."""
+        amount = min(amount, self.capacity)
+        interval = 1.0 / self.rate_per_s
+        now = time.monotonic()
+        with self._lock:
+            tat = max(self._tat, now) + amount * interval
+            self._tat = tat
+        return max(0.0, tat - self.capacity * interval - now)
+
+    def adjust(self, delta: float) -> None:
+        """Correct a reservation after the fact (e.g. actual vs. estimated tokens)."""
+        interval = 1.0 / self.rate_per_s
+        now = time.monotonic()
+        with self._lock:
+            self._tat = max(now - self.capacity * interval, self._tat + delta * interval)
+
+    def backlog_s(self) -> float:
+        """Seconds of booked work beyond the burst allowance."""
+        with self._lock:
+            return max(0.0, self._tat - time.monotonic() - self.capacity / self.rate_per_s)
+
+
+class RateLimiter:
+    """
+    Registry of named token buckets shared by all Streamlit sessions.
+
+    - "openai:<model>:rpm" / "openai:<model>:tpm": per-model request and token buckets
+    - "cse:<cx>": per-PSE query bucket
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats = {"calls": 0, "delayed": 0, "wait_s": 0.0}
+
+    def bucket(self, name: str, rate_per_s: float, capacity: float) -> TokenBucket:
+        """Get or create a bucket (the first caller's configuration wins)."""
+        with self._lock:
+            if name not in self._buckets:
+                self._buckets[name] = TokenBucket(rate_per_s, capacity)
+            return self._buckets[name]
+
+    def model_buckets(self, model: str) -> Tuple[TokenBucket, TokenBucket]:
+        """(requests, tokens) buckets for an OpenAI model; 10 seconds of burst each."""
+        rpm, tpm = MODEL_LIMITS.get(model, (500, 200_000))
+        rpm = float(os.getenv("OPENAI_RPM", rpm))
+        tpm = float(os.getenv("OPENAI_TPM", tpm))
+        return (
+            self.bucket(f"openai:{model}:rpm", rpm / 60, max(1.0, rpm / 60 * 10)),
+            self.bucket(f"openai:{model}:tpm", tpm / 60, max(1.0, tpm / 60 * 10)),
+        )
+
+    def cse_bucket(self, cx: str) -> TokenBucket:
+        """Query bucket for one Programmable Search Engine."""
+        qpm = float(os.getenv("GOOGLE_CSE_QPM", 100))
+        return self.bucket(f"cse:{cx}", qpm / 60, max(1.0, float(os.getenv("GOOGLE_CSE_BURST", 5))))
+
+    def _reserve(self, reservations: List[Tuple[TokenBucket, float]]) -> float:
+        wait = max((bucket.reserve(amount) for bucket, amount in reservations), default=0.0)
+        with self._lock:
+            self._stats["calls"] += 1
+            if wait > 0:
+                self._stats["delayed"] += 1
+                self._stats["wait_s"] += wait
+        return wait
+
+    def acquire(self, reservations: List[Tuple[TokenBucket, float]]) -> float:
+        """Reserve on every bucket and block until all of them allow the call."""
+        wait = self._reserve(reservations)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, reservations: List[Tuple[TokenBucket, float]]) -> float:
+        """Async variant of acquire (does not block the event loop)."""
+        wait = self._reserve(reservations)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """Return call/delay counters and the backlog of every bucket."""
+        with self._lock:
+            buckets = dict(self._buckets)
+            stats = dict(self._stats)
+        stats["backlog_s"] = {name: round(bucket.backlog_s(), 3) for name, bucket in buckets.items()}
+        return stats
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Get the process-wide rate limiter.
+
+    - RATE_LIMIT_ENABLED: "false" disables rate limiting (default: enabled)
+    - OPENAI_RPM / OPENAI_TPM: override per-model request / token limits
+    - GOOGLE_CSE_QPM / GOOGLE_CSE_BURST: per-PSE query rate and burst
+
+    Returns:
+        Shared RateLimiter, or None if disabled
+    """
+    global _rate_limiter
+
+    if os.getenv("RATE_LIMIT_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+        return _rate_limiter
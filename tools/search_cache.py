@@ -0,0 +1,237 @@
+"""Persistent Google CSE result cache (SQLite) with per-PSE TTLs and stale-while-revalidate."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bump to invalidate every cached search result
+CACHE_NAMESPACE = "travel-guide-search-v1"
+
+# Lookup states
+FRESH = "fresh"
+STALE = "stale"
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for caching (NFKC, case-folded, collapsed whitespace)."""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def make_search_key(cx: str, query: str, num_results: int) -> str:
+    """Build a cache key from (cx, normalized query, num)."""
+    digest = hashlib.sha256()
+    for part in (CACHE_NAMESPACE, cx, normalize_query(query), str(num_results)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class SearchCache:
+    """
+    SQLite-backed cache of search results.
+
+    - Each PSE (cx) has its own TTL (e.g. climate information stays valid far
+      longer than safety advisories); other PSEs use default_ttl_seconds
+    - Entries past their TTL but within stale_seconds are returned as STALE:
+      the caller serves them immediately and refreshes them in the background
+      (stale-while-revalidate); older entries are misses
+    - At most max_entries rows are kept (least recently used rows are evicted first)
+    - Thread-safe: searches run from several threads at once
+    """
+
+    def __init__(
+        self,
+        database_path: str = ".cache/search_cache.sqlite",
+        default_ttl_seconds: float = 24 * 60 * 60,
+        ttl_by_cx: Optional[Dict[str, float]] = None,
+        stale_seconds: float = 7 * 24 * 60 * 60,
+        max_entries: int = 5_000
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            database_path: SQLite file path (":memory:" for a non-persistent store)
+            default_ttl_seconds: Freshness window of PSEs without their own TTL
+            ttl_by_cx: Freshness window per PSE ID
+            stale_seconds: How long past the TTL an entry may still be served while revalidating
+            max_entries: SQLite row limit
+        """
+        self.database_path = database_path
+        self.default_ttl_seconds = default_ttl_seconds
+        self.ttl_by_cx = dict(ttl_by_cx or {})
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._revalidating: set = set()
+        self._stats = {"fresh_hits": 0, "stale_hits": 0, "misses": 0, "updates": 0, "revalidations": 0, "evictions": 0}
+
+        directory = os.path.dirname(database_path)
+        if database_path != ":memory:" and directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(database_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache ("
+            " key TEXT PRIMARY KEY,"
+            " cx TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS search_cache_accessed ON search_cache (accessed_at)")
+        self._conn.commit()
+
+    def ttl_for(self, cx: str) -> float:
+        """Freshness window of a PSE."""
+        return self.ttl_by_cx.get(cx, self.default_ttl_seconds)
+
+    def lookup(self, cx: str, query: str, num_results: int) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        Look up cached results.
+
+        Returns:
+            (results, state) - state is FRESH, STALE or None (miss)
+        """
+        key = make_search_key(cx, query, num_results)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None, None
+
+            value, created_at = row
+            age = now - created_at
+            ttl = self.ttl_for(cx)
+            if age > ttl + self.stale_seconds:
+                self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self._stats["misses"] += 1
+                return None, None
+
+            try:
+                results = json.loads(value)
+            except ValueError:
+                # Unreadable entry - treat as miss
+                self._stats["misses"] += 1
+                return None, None
+
+            self._conn.execute("UPDATE search_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            state = FRESH if age <= ttl else STALE
+            self._stats["fresh_hits" if state == FRESH else "stale_hits"] += 1
+            return results, state
+
+    def update(self, cx: str, query: str, num_results: int, results: List[Dict[str, Any]]) -> None:
+        """Store results and evict beyond the size limit."""
+        key = make_search_key(cx, query, num_results)
+        now = time.time()
+        value = json.dumps(results, ensure_ascii=False)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, cx, value, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, cx, value, now, now)
+            )
+            self._stats["updates"] += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop the least recently used rows beyond max_entries (caller holds the lock)."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._stats["evictions"] += self._conn.execute(
+                "DELETE FROM search_cache WHERE key IN ("
+                " SELECT key FROM search_cache ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            ).rowcount
+
+    def begin_revalidation(self, cx: str, query: str, num_results: int) -> bool:
+        """Claim the background refresh of a stale entry (False if one is already running)."""
+        key = make_search_key(cx, query, num_results)
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            self._stats["revalidations"] += 1
+            return True
+
+    def end_revalidation(self, cx: str, query: str, num_results: int) -> None:
+        """Release a claim taken with begin_revalidation."""
+        key = make_search_key(cx, query, num_results)
+        with self._lock:
+            self._revalidating.discard(key)
+
+    def clear(self) -> None:
+        """Delete every cached result."""
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the number of stored entries."""
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+            hits = self._stats["fresh_hits"] + self._stats["stale_hits"]
+            lookups = hits + self._stats["misses"]
+            return {
+                **self._stats,
+                "hits": hits,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "entries": entries,
+            }
+
+
+_search_cache: Optional[SearchCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """
+    Get the process-wide search cache configured from environment variables.
+
+    - SEARCH_CACHE_ENABLED: "false" disables the cache (default: enabled)
+    - SEARCH_CACHE_PATH: SQLite path (default: .cache/search_cache.sqlite)
+    - SEARCH_CACHE_TTL_WEATHER_SECONDS: TTL of the weather PSE (default: 604800 = 7 days)
+    - SEARCH_CACHE_TTL_SAFETY_SECONDS: TTL of the safety PSE (default: 86400 = 1 day)
+    - SEARCH_CACHE_TTL_SECONDS: TTL of other PSEs (default: 86400)
+    - SEARCH_CACHE_STALE_SECONDS: stale-while-revalidate window past the TTL (default: 604800)
+    - SEARCH_CACHE_MAX_ENTRIES: row limit (default: 5000)
+
+    Returns:
+        Shared SearchCache, or None if disabled
+    """
+    global _search_cache
+
+    if os.getenv("SEARCH_CACHE_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+
+    with _search_cache_lock:
+        if _search_cache is None:
+            ttl_by_cx = {}
+            if os.getenv("GOOGLE_CSE_CX_WEATHER"):
+                ttl_by_cx[os.getenv("GOOGLE_CSE_CX_WEATHER")] = float(
+                    os.getenv("SEARCH_CACHE_TTL_WEATHER_SECONDS", 7 * 24 * 60 * 60)
+                )
+            if os.getenv("GOOGLE_CSE_CX_SAFETY"):
+                ttl_by_cx[os.getenv("GOOGLE_CSE_CX_SAFETY")] = float(
+                    os.getenv("SEARCH_CACHE_TTL_SAFETY_SECONDS", 24 * 60 * 60)
+                )
+            _search_cache = SearchCache(
+                database_path=os.getenv("SEARCH_CACHE_PATH", ".cache/search_cache.sqlite"),
+                default_ttl_seconds=float(os.getenv("SEARCH_CACHE_TTL_SECONDS", 24 * 60 * 60)),
+                ttl_by_cx=ttl_by_cx,
+                stale_seconds=float(os.getenv("SEARCH_CACHE_STALE_SECONDS", 7 * 24 * 60 * 60)),
+                max_entries=int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", 5_000)),
+            )
+        return _search_cache
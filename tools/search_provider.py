@@ -0,0 +1,155 @@
+"""Search provider interface shared by the Google CSE client and the local evidence index."""
+import asyncio
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from .circuit_breaker import CLOSED
+from .cse_quota import QuotaReservation
+
+
+@dataclass
+class SearchHit:
+    """Standard search result structure."""
+    title: str
+    url: str
+    snippet: str
+    display_url: Optional[str] = None
+
+
+class SearchProvider:
+    """
+    Backend behind the web-grounded validators.
+
+    A provider exposes two search scopes, cx_weather and cx_safety (a PSE ID
+    for Google CSE, a collection name for the local index), and returns
+    SearchHit lists. Subclasses implement search(); the fan-out, async and
+    budgeting methods have defaults for backends that need no network.
+
+    cache / quota / breaker are None for backends without them.
+    """
+
+    name = "provider"
+    cx_weather: Optional[str] = None
+    cx_safety: Optional[str] = None
+    cache = None
+    quota = None
+    breaker = None
+
+    def search(
+        self,
+        query: str,
+        cx: Optional[str] = None,
+        num_results: int = 5,
+        safe_search: str = "active"
+    ) -> List[SearchHit]:
+        """Search one scope (see GoogleCSE.search)."""
+        raise NotImplementedError
+
+    async def asearch(
+        self,
+        query: str,
+        cx: Optional[str] = None,
+        num_results: int = 5,
+        safe_search: str = "active"
+    ) -> List[SearchHit]:
+        """Async version of search (runs inline by default: local lookups do not block)."""
+        return self.search(query, cx=cx, num_results=num_results, safe_search=safe_search)
+
+    @staticmethod
+    def merge_hits(results: Sequence[List[SearchHit]], max_results: Optional[int] = None) -> List[SearchHit]:
+        """
+        Merge per-query hits in query order, keeping the first hit per URL.
+
+        Args:
+            results: Hits of each query, in query order
+            max_results: Cap on merged hits (None = keep all)
+        """
+        seen_urls = set()
+        unique_hits = []
+        for hits in results:
+            for hit in hits:
+                if hit.url not in seen_urls:
+                    seen_urls.add(hit.url)
+                    unique_hits.append(hit)
+        return unique_hits[:max_results] if max_results is not None else unique_hits
+
+    def search_many(
+        self,
+        queries: Sequence[str],
+        cx: Optional[str] = None,
+        num_results: int = 5,
+        max_results: Optional[int] = None
+    ) -> List[SearchHit]:
+        """Run several queries and merge their hits (in query order, deduped by URL)."""
+        if not cx:
+            raise ValueError("Search scope (cx) is required")
+        results = [self.search(query, cx=cx, num_results=num_results) for query in queries]
+        return self.merge_hits(results, max_results)
+
+    async def asearch_many(
+        self,
+        queries: Sequence[str],
+        cx: Optional[str] = None,
+        num_results: int = 5,
+        max_results: Optional[int] = None
+    ) -> List[SearchHit]:
+        """
+        Async version of search_many.
+        
+        Every query finishes before an error is raised, so a call that did go
+        out (e.g. a circuit breaker probe) is not abandoned halfway.
+        """
+        if not cx:
+            raise ValueError("Search scope (cx) is required")
+        results = await asyncio.gather(*(
+            self.asearch(query, cx=cx, num_results=num_results) for query in queries
+        ), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return self.merge_hits(results, max_results)
+
+    def can_afford(self, cx: Optional[str], queries: int = 1, priority: str = "normal") -> bool:
+        """Whether `queries` more searches may be sent (no budget by default)."""
+        return bool(cx)
+
+    def reserve(
+        self,
+        cx: Optional[str],
+        queries: int = 1,
+        priority: str = "normal",
+        reservation: Optional[QuotaReservation] = None
+    ) -> Optional[QuotaReservation]:
+        """Book `queries` searches ahead (see CSEQuota.reserve); nothing to book by default."""
+        if not cx:
+            return None
+        return reservation or QuotaReservation(None, "", cx)
+
+    @property
+    def breaker_state(self) -> str:
+        """Circuit breaker state ("closed" if there is no breaker)."""
+        return self.breaker.state if self.breaker is not None else CLOSED
+
+    def close(self) -> None:
+        """Release connections / file handles."""
+
+
+def get_search_provider() -> Optional[SearchProvider]:
+    """
+    Get the process-wide search provider selected by environment variables.
+
+    - SEARCH_PROVIDER: "google_cse" (default) or "local"
+      (see tools.google_cse.get_cse_client / tools.local_index.get_local_index)
+
+    Returns:
+        Shared provider, or None if the selected backend is not configured
+    """
+    provider = os.getenv("SEARCH_PROVIDER", "google_cse").lower()
+    if provider == "local":
+        from .local_index import get_local_index
+        return get_local_index()
+    if provider in ("google_cse", "cse", "google"):
+        from .google_cse import get_cse_client
+        return get_cse_client()
+    raise ValueError(f"Unknown SEARCH_PROVIDER: {provider} (expected 'google_cse' or 'local')")
@@ -0,0 +1,124 @@
+"""Single-flight coalescing of identical concurrent calls (shared across threads and event loops)."""
+import asyncio
+import concurrent.futures
+import copy
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one outbound call.
+
+    The first caller for a key (the leader) runs the call; callers arriving
+    while it is in flight wait on the leader's future instead of making their
+    own call. Followers receive a deep copy of the result (callers mutate
+    result dicts) or the leader's exception. Once the call finishes the key
+    is released, so later callers start a new call (or hit a cache the
+    leader filled).
+
+    Sync (do) and async (ado) callers share the same in-flight table, so a
+    request in one Streamlit session can be served by a call started from
+    another session's thread or event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, concurrent.futures.Future] = {}
+        self._stats = {"leaders": 0, "coalesced": 0}
+
+    def _join(self, key: Hashable) -> Tuple[concurrent.futures.Future, bool]:
+        """Return (future, is_leader) for a key."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future, False
+            future = concurrent.futures.Future()
+            self._calls[key] = future
+            self._stats["leaders"] += 1
+            return future, True
+
+    def _release(self, key: Hashable, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def do(self, key: Hashable, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run func(*args, **kwargs) unless an identical call is already in flight."""
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                    raise
+                finally:
+                    self._release(key, future)
+                future.set_result(result)
+                return result
+
+            try:
+                return copy.deepcopy(future.result())
+            except concurrent.futures.CancelledError:
+                # The (async) leader was cancelled - retry, possibly as the new leader
+                continue
+
+    async def ado(self, key: Hashable, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Async version of do (func returns an awaitable)."""
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                try:
+                    result = await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    # Followers must not inherit the leader's cancellation; they retry
+                    future.cancel()
+                    raise
+                except BaseException as exc:
+                    future.set_exception(exc)
+                    raise
+                finally:
+                    self._release(key, future)
+                future.set_result(result)
+                return result
+
+            try:
+                # shield: a cancelled follower must not cancel the shared call
+                result = await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    continue
+                raise
+            return copy.deepcopy(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return leader / coalesced counters and the number of calls in flight."""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+
+_single_flights: Dict[str, SingleFlight] = {}
+_single_flights_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> Optional[SingleFlight]:
+    """
+    Get the process-wide single-flight group for a kind of call (e.g. "cse", "llm").
+
+    - SINGLE_FLIGHT_ENABLED: "false" disables coalescing (default: enabled)
+
+    Returns:
+        Shared SingleFlight, or None if disabled
+    """
+    if os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+
+    with _single_flights_lock:
+        if name not in _single_flights:
+            _single_flights[name] = SingleFlight()
+        return _single_flights[name]